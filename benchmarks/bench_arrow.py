@@ -0,0 +1,51 @@
+"""
+Validação de uma coluna Arrow de CNPJs: ``to_pylist`` + ``check_many`` contra
+``validate_array`` (rotinas sobre os buffers da coluna).
+
+    python benchmarks/bench_arrow.py [total]
+"""
+
+import sys
+import time
+
+import pyarrow as pa
+from faker import Faker
+
+from pydantic_br_validator.arrow import validate_array
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+
+
+def make_column(total: int) -> "pa.Array":
+    fake = Faker("pt-BR")
+    fake.seed_instance(42)
+    cnpjs = [fake.cnpj() for _ in range(min(total, 5_000))]
+    return pa.array([cnpjs[index % len(cnpjs)] for index in range(total)])
+
+
+def with_pylist(column) -> int:
+    errors = CNPJValidator.check_many(column.to_pylist())
+    return errors.count(None)
+
+
+def with_buffers(column) -> int:
+    return validate_array(column, kind="cnpj").valid.true_count
+
+
+def measure(function, column) -> float:
+    start = time.perf_counter()
+    assert function(column) == len(column)
+    return len(column) / (time.perf_counter() - start)
+
+
+def main(total: int = 500_000) -> None:
+    column = make_column(total)
+    print(f"{total:,} CNPJs, {column.nbytes / 1e6:.1f} MB\n")
+    reference = measure(with_pylist, column)
+    buffers = measure(with_buffers, column)
+    print(f"to_pylist + check_many {reference:>12,.0f} valores/s")
+    print(f"validate_array         {buffers:>12,.0f} valores/s")
+    print(f"ganho                  {buffers / reference:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
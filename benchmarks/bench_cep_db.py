@@ -0,0 +1,56 @@
+"""
+Base de CEPs: geração do arquivo com um milhão de CEPs, tamanho em disco e
+consultas por segundo (``in`` e ``contains_many``), contra um ``set`` de ``str``
+em memória.
+
+    python benchmarks/bench_cep_db.py [total]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pydantic_br_validator.cep_db import CEPDatabase, build_cep_db
+
+
+def main(total: int = 1_000_000) -> None:
+    generator = random.Random(42)
+    ceps = [f"{cep:08d}" for cep in generator.sample(range(100_000_000), total)]
+    probes = [f"{generator.randrange(100_000_000):08d}" for _ in range(200_000)]
+    probes[::2] = ceps[: len(probes[::2])]
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        build_cep_db(ceps, path)
+        print(f"{total:,} CEPs em {time.perf_counter() - start:.2f} s")
+        print(f"arquivo: {os.path.getsize(path) / 1e6:.1f} MB\n")
+
+        tracemalloc.start()
+        reference = {cep[:5] + cep[5:] for cep in ceps}
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"set de str em memória: {memory / 1e6:.0f} MB\n")
+        start = time.perf_counter()
+        found = sum(probe in reference for probe in probes)
+        elapsed = time.perf_counter() - start
+        print(f"set de str            {len(probes) / elapsed:>12,.0f} consultas/s")
+
+        with CEPDatabase(path) as database:
+            start = time.perf_counter()
+            assert sum(probe in database for probe in probes) == found
+            elapsed = time.perf_counter() - start
+            print(f"CEPDatabase in        {len(probes) / elapsed:>12,.0f} consultas/s")
+            start = time.perf_counter()
+            assert sum(database.contains_many(probes)) == found
+            elapsed = time.perf_counter() - start
+            print(f"contains_many         {len(probes) / elapsed:>12,.0f} consultas/s")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
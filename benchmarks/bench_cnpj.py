@@ -0,0 +1,79 @@
+"""
+Throughput de validação de CNPJ numérico antes e depois do suporte a CNPJ
+alfanumérico.
+
+    python benchmarks/bench_cnpj.py [total]
+
+A referência "numeric-only" reproduz o cálculo usado antes do formato
+alfanumérico (re.sub + int por caractere). O script termina com código 1 se
+o caminho numérico atual for mais lento que essa referência.
+"""
+
+import random
+import re
+import sys
+import timeit
+
+from pydantic_br_validator.validators import cnpj_engine
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+
+
+def numeric_only_validate(cnpj: str) -> bool:
+    cnpj = re.sub("[^0-9]", "", cnpj)
+    if len(cnpj) != 14:
+        return False
+    total = sum(int(cnpj[n]) * cnpj_engine.FIRST_WEIGHTS[n] for n in range(12))
+    first_digit = 0 if total % 11 < 2 else 11 - total % 11
+    total = sum(int(cnpj[n]) * cnpj_engine.SECOND_WEIGHTS[n] for n in range(13))
+    second_digit = 0 if total % 11 < 2 else 11 - total % 11
+    return cnpj[12] == str(first_digit) and cnpj[13] == str(second_digit)
+
+
+def generate(total: int, alphabet: str, seed: int = 42):
+    rnd = random.Random(seed)
+    values = []
+    for _ in range(total):
+        base = "".join(rnd.choice(alphabet) for _ in range(8))
+        base += f"{rnd.randint(1, 9999):04d}"
+        values.append(base + cnpj_engine.check_digits(base))
+    return values
+
+
+def throughput(function, values, repeat: int = 5) -> float:
+    best = min(timeit.repeat(lambda: function(values), number=1, repeat=repeat))
+    return len(values) / best
+
+
+def main(total: int = 100_000) -> int:
+    numeric = generate(total, "0123456789")
+    alphanumeric = generate(total, "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    masked = [f"{v[:2]}.{v[2:5]}.{v[5:8]}/{v[8:12]}-{v[12:]}" for v in numeric]
+
+    def each(function):
+        return lambda values: [function(value) for value in values]
+
+    cases = [
+        ("numeric-only reference", numeric, each(numeric_only_validate)),
+        (
+            "CNPJValidator.validate",
+            numeric,
+            each(lambda v: CNPJValidator(v).validate()),
+        ),
+        ("CNPJValidator.check", numeric, each(CNPJValidator.check)),
+        ("CNPJValidator.check (mask)", masked, each(CNPJValidator.check)),
+        ("CNPJValidator.check_many", numeric, CNPJValidator.check_many),
+        ("CNPJValidator.check alnum", alphanumeric, each(CNPJValidator.check)),
+        ("CNPJValidator.check_many alnum", alphanumeric, CNPJValidator.check_many),
+    ]
+    results = {}
+    for name, values, function in cases:
+        results[name] = throughput(function, values)
+        print(f"{name:<34} {results[name]:>14,.0f} CNPJ/s")
+
+    ratio = results["CNPJValidator.check"] / results["numeric-only reference"]
+    print(f"\nnumeric check vs numeric-only reference: {ratio:.2f}x")
+    return 0 if ratio >= 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:])))
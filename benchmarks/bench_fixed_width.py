@@ -0,0 +1,91 @@
+"""
+Arquivo de registros de tamanho fixo com CPF, CNPJ e CEP: leitura linha a
+linha com ``decode`` + ``Validator.check`` contra ``read_fixed_width``, em
+sequência e com faixas em paralelo (``ProcessPoolExecutor``).
+
+    python benchmarks/bench_fixed_width.py [total] [workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from faker import Faker
+
+from pydantic_br_validator.fixed_width import RecordField, read_fixed_width
+from pydantic_br_validator.validators.cep_validator import CEPValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+
+LAYOUT = [
+    RecordField("cpf", 10, 14, "cpf", "mask"),
+    RecordField("cnpj", 40, 14, "cnpj", "digits"),
+    RecordField("cep", 90, 8, "cep", "digits"),
+]
+RECORD_LENGTH = 121
+
+
+def write_records(path: str, total: int) -> None:
+    fake = Faker("pt-BR")
+    fake.seed_instance(42)
+    records = []
+    for _ in range(min(total, 5_000)):
+        cnpj = "".join(char for char in fake.cnpj() if char.isdigit())
+        cep = fake.postcode().replace("-", "")
+        record = f"3{fake.name()[:9]:<9}{fake.cpf()}{'':16}{cnpj}{'':36}{cep}"
+        records.append(f"{record:<120}\n".encode("latin-1"))
+    with open(path, "wb") as file:
+        for index in range(total):
+            file.write(records[index % len(records)])
+
+
+def with_lines(path: str) -> int:
+    checks = [
+        (CPFValidator.check, 10, 24, "mask"),
+        (CNPJValidator.check, 40, 54, "digits"),
+        (CEPValidator.check, 90, 98, "digits"),
+    ]
+    failures = 0
+    with open(path, encoding="latin-1") as file:
+        for line in file:
+            if any(
+                check(line[start:end].strip(), mode)
+                for check, start, end, mode in checks
+            ):
+                failures += 1
+    return failures
+
+
+def with_reader(path: str, executor=None) -> int:
+    return sum(1 for _ in read_fixed_width(path, LAYOUT, executor=executor))
+
+
+def measure(function, *args) -> float:
+    start = time.perf_counter()
+    assert function(*args) == 0
+    return time.perf_counter() - start
+
+
+def main(total: int = 500_000, workers: int = 4) -> None:
+    fd, path = tempfile.mkstemp(suffix=".rem")
+    os.close(fd)
+    try:
+        write_records(path, total)
+        print(f"{total:,} registros, {os.path.getsize(path) / 1e6:.1f} MB\n")
+        reference = measure(with_lines, path)
+        reader = measure(with_reader, path)
+        with ProcessPoolExecutor(workers) as executor:
+            parallel = measure(with_reader, path, executor)
+        print(f"linhas + decode + check     {total / reference:>12,.0f} registros/s")
+        print(f"read_fixed_width            {total / reader:>12,.0f} registros/s")
+        print(
+            f"read_fixed_width ({workers} proc.) {total / parallel:>12,.0f} registros/s"
+        )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
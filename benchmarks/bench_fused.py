@@ -0,0 +1,74 @@
+"""
+Construção de um modelo com oito documentos: validação por campo contra
+``FusedValidation`` (uma chamada a Python por modelo).
+
+    python benchmarks/bench_fused.py [total]
+"""
+
+import sys
+import time
+
+from faker import Faker
+from pydantic import BaseModel
+
+from pydantic_br_validator import CEP, CNPJ, CPF, CEPMask, CNPJMask, CPFMask
+from pydantic_br_validator.fused import FusedValidation
+
+
+class Cliente(BaseModel):
+    nome: str
+    cpf: CPF
+    cpf_conjuge: CPFMask
+    cpf_procurador: CPF
+    empresa: CNPJ
+    matriz: CNPJMask
+    cep: CEP
+    cep_cobranca: CEPMask
+    cep_entrega: CEP
+
+
+class ClienteFused(FusedValidation, Cliente):
+    pass
+
+
+def make_records(total: int) -> list:
+    fake = Faker("pt-BR")
+    fake.seed_instance(42)
+    ceps = [fake.postcode().replace("-", "") for _ in range(min(total, 5_000))]
+    records = [
+        {
+            "nome": fake.name(),
+            "cpf": fake.cpf(),
+            "cpf_conjuge": fake.cpf(),
+            "cpf_procurador": fake.cpf(),
+            "empresa": fake.cnpj(),
+            "matriz": fake.cnpj(),
+            "cep": cep,
+            "cep_cobranca": f"{cep[:5]}-{cep[5:]}",
+            "cep_entrega": cep,
+        }
+        for cep in ceps
+    ]
+    return [records[index % len(records)] for index in range(total)]
+
+
+def measure(model, records: list) -> float:
+    validate = model.model_validate
+    start = time.perf_counter()
+    for record in records:
+        validate(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(total: int = 100_000) -> None:
+    records = make_records(total)
+    print(f"{total:,} modelos com 8 documentos\n")
+    reference = measure(Cliente, records)
+    fused = measure(ClienteFused, records)
+    print(f"validação por campo {reference:>12,.0f} modelos/s")
+    print(f"FusedValidation     {fused:>12,.0f} modelos/s")
+    print(f"ganho               {fused / reference:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
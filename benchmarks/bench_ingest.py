@@ -0,0 +1,82 @@
+"""
+Ingestão de NDJSON: ``json.loads`` + ``model_validate`` contra
+``ingest_ndjson`` (parser JSON do pydantic-core direto sobre o arquivo).
+
+    python benchmarks/bench_ingest.py [total]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from faker import Faker
+from pydantic import BaseModel
+
+from pydantic_br_validator import CEP, CNPJ, CPF
+from pydantic_br_validator.ingest import ingest_ndjson
+
+
+class Cliente(BaseModel):
+    nome: str
+    cpf: CPF
+    empresa: CNPJ
+    cep: CEP
+    limite: float
+
+
+def write_records(path: str, total: int) -> None:
+    fake = Faker("pt-BR")
+    fake.seed_instance(42)
+    records = [
+        {
+            "nome": fake.name(),
+            "cpf": fake.cpf(),
+            "empresa": fake.cnpj(),
+            "cep": fake.postcode(),
+            "limite": fake.pyfloat(right_digits=2, positive=True),
+        }
+        for _ in range(min(total, 5_000))
+    ]
+    with open(path, "w") as file:
+        for index in range(total):
+            file.write(json.dumps(records[index % len(records)]) + "\n")
+
+
+def with_json_loads(path: str) -> int:
+    count = 0
+    with open(path, "rb") as file:
+        for line in file:
+            Cliente.model_validate(json.loads(line))
+            count += 1
+    return count
+
+
+def with_ingest(path: str) -> int:
+    return sum(1 for result in ingest_ndjson(path, Cliente) if result.ok)
+
+
+def measure(function, path: str, total: int) -> float:
+    start = time.perf_counter()
+    assert function(path) == total
+    return total / (time.perf_counter() - start)
+
+
+def main(total: int = 200_000) -> None:
+    fd, path = tempfile.mkstemp(suffix=".ndjson")
+    os.close(fd)
+    try:
+        write_records(path, total)
+        print(f"{total:,} registros, {os.path.getsize(path) / 1e6:.1f} MB\n")
+        reference = measure(with_json_loads, path, total)
+        ingest = measure(with_ingest, path, total)
+        print(f"json.loads + model_validate {reference:>12,.0f} linhas/s")
+        print(f"ingest_ndjson               {ingest:>12,.0f} linhas/s")
+        print(f"ganho                       {ingest / reference:>12.2f}x")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,68 @@
+"""
+Escalabilidade da validação em lote com o número de threads.
+
+    python benchmarks/bench_threads.py [total] [kind]
+
+Com o GIL ativo o ganho esperado é nulo (ou pequeno, pela sobreposição com
+partes em C); em um CPython sem GIL (3.13t ou posterior) a vazão deve crescer
+com o número de threads até o limite de núcleos disponíveis.
+"""
+
+import os
+import random
+import sys
+import time
+
+from pydantic_br_validator.batch import validate_batch_parallel
+from pydantic_br_validator.validators import cnpj_engine
+
+
+def generate_cpfs(total: int, seed: int = 42):
+    rnd = random.Random(seed)
+    values = []
+    for _ in range(total):
+        digits = [rnd.randint(0, 9) for _ in range(9)]
+        for size in (9, 10):
+            total_sum = sum(d * w for d, w in zip(digits, range(size + 1, 1, -1)))
+            digits.append(total_sum * 10 % 11 % 10)
+        values.append("".join(map(str, digits)))
+    return values
+
+
+def generate_cnpjs(total: int, seed: int = 42):
+    rnd = random.Random(seed)
+    values = []
+    for _ in range(total):
+        base = "".join(str(rnd.randint(0, 9)) for _ in range(12))
+        values.append(base + cnpj_engine.check_digits(base))
+    return values
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def main(total: int = 400_000, kind: str = "cpf") -> None:
+    values = generate_cpfs(total) if kind == "cpf" else generate_cnpjs(total)
+    cpus = os.cpu_count() or 1
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil_enabled() else 'off'}")
+    print(f"{cpus} CPUs, {total:,} {kind.upper()}s\n")
+
+    baseline = None
+    workers = 1
+    while workers <= max(cpus, 1) * 2:
+        start = time.perf_counter()
+        validate_batch_parallel(values, kind, workers=workers, chunk_size=10_000)
+        throughput = total / (time.perf_counter() - start)
+        baseline = baseline or throughput
+        print(
+            f"{workers:>3} threads {throughput:>14,.0f} docs/s"
+            f"  {throughput / baseline:.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 400_000, *args[1:])
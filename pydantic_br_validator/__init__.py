@@ -18,9 +18,32 @@ if TYPE_CHECKING:
     CEP = str
     CEPMask = str
     CEPDigits = str
+    CPFOrCNPJ = str
+    CPFOrCNPJMask = str
+    CPFOrCNPJDigits = str
+    LazyCPF = str
+    LazyCPFMask = str
+    LazyCPFDigits = str
+    LazyCNPJ = str
+    LazyCNPJMask = str
+    LazyCNPJDigits = str
+    LazyCNH = str
+    LazyCPFOrCNPJ = str
+    LazyCPFOrCNPJMask = str
+    LazyCPFOrCNPJDigits = str
+    PIS = str
+    PISMask = str
+    PISDigits = str
+    RENAVAM = str
 else:
     from .fields.cnpj_field import *  # noqa
     from .fields.cnh_field import *  # noqa
     from .fields.cpf_field import *  # noqa
     from .fields.cep_field import *  # noqa
     from .fields.rg_field import *  # noqa
+    from .fields.cpf_or_cnpj_field import *  # noqa
+    from .fields.lazy_field import *  # noqa
+    from .fields.spec_field import *  # noqa
+
+from .validators.cpf_or_cnpj_validator import DetectedDocument, detect_document  # noqa
+from .fused import FusedValidation  # noqa
@@ -0,0 +1,55 @@
+import argparse
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_br_validator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the HTTP validation service")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=256,
+        help="maximum number of coalesced single requests per validation call",
+    )
+    serve_parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=0.001,
+        help="seconds to wait for more single requests before validating",
+    )
+
+    build_parser = commands.add_parser(
+        "build-cep-db", help="convert a list of CEPs into a CEP database file"
+    )
+    build_parser.add_argument("source", help="text or delimited file with the CEPs")
+    build_parser.add_argument("destination", help="database file to write")
+    build_parser.add_argument(
+        "--column",
+        type=int,
+        default=None,
+        help="zero-based column of the CEP in a delimited file",
+    )
+    build_parser.add_argument("--delimiter", default=",")
+    build_parser.add_argument("--encoding", default="latin-1")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        from .server import serve
+
+        serve(args.host, args.port, args.max_batch, args.max_delay)
+    elif args.command == "build-cep-db":
+        from .cep_db import build_cep_db
+
+        with open(args.source, encoding=args.encoding) as source:
+            written, skipped = build_cep_db(
+                source, args.destination, args.column, args.delimiter
+            )
+        print(f"{written} CEPs written to {args.destination} ({skipped} lines skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+HTTP/1.1 mínimo sobre ``asyncio`` (somente biblioteca padrão), usado pelo
+servidor de validação, pelos clientes de enriquecimento e pelos servidores
+locais de teste.
+"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+MAX_HEADERS = 100
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str = "") -> None:
+        super().__init__(message or REASONS.get(status, ""))
+        self.status = status
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes
+    keep_alive: bool
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            raise HTTPError(400, "invalid JSON body") from None
+
+
+async def _read_line(reader: asyncio.StreamReader) -> bytes:
+    try:
+        return await reader.readline()
+    except ValueError:
+        # Linha maior que o limite do ``StreamReader``.
+        raise HTTPError(400, "line too long") from None
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Lê uma requisição da conexão; retorna None se o cliente a fechou."""
+    request_line = await _read_line(reader)
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await _read_line(reader)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(400, "too many headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length") from None
+    if length < 0:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(413)
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        keep_alive = connection == "keep-alive"
+    else:
+        keep_alive = connection != "close"
+    url = urlsplit(target)
+    return Request(
+        method.upper(),
+        url.path,
+        dict(parse_qsl(url.query)),
+        headers,
+        body,
+        keep_alive,
+    )
+
+
+def encode_response(
+    status: int,
+    payload: Any,
+    keep_alive: bool = True,
+    headers: Optional[Dict[str, str]] = None,
+) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    lines = [
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def encode_request(
+    method: str,
+    path: str,
+    host: str,
+    payload: Any = None,
+) -> bytes:
+    # O caminho vai sem escape na linha da requisição.
+    if not path.isascii() or not path.isprintable() or " " in path:
+        raise ValueError(f"invalid request path {path!r}")
+    body = b"" if payload is None else json.dumps(payload).encode()
+    lines = [
+        f"{method} {path} HTTP/1.1",
+        f"Host: {host}",
+        "Connection: keep-alive",
+        f"Content-Length: {len(body)}",
+    ]
+    if payload is not None:
+        lines.append("Content-Type: application/json")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, Any, bool]:
+    """Lê uma resposta JSON; retorna status, conteúdo e se a conexão segue aberta."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by server")
+    status = int(status_line.split()[1])
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", "0")))
+    keep_alive = headers.get("connection", "").lower() != "close"
+    return status, json.loads(body) if body else None, keep_alive
+
+
+class ConnectionPool:
+    """
+    Pool de conexões HTTP/1.1 persistentes (keep-alive) para um único host.
+
+    No máximo ``max_connections`` requisições ficam em andamento ao mesmo
+    tempo; conexões livres são reaproveitadas pelas próximas requisições.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 10,
+        timeout: float = 10.0,
+    ) -> None:
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {base_url!r}")
+        self.host = url.hostname or "localhost"
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = url.scheme == "https"
+        self.prefix = url.path.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def request(
+        self, method: str, path: str, payload: Any = None
+    ) -> Tuple[int, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        data = encode_request(method, self.prefix + path, self.host, payload)
+        async with self._semaphore:
+            for attempt in range(2):
+                reused = attempt == 0 and bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._connect()
+                try:
+                    status, body, keep_alive = await self._send(reader, writer, data)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if not reused:
+                        raise
+                    # A conexão ociosa pode ter sido encerrada pelo servidor.
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+        return status, body
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl or None),
+            self.timeout,
+        )
+        self.connections_opened += 1
+        return connection
+
+    async def _send(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        data: bytes,
+    ) -> Tuple[int, Any, bool]:
+        writer.write(data)
+        await writer.drain()
+        return await asyncio.wait_for(read_response(reader), self.timeout)
+
+
+class HTTPStubServer(ABC):
+    """
+    Servidor HTTP local mínimo para testes offline. As subclasses implementam
+    ``handle(request)`` e retornam ``(status, conteúdo JSON)``.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self.requests: List[Request] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.base_url
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "HTTPStubServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @abstractmethod
+    async def handle(self, request: Request) -> Tuple[int, Any]:
+        """Responde à requisição com ``(status, conteúdo JSON)``."""
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                self.requests.append(request)
+                try:
+                    status, payload = await self.handle(request)
+                except HTTPError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                writer.write(encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, HTTPError):
+            pass
+        finally:
+            writer.close()
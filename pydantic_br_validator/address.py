@@ -0,0 +1,163 @@
+"""
+Resolução assíncrona de CEP em endereço.
+
+A origem dos dados é plugável: qualquer objeto com ``async fetch(cep)`` que
+retorne um ``dict`` (ou None, quando o CEP não existe) serve. ``HTTPUpstream``
+consulta um serviço HTTP no formato ``GET <base_url>/cep/<cep>`` através de um
+pool de conexões keep-alive; para testes sem rede há
+``pydantic_br_validator.stubs.CEPStubServer``.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from ._http import ConnectionPool
+from ._lru import LRUCache
+from .fields.base_field_v2 import raise_field_error
+from .validators.base_validator import INVALID_DATA
+from .validators.cep_validator import CEPValidator
+
+__all__ = ["Address", "AddressError", "CEPResolver", "HTTPUpstream"]
+
+_MISSING = object()
+
+# Chaves aceitas para cada campo, incluindo o formato do ViaCEP.
+FIELD_KEYS = {
+    "street": ("street", "logradouro"),
+    "district": ("district", "bairro"),
+    "city": ("city", "localidade"),
+    "state": ("state", "uf"),
+}
+
+
+class AddressError(Exception):
+    """Falha ao consultar a origem dos endereços."""
+
+
+class Address(NamedTuple):
+    cep: str
+    street: Optional[str]
+    district: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, cep: str, data: Dict[str, Any]) -> "Address":
+        fields = {
+            name: next((data[key] for key in keys if data.get(key)), None)
+            for name, keys in FIELD_KEYS.items()
+        }
+        return cls(cep, data=data, **fields)
+
+
+def _cep_key(cep) -> str:
+    """O CEP enviado à origem: 8 dígitos ASCII, sem o hífen."""
+    error = CEPValidator.check(cep)
+    if error is not None:
+        raise_field_error(error)
+    key = cep.replace("-", "")
+    if not key.isascii() or not key.isdigit():
+        raise_field_error(INVALID_DATA)
+    return key
+
+
+class HTTPUpstream:
+    """Origem HTTP: ``GET <base_url><path>`` com ``{cep}`` substituído (8 dígitos)."""
+
+    def __init__(
+        self,
+        base_url: str,
+        path: str = "/cep/{cep}",
+        max_connections: int = 10,
+        timeout: float = 10.0,
+    ) -> None:
+        self.path = path
+        self.pool = ConnectionPool(base_url, max_connections, timeout)
+
+    async def fetch(self, cep: str) -> Optional[Dict[str, Any]]:
+        path = self.path.format(cep=_cep_key(cep))
+        status, body = await self.pool.request("GET", path)
+        if status == 404:
+            return None
+        if status != 200 or not isinstance(body, dict):
+            raise AddressError(f"upstream responded with HTTP {status}")
+        # O ViaCEP responde 200 com {"erro": true} para CEPs inexistentes.
+        if body.get("erro"):
+            return None
+        return body
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+class CEPResolver:
+    """
+    Resolve CEPs em ``Address`` com cache LRU + TTL.
+
+    No máximo ``max_concurrency`` consultas ficam em andamento na origem;
+    consultas simultâneas do mesmo CEP compartilham uma única chamada. CEPs
+    inexistentes também ficam em cache (resultado None).
+    """
+
+    def __init__(
+        self,
+        upstream: Union[str, Any],
+        max_concurrency: int = 10,
+        cache_size: int = 100_000,
+        ttl: Optional[float] = 86_400.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(upstream, str):
+            upstream = HTTPUpstream(upstream, max_connections=max_concurrency)
+        self.upstream = upstream
+        self.max_concurrency = max_concurrency
+        self.cache = LRUCache(cache_size, ttl, clock)
+        self.fetches = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "CEPResolver":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        close = getattr(self.upstream, "close", None)
+        if close is not None:
+            await close()
+
+    async def resolve(self, cep: str) -> Optional[Address]:
+        """Retorna o endereço do CEP (com ou sem máscara) ou None se não existir."""
+        key = _cep_key(cep)
+
+        cached = self.cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def resolve_many(self, ceps: Iterable[str]) -> List[Optional[Address]]:
+        """Resolve vários CEPs; os resultados seguem a ordem de entrada."""
+        return list(await asyncio.gather(*(self.resolve(cep) for cep in ceps)))
+
+    async def _fetch(self, key: str) -> Optional[Address]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.fetches += 1
+            try:
+                data = await self.upstream.fetch(key)
+            except AddressError:
+                raise
+            except Exception as exc:
+                raise AddressError(f"upstream lookup failed: {exc!r}") from exc
+        address = None if data is None else Address.from_dict(key, data)
+        self.cache.set(key, address)
+        return address
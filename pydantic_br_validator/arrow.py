@@ -0,0 +1,309 @@
+"""
+Validação de colunas do Apache Arrow e de arquivos Parquet.
+
+    from pydantic_br_validator.arrow import validate_array, validate_parquet
+
+    resultado = validate_array(tabela["cnpj"], kind="cnpj", normalize=True)
+    resultado.valid  # BooleanArray
+    resultado.errors  # DictionaryArray com o código do erro (nulo se válido)
+    resultado.normalized  # documento sem máscara, em maiúsculas (nulo se inválido)
+
+    for grupo, resultado in validate_parquet("empresas.parquet", "cnpj", kind="cnpj"):
+        ...
+
+Nenhum ``str`` é criado para os valores. Para CPF, CNPJ e CEP, as linhas no
+formato exato do documento, sem máscara ou com a máscara completa (a quase
+totalidade em dados limpos), são lidas do buffer de dados como registros de
+tamanho fixo: cada posição vira uma coluna ``uint8`` (um fatiamento com passo
+sobre ``bytes``) e os dígitos verificadores são calculados coluna a coluna com
+``pyarrow.compute``. As demais linhas são conferidas uma a uma sobre os bytes
+de cada fatia, pelos offsets da coluna; valores fora do ASCII e os outros
+tipos de documento passam por ``Validator.check``. Valores nulos continuam
+nulos nas três colunas.
+
+Requer o pyarrow (``pip install pyarrow``).
+"""
+
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "pydantic_br_validator.arrow requires pyarrow (pip install pyarrow)"
+    ) from error
+
+from .batch import get_validator
+from .profiler import CODE_INDEX, CODES
+from .validators import cnpj_engine
+from .validators.base_validator import INVALID_DATA, INVALID_MASK, NOT_DIGITS
+from .validators.byte_kernels import (
+    CPF_FIRST_WEIGHTS,
+    CPF_SECOND_WEIGHTS,
+    KERNELS,
+    Kernel,
+)
+
+__all__ = ["ERROR_CODES", "ArrowValidation", "validate_array", "validate_parquet"]
+
+# Dicionário da coluna de erros; o índice é o de ``profiler.CODES`` menos 1.
+ERROR_CODES = pa.array(CODES[1:], pa.string())
+ERROR_TYPE = pa.dictionary(pa.int8(), pa.string())
+
+# Código provisório das linhas que ainda serão conferidas uma a uma.
+PENDING = 0xFF
+
+DIGIT_VALUES = bytes(byte - 48 if 48 <= byte <= 57 else 0xFF for byte in range(256))
+
+
+class ArrowValidation(NamedTuple):
+    valid: "pa.Array"
+    errors: "pa.Array"
+    normalized: Optional["pa.Array"] = None
+
+
+class Layout(NamedTuple):
+    """
+    Formato de tamanho fixo de um documento: a máscara (``#`` marca um
+    caractere do documento), a tabela de valores dos caracteres, o maior valor
+    aceito em cada posição do documento e a conferência vetorizada dos
+    dígitos verificadores.
+    """
+
+    mask: str
+    values: bytes
+    limits: Tuple[int, ...]
+    verify: Callable[[List["pa.Array"]], "pa.Array"]
+
+
+def _weighted_sum(columns: List["pa.Array"], weights: Tuple[int, ...]) -> "pa.Array":
+    total = None
+    for column, weight in zip(columns, weights):
+        term = pc.multiply(column, weight)
+        total = term if total is None else pc.add(total, term)
+    return total
+
+
+def _verify_cpf(columns: List["pa.Array"]) -> "pa.Array":
+    # A segunda soma usa o primeiro dígito digitado: se ele estiver errado, o
+    # CPF já é inválido pela primeira comparação.
+    first_sum = _weighted_sum(columns, CPF_FIRST_WEIGHTS)
+    second_sum = _weighted_sum(columns, CPF_SECOND_WEIGHTS)
+    first_digit = pc.modulo(pc.modulo(pc.multiply(first_sum, 10), 11), 10)
+    second_digit = pc.modulo(pc.modulo(pc.multiply(second_sum, 10), 11), 10)
+    repeated = pc.equal(pc.min_element_wise(*columns), pc.max_element_wise(*columns))
+    return pc.and_(
+        pc.and_(pc.equal(columns[9], first_digit), pc.equal(columns[10], second_digit)),
+        pc.invert(repeated),
+    )
+
+
+def _cnpj_digit(total: "pa.Array") -> "pa.Array":
+    remainder = pc.modulo(total, 11)
+    return pc.if_else(pc.less(remainder, 2), 0, pc.subtract(11, remainder))
+
+
+def _verify_cnpj(columns: List["pa.Array"]) -> "pa.Array":
+    first_digit = _cnpj_digit(_weighted_sum(columns, cnpj_engine.FIRST_WEIGHTS))
+    second_digit = _cnpj_digit(_weighted_sum(columns, cnpj_engine.SECOND_WEIGHTS))
+    return pc.and_(
+        pc.equal(columns[12], first_digit), pc.equal(columns[13], second_digit)
+    )
+
+
+def _verify_cep(columns: List["pa.Array"]) -> "pa.Array":
+    return pa.repeat(True, len(columns[0]))
+
+
+LAYOUTS: Dict[str, Layout] = {
+    "cpf": Layout("###.###.###-##", DIGIT_VALUES, (9,) * 11, _verify_cpf),
+    "cnpj": Layout(
+        "##.###.###/####-##", cnpj_engine.CHAR_VALUES, (42,) * 12 + (9, 9), _verify_cnpj
+    ),
+    "cep": Layout("#####-###", DIGIT_VALUES, (9,) * 8, _verify_cep),
+}
+
+
+def validate_array(
+    values, kind: str = "cpf", mode: str = "any", normalize: bool = False
+) -> ArrowValidation:
+    """
+    Valida uma coluna de texto do Arrow (``StringArray``, ``LargeStringArray``,
+    ``DictionaryArray`` de texto ou ``ChunkedArray`` de um deles).
+    """
+    validator = get_validator(kind, mode)
+    if isinstance(values, pa.ChunkedArray):
+        results = [
+            validate_array(chunk, kind, mode, normalize) for chunk in values.chunks
+        ]
+        return ArrowValidation(
+            pa.chunked_array([result.valid for result in results], pa.bool_()),
+            pa.chunked_array([result.errors for result in results], ERROR_TYPE),
+            pa.chunked_array(
+                [result.normalized for result in results], _string_type(values.type)
+            )
+            if normalize
+            else None,
+        )
+    if pa.types.is_dictionary(values.type):
+        # Cada valor distinto é validado uma única vez.
+        result = validate_array(values.dictionary, kind, mode, normalize)
+        return ArrowValidation(
+            *(
+                None if column is None else column.take(values.indices)
+                for column in result
+            )
+        )
+    if pa.types.is_string(values.type):
+        offset_format = "i"
+    elif pa.types.is_large_string(values.type):
+        offset_format = "q"
+    else:
+        raise TypeError(f"expected a string array, got {values.type}")
+
+    length = len(values)
+    codes = pc.if_else(
+        values.is_valid(), pa.scalar(PENDING, pa.uint8()), pa.scalar(0, pa.uint8())
+    )
+    layout = LAYOUTS.get(kind)
+    if layout is not None and length:
+        ascii_rows = pc.string_is_ascii(values).fill_null(False)
+        lengths = pc.binary_length(values)
+        for masked in (False, True):
+            width = len(layout.mask) if masked else len(layout.limits)
+            rows = pc.and_(ascii_rows, pc.equal(lengths, width).fill_null(False))
+            if pc.any(rows).as_py():
+                found = _layout_codes(
+                    values.filter(rows), offset_format, layout, masked, mode
+                )
+                codes = pc.replace_with_mask(codes, rows, found)
+
+    pending = pc.indices_nonzero(pc.equal(codes, PENDING)).to_pylist()
+    codes = bytearray(memoryview(codes.buffers()[1])[codes.offset : length])
+    if pending:
+        check = KERNELS.get(kind)
+        _scan(values, offset_format, pending, codes, mode, validator.check, check)
+
+    code_array = pa.Array.from_buffers(pa.uint8(), length, [None, pa.py_buffer(codes)])
+    if values.null_count:
+        code_array = pc.if_else(
+            values.is_valid(), code_array, pa.scalar(None, pa.uint8())
+        )
+    valid = pc.equal(code_array, 0)
+    # Nas linhas válidas o código 0 daria -1, mas elas ficam nulas.
+    indices = pc.if_else(
+        valid,
+        pa.scalar(None, pa.uint8()),
+        pc.subtract(code_array, pa.scalar(1, pa.uint8())),
+    )
+    errors = pa.DictionaryArray.from_arrays(indices.cast(pa.int8()), ERROR_CODES)
+    normalized = _normalize(values, kind, valid) if normalize else None
+    return ArrowValidation(valid, errors, normalized)
+
+
+def _layout_codes(
+    rows, offset_format: str, layout: Layout, masked: bool, mode: str
+) -> "pa.Array":
+    """
+    Códigos das linhas (ASCII) do tamanho do documento (``masked=False``) ou
+    da máscara. O trecho do buffer de dados dessas linhas é lido como
+    registros de tamanho fixo; linhas fora do formato exato ficam ``PENDING``.
+    """
+    mask = layout.mask if masked else "#" * len(layout.limits)
+    width, count = len(mask), len(rows)
+    _, offsets_buffer, data_buffer = rows.buffers()
+    start = memoryview(offsets_buffer).cast(offset_format)[rows.offset]
+    raw = memoryview(data_buffer)[start : start + width * count].tobytes()
+    document = raw.translate(layout.values)
+
+    columns: List[pa.Array] = []
+    shaped = None
+    for position, char in enumerate(mask):
+        source = document if char == "#" else raw
+        column = pa.Array.from_buffers(
+            pa.uint8(), count, [None, pa.py_buffer(source[position::width])]
+        )
+        if char == "#":
+            matches = pc.less_equal(column, layout.limits[len(columns)])
+            columns.append(column.cast(pa.int32()))
+        else:
+            matches = pc.equal(column, ord(char))
+        shaped = matches if shaped is None else pc.and_(shaped, matches)
+
+    verified = pc.if_else(layout.verify(columns), 0, CODE_INDEX[INVALID_DATA])
+    if masked and mode in ("digits", "alphanumeric"):
+        found = pa.scalar(CODE_INDEX[NOT_DIGITS])
+    elif not masked and mode == "mask":
+        found = pa.scalar(CODE_INDEX[INVALID_MASK])
+    elif not masked and mode == "digits" and max(layout.limits) > 9:
+        # CNPJ alfanumérico sem máscara: com letras, não é só dígitos.
+        digits_only = pc.less_equal(pc.max_element_wise(*columns), 9)
+        found = pc.if_else(digits_only, verified, CODE_INDEX[NOT_DIGITS])
+    else:
+        found = verified
+    return pc.if_else(shaped, found, PENDING).cast(pa.uint8())
+
+
+def _scan(
+    values,
+    offset_format: str,
+    indexes: List[int],
+    codes: bytearray,
+    mode: str,
+    fallback: Callable[[str, str], Optional[str]],
+    check: Optional[Kernel],
+) -> None:
+    """
+    Confere uma a uma as linhas em ``indexes``, fatiando o buffer de dados
+    pelos offsets, e grava em ``codes`` o índice em ``CODES`` de cada uma.
+    """
+    first = values.offset
+    _, offsets_buffer, data_buffer = values.buffers()
+    offsets = memoryview(offsets_buffer).cast(offset_format)
+    data = memoryview(b"" if data_buffer is None else data_buffer)
+    for index in indexes:
+        raw = data[offsets[first + index] : offsets[first + index + 1]].tobytes()
+        if check is not None and raw.isascii():
+            error = check(raw, mode)
+        else:
+            error = fallback(raw.decode("utf-8"), mode)
+        codes[index] = CODE_INDEX[error]
+
+
+def _normalize(values, kind: str, valid: "pa.Array") -> "pa.Array":
+    """Documento sem formatação (e em maiúsculas) nas linhas válidas."""
+    if kind in ("cpf", "cnh"):
+        normalized = pc.replace_substring_regex(values, "[^0-9]", "")
+    elif kind == "cep":
+        normalized = pc.replace_substring(values, "-", "")
+    else:
+        normalized = values
+        for separator in ".-/":
+            normalized = pc.replace_substring(normalized, separator, "")
+        normalized = pc.ascii_upper(normalized)
+    return pc.if_else(valid, normalized, pa.scalar(None, values.type))
+
+
+def _string_type(type_):
+    return type_.value_type if pa.types.is_dictionary(type_) else type_
+
+
+def validate_parquet(
+    source,
+    column: str,
+    kind: str = "cpf",
+    mode: str = "any",
+    normalize: bool = False,
+) -> Iterator[Tuple[int, ArrowValidation]]:
+    """
+    Valida uma coluna de um arquivo Parquet grupo de linhas a grupo de
+    linhas, gerando ``(índice do grupo, resultado)``. Só um grupo fica em
+    memória por vez.
+    """
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(source)
+    for index in range(parquet.num_row_groups):
+        values = parquet.read_row_group(index, columns=[column]).column(0)
+        yield index, validate_array(values, kind, mode, normalize)
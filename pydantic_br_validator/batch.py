@@ -0,0 +1,205 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from .validators.base_validator import NOT_STR, FieldValidator
+from .validators.cep_validator import CEPValidator
+from .validators.cnh_validator import CNHValidator
+from .validators.cnpj_validator import CNPJValidator
+from .validators.cpf_or_cnpj_validator import CPFOrCNPJValidator
+from .validators.cpf_validator import CPFValidator
+from .validators.rg_validator import RGValidator
+
+__all__ = [
+    "VALIDATORS",
+    "classify_rgs",
+    "get_validator",
+    "validate_batch",
+    "validate_batch_parallel",
+    "validate_stream",
+]
+
+VALIDATORS: Dict[str, Type[FieldValidator]] = {
+    "cpf": CPFValidator,
+    "cnpj": CNPJValidator,
+    "cpf_or_cnpj": CPFOrCNPJValidator,
+    "cnh": CNHValidator,
+    "rg": RGValidator,
+    "cep": CEPValidator,
+}
+
+
+def get_validator(kind: str, mode: Optional[str] = None) -> Type[FieldValidator]:
+    """
+    Retorna o validador do tipo de documento. Com ``mode``, confere também se
+    o modo existe para esse documento.
+    """
+    try:
+        validator = VALIDATORS[kind]
+    except KeyError:
+        raise ValueError(
+            f"unknown document kind {kind!r}, expected one of {sorted(VALIDATORS)}"
+        ) from None
+    if mode is not None:
+        validator.check_mode(mode)
+    return validator
+
+
+def validate_batch(
+    values: Iterable,
+    kind: str = "cpf",
+    mode: str = "any",
+    store=None,
+    profiler=None,
+) -> List[Optional[str]]:
+    """
+    Valida um lote de documentos e retorna o código do erro de cada valor
+    (None para os válidos).
+
+    Com um ``store`` (ver ``pydantic_br_validator.cache.ValidationStore``),
+    apenas os valores ainda não validados em execuções anteriores são
+    calculados, e os novos resultados são gravados no mesmo store. Com um
+    ``profiler`` (ver ``pydantic_br_validator.profiler.ValidationProfiler``),
+    os resultados do lote também são registrados no perfil.
+    """
+    if profiler is not None:
+        values = values if isinstance(values, list) else list(values)
+        results = validate_batch(values, kind, mode, store)
+        profiler.observe(values, results)
+        return results
+    validator = get_validator(kind, mode)
+    if store is None:
+        return validator.check_many(values, mode)
+
+    values = list(values)
+    results: List[Optional[str]] = [NOT_STR] * len(values)
+    strings = [index for index, value in enumerate(values) if isinstance(value, str)]
+    cached = store.get_many(kind, mode, [values[index] for index in strings])
+
+    missing: Dict[str, List[int]] = {}
+    for index in strings:
+        value = values[index]
+        if value in cached:
+            results[index] = cached[value]
+        else:
+            missing.setdefault(value, []).append(index)
+
+    if missing:
+        computed = dict(zip(missing, validator.check_many(missing, mode)))
+        store.put_many(kind, mode, computed)
+        for value, indexes in missing.items():
+            for index in indexes:
+                results[index] = computed[value]
+    return results
+
+
+def classify_rgs(
+    values: Iterable,
+    ufs: Union[str, Iterable[Optional[str]]],
+    mode: str = "any",
+) -> List[Optional[str]]:
+    """
+    Valida um lote de RGs de estados diferentes e retorna o código do erro
+    de cada valor (None para os válidos).
+
+    ``ufs`` é o estado emissor de todos os valores ou um iterável com o
+    estado de cada um, na mesma ordem. Cada valor é conferido pela regra do
+    seu estado em ``RG_RULES``; estados sem regra e UF None têm apenas
+    máscara, caracteres e tamanho conferidos.
+    """
+    RGValidator.check_mode(mode)
+    if isinstance(ufs, str):
+        return RGValidator.for_state(ufs).check_many(values, mode)
+    values = values if isinstance(values, list) else list(values)
+    ufs = ufs if isinstance(ufs, list) else list(ufs)
+    if len(ufs) != len(values):
+        raise ValueError("values and ufs must have the same length")
+    checks: Dict[Optional[str], Any] = {None: RGValidator.check}
+    results: List[Optional[str]] = []
+    for value, uf in zip(values, ufs):
+        check = checks.get(uf)
+        if check is None:
+            check = checks[uf] = RGValidator.for_state(uf).check
+        results.append(check(value, mode))
+    return results
+
+
+def validate_batch_parallel(
+    values: Iterable,
+    kind: str = "cpf",
+    mode: str = "any",
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+    store=None,
+) -> List[Optional[str]]:
+    """
+    Valida um lote dividindo-o em blocos processados por um pool de threads.
+
+    Os validadores não guardam estado compartilhado, então os blocos podem
+    ser validados em paralelo; o ganho real depende de um CPython sem GIL
+    (3.13t ou posterior). O resultado é o mesmo de ``validate_batch``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    get_validator(kind, mode)
+    values = values if isinstance(values, list) else list(values)
+    chunks = [
+        values[start : start + chunk_size]
+        for start in range(0, len(values), chunk_size)
+    ]
+    if len(chunks) <= 1 or workers == 1:
+        return validate_batch(values, kind, mode, store)
+
+    results: List[Optional[str]] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for errors in executor.map(
+            lambda chunk: validate_batch(chunk, kind, mode, store), chunks
+        ):
+            results.extend(errors)
+    return results
+
+
+def validate_stream(
+    iterable: Iterable,
+    kind: str = "cnpj",
+    mode: str = "any",
+    chunk_size: int = 1024,
+    fail_fast: bool = False,
+    store=None,
+    profiler=None,
+) -> Iterator[Tuple[Any, bool, Optional[str]]]:
+    """
+    Valida documentos vindos de qualquer iterável (cursor de banco, consumidor
+    de fila, leitor de arquivo) sem materializar a entrada.
+
+    Os valores são lidos em blocos de ``chunk_size``, validados em lote e
+    devolvidos como tuplas ``(valor, válido, código do erro)``, na ordem de
+    entrada. A memória usada é limitada ao tamanho do bloco. Com
+    ``fail_fast=True`` o gerador para logo após devolver o primeiro valor
+    inválido, sem consumir o restante da entrada. Um ``profiler`` registra
+    cada bloco validado.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    get_validator(kind, mode)
+    return _stream(iter(iterable), kind, mode, chunk_size, fail_fast, store, profiler)
+
+
+def _stream(
+    iterator: Iterator,
+    kind: str,
+    mode: str,
+    chunk_size: int,
+    fail_fast: bool,
+    store,
+    profiler,
+) -> Iterator[Tuple[Any, bool, Optional[str]]]:
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        errors = validate_batch(chunk, kind, mode, store, profiler)
+        for value, error in zip(chunk, errors):
+            yield value, error is None, error
+            if fail_fast and error is not None:
+                return
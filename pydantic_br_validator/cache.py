@@ -0,0 +1,199 @@
+"""
+Armazenamento persistente de resultados de validação em SQLite.
+
+Cada resultado é guardado sob uma chave de 64 bits derivada do hash de
+``tipo:modo:valor``, de modo que execuções seguintes de um ETL só calculam os
+valores que ainda não foram vistos.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .validators.base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+)
+
+__all__ = ["ValidationStore"]
+
+ERROR_CODES = (None, NOT_STR, INVALID_MASK, NOT_DIGITS, INVALID_DATA)
+ERROR_INDEXES = {code: index for index, code in enumerate(ERROR_CODES)}
+
+# Limite de parâmetros por consulta, abaixo do mínimo histórico do SQLite (999).
+CHUNK_SIZE = 900
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key INTEGER PRIMARY KEY,
+    error INTEGER NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+"""
+
+
+def make_key(kind: str, mode: str, value: str) -> int:
+    digest = hashlib.blake2b(
+        f"{kind}:{mode}:{value}".encode("utf-8", "surrogatepass"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class ValidationStore:
+    """
+    Cache persistente de resultados de validação.
+
+    Args:
+        path: arquivo do banco SQLite (``":memory:"`` para testes).
+        max_entries: quantidade máxima de resultados; ao ultrapassar, os menos
+            usados recentemente são descartados.
+        warm: carrega todos os resultados em memória ao abrir, e as consultas
+            passam a ser atendidas sem acessar o disco; o uso dos resultados
+            encontrados é gravado de uma vez antes do descarte e ao fechar.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10_000_000,
+        warm: bool = False,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+        self._count, self._tick = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(used), 0) FROM results"
+        ).fetchone()
+        self._memory: Optional[Dict[int, int]] = None
+        self._touched: Dict[int, int] = {}  # chave -> uso, ainda não gravado
+        if warm:
+            self._memory = dict(
+                self._connection.execute("SELECT key, error FROM results")
+            )
+
+    def __enter__(self) -> "ValidationStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        with self._lock:
+            if self._touched:
+                with self._connection:
+                    self._flush_touched()
+            self._connection.close()
+
+    def get_many(
+        self, kind: str, mode: str, values: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
+        """Retorna o resultado já conhecido de cada valor encontrado no store."""
+        keys = {make_key(kind, mode, value): value for value in values}
+        found: Dict[str, Optional[str]] = {}
+        with self._lock:
+            if self._memory is not None:
+                memory = self._memory
+                touched: List[int] = []
+                for key, value in keys.items():
+                    error = memory.get(key)
+                    if error is not None:
+                        found[value] = ERROR_CODES[error]
+                        touched.append(key)
+                if touched:
+                    self._touched.update(dict.fromkeys(touched, self._next_tick()))
+                return found
+
+            hits: List[int] = []
+            key_list = list(keys)
+            for start in range(0, len(key_list), CHUNK_SIZE):
+                chunk = key_list[start : start + CHUNK_SIZE]
+                rows = self._connection.execute(
+                    "SELECT key, error FROM results WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, error in rows:
+                    found[keys[key]] = ERROR_CODES[error]
+                    hits.append(key)
+            if hits:
+                tick = self._next_tick()
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE results SET used = ? WHERE key = ?",
+                        ((tick, key) for key in hits),
+                    )
+        return found
+
+    def put_many(
+        self, kind: str, mode: str, results: Mapping[str, Optional[str]]
+    ) -> None:
+        """Grava os resultados em uma única transação, aplicando o limite."""
+        with self._lock:
+            tick = self._next_tick()
+            rows = [
+                (make_key(kind, mode, value), ERROR_INDEXES[error], tick)
+                for value, error in results.items()
+            ]
+            with self._connection:
+                changes = self._connection.total_changes
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO results (key, error, used) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._count += self._connection.total_changes - changes
+                if self._memory is not None:
+                    self._memory.update((key, error) for key, error, _ in rows)
+                self._flush_touched()
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM results")
+            self._count = 0
+            self._touched.clear()
+            if self._memory is not None:
+                self._memory.clear()
+
+    def _next_tick(self) -> int:
+        self._tick += 1
+        return self._tick
+
+    def _flush_touched(self) -> None:
+        """Grava o uso dos resultados encontrados em memória (``warm``)."""
+        if not self._touched:
+            return
+        self._connection.executemany(
+            "UPDATE results SET used = ? WHERE key = ?",
+            ((tick, key) for key, tick in self._touched.items()),
+        )
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        evicted = [
+            key
+            for (key,) in self._connection.execute(
+                "SELECT key FROM results ORDER BY used LIMIT ?", (excess,)
+            )
+        ]
+        self._connection.executemany(
+            "DELETE FROM results WHERE key = ?", ((key,) for key in evicted)
+        )
+        self._count -= len(evicted)
+        if self._memory is not None:
+            for key in evicted:
+                self._memory.pop(key, None)
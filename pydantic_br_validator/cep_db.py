@@ -0,0 +1,249 @@
+"""
+Base local de CEPs existentes, para conferir mais do que o formato do CEP.
+
+A lista oficial de CEPs é convertida uma única vez em um arquivo binário com
+os CEPs como inteiros ``uint32`` ordenados (cerca de 4 MB para um milhão de
+CEPs):
+
+    python -m pydantic_br_validator build-cep-db ceps.txt ceps.bin
+
+O arquivo é mapeado em memória (``mmap``) na primeira consulta, que é uma
+busca binária sobre o mapeamento, sem carregar a lista em objetos Python:
+
+    base = CEPDatabase("ceps.bin")
+    "01310-100" in base  # True
+    base.contains_many(["01310100", "99999999"])  # [True, False]
+
+Nos campos, ``CEP(exists=True)`` usa a base padrão, definida com
+``set_default_database`` ou pela variável de ambiente ``PYDANTIC_BR_CEP_DB``;
+``CEP(exists="ceps.bin")`` usa o arquivo informado.
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from threading import Lock
+from typing import Iterable, List, Optional, Tuple, Union
+
+__all__ = [
+    "DATABASE_ENV",
+    "CEPDatabase",
+    "build_cep_db",
+    "cep_key",
+    "get_database",
+    "set_default_database",
+]
+
+# Cabeçalho de 8 bytes, que mantém os valores alinhados em 4 bytes.
+MAGIC = b"BRCEP\x00\x00\x01"
+DATABASE_ENV = "PYDANTIC_BR_CEP_DB"
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def cep_key(cep) -> Optional[int]:
+    """CEP como inteiro (com ou sem máscara), ou None se não tiver 8 dígitos."""
+    if isinstance(cep, int) and not isinstance(cep, bool):
+        return cep if 0 <= cep <= 99_999_999 else None
+    if not isinstance(cep, str):
+        return None
+    if "-" in cep:
+        cep = cep.replace("-", "")
+    if len(cep) != 8 or not cep.isdigit() or not cep.isascii():
+        return None
+    return int(cep)
+
+
+class CEPDatabase:
+    """
+    Base de CEPs gerada por ``build_cep_db``. O arquivo só é aberto na
+    primeira consulta. Sem ``path``, usa a base padrão (``set_default_database``
+    ou a variável de ambiente ``PYDANTIC_BR_CEP_DB``).
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = None if path is None else os.fspath(path)
+        self._entries: Optional[memoryview] = None
+        self._mapped: Optional[mmap.mmap] = None
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"CEPDatabase({self.path!r})"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, cep) -> bool:
+        key = cep_key(cep)
+        if key is None:
+            return False
+        entries = self.entries
+        index = bisect_left(entries, key)
+        return index < len(entries) and entries[index] == key
+
+    def contains_many(self, ceps: Iterable) -> List[bool]:
+        """Confere a existência de cada CEP do lote."""
+        entries = self.entries
+        size = len(entries)
+        results = []
+        for cep in ceps:
+            key = cep_key(cep)
+            if key is None:
+                results.append(False)
+                continue
+            index = bisect_left(entries, key)
+            results.append(index < size and entries[index] == key)
+        return results
+
+    @property
+    def loaded(self) -> bool:
+        return self._entries is not None
+
+    @property
+    def entries(self) -> memoryview:
+        """Os CEPs ordenados, como ``uint32``."""
+        entries = self._entries
+        if entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._load()
+                entries = self._entries
+        return entries
+
+    def close(self) -> None:
+        with self._lock:
+            if self._entries is not None:
+                self._entries.release()
+                self._entries = None
+            if self._mapped is not None:
+                self._mapped.close()
+                self._mapped = None
+
+    def __enter__(self) -> "CEPDatabase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _load(self) -> None:
+        path = self.path or _default_path()
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < len(MAGIC) or (size - len(MAGIC)) % 4:
+                raise ValueError(f"{path!r} is not a CEP database")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[: len(MAGIC)] != MAGIC:
+            mapped.close()
+            raise ValueError(f"{path!r} is not a CEP database")
+        if sys.byteorder == "little":
+            self._mapped = mapped
+            self._entries = memoryview(mapped)[len(MAGIC) :].cast("I")
+        else:  # pragma: no cover
+            # O arquivo é little-endian: em outras arquiteturas é copiado.
+            values = array("I", mapped[len(MAGIC) :])
+            values.byteswap()
+            mapped.close()
+            self._entries = memoryview(values)
+
+
+def build_cep_db(
+    ceps: Iterable[str],
+    destination: Path,
+    column: Optional[int] = None,
+    delimiter: str = ",",
+) -> Tuple[int, int]:
+    """
+    Gera o arquivo da base a partir das linhas de uma lista de CEPs, com um
+    CEP por linha ou, com ``column``, em uma coluna de um arquivo delimitado
+    (a partir de 0). Linhas sem um CEP válido, como cabeçalhos, são
+    ignoradas. Retorna a quantidade de CEPs distintos gravados e de linhas
+    ignoradas.
+    """
+    keys = set()
+    skipped = 0
+    for line in ceps:
+        line = line.strip()
+        if not line:
+            continue
+        if column is not None:
+            fields = line.split(delimiter)
+            line = fields[column].strip().strip('"') if column < len(fields) else ""
+        key = cep_key(line)
+        if key is None:
+            skipped += 1
+        else:
+            keys.add(key)
+    values = array("I", sorted(keys))
+    if sys.byteorder != "little":  # pragma: no cover
+        values.byteswap()
+    directory = os.path.dirname(os.path.abspath(destination))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(MAGIC)
+            values.tofile(file)
+        os.replace(temporary, destination)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return len(values), skipped
+
+
+_default_database_path: Optional[str] = None
+DEFAULT_DATABASE = CEPDatabase()
+
+
+def _default_path() -> str:
+    path = _default_database_path or os.environ.get(DATABASE_ENV)
+    if not path:
+        raise RuntimeError(
+            "no CEP database configured: call set_default_database() "
+            f"or set {DATABASE_ENV}"
+        )
+    return path
+
+
+def set_default_database(path: Optional[Path]) -> None:
+    """Define o arquivo da base padrão, usada por ``CEP(exists=True)``."""
+    global _default_database_path, DEFAULT_DATABASE
+    _default_database_path = None if path is None else os.fspath(path)
+    # A base anterior não é fechada: outras threads podem estar consultando
+    # o mapeamento, que é liberado quando a última referência some.
+    DEFAULT_DATABASE = CEPDatabase()
+
+
+class _DefaultDatabase:
+    """
+    A base padrão vigente em cada consulta, para que campos criados antes de
+    ``set_default_database`` passem a usar a nova base.
+    """
+
+    def __repr__(self) -> str:
+        return "DEFAULT_DATABASE"
+
+    def __contains__(self, cep) -> bool:
+        return cep in DEFAULT_DATABASE
+
+    def contains_many(self, ceps: Iterable) -> List[bool]:
+        return DEFAULT_DATABASE.contains_many(ceps)
+
+
+_DEFAULT = _DefaultDatabase()
+
+
+def get_database(
+    database: Union[bool, Path, CEPDatabase],
+) -> Union[CEPDatabase, _DefaultDatabase]:
+    """A base para a opção ``exists`` dos campos: True, um caminho ou a base."""
+    if database is True:
+        return _DEFAULT
+    if isinstance(database, CEPDatabase):
+        return database
+    if isinstance(database, (str, os.PathLike)):
+        return CEPDatabase(database)
+    raise TypeError(
+        f"exists must be True, a path or a CEPDatabase, not {type(database).__name__}"
+    )
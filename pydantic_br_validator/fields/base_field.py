@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Generator
+from typing import Any, Callable, Dict, Generator, Optional, Type, Union
 
 from ..field_erros import (
     FieldDigitError,
@@ -7,6 +7,7 @@ from ..field_erros import (
     FieldTypeError,
 )
 from ..get_versions import get_pydantic_version
+from ..policy import ValidationPolicy, get_policy
 from ..validators.base_validator import FieldMaskValidator, FieldValidator
 from .base_field_v2 import BaseAlphanumericV2, BaseDigitsV2, BaseMaskV2, BasePydanticV2
 
@@ -29,9 +30,36 @@ class Base(BasePydanticV2):
 
     __slots__ = ["number"]
 
+    def __new__(cls, number: Optional[str] = None, **options):
+        """
+        ``CPF(policy="structural")``, com opções e sem número, cria uma
+        variante do campo para usar como anotação em modelos.
+        """
+        if options:
+            if number is not None:
+                raise TypeError("field options cannot be combined with a number")
+            return cls.specialize(**options)
+        return super().__new__(cls)
+
     def __init__(self, number: str) -> None:
         self.number = number
 
+    @classmethod
+    def specialize(cls, **options) -> Type["Base"]:
+        """Cria uma subclasse do campo com as opções informadas."""
+        namespace = cls._options(**options)
+        namespace.update(__slots__=(), __module__=cls.__module__)
+        return type(cls.__name__, (cls,), namespace)
+
+    @classmethod
+    def _options(
+        cls,
+        policy: Union[str, ValidationPolicy, None] = None,
+        sample_rate: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Atributos de classe da variante criada por ``specialize``."""
+        return {"policy": get_policy(policy, sample_rate)}
+
     @classmethod
     def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
         field_schema.update(type="string", format=cls.format)
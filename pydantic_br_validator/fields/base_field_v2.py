@@ -1,6 +1,13 @@
-from typing import Any, Dict
-
+from typing import Any, Dict, Optional
+
+from ..field_erros import (
+    FieldDigitError,
+    FieldInvalidError,
+    FieldMaskError,
+    FieldTypeError,
+)
 from ..get_versions import get_pydantic_version
+from ..policy import POLICY_CONTEXT_KEY, ValidationPolicy, context_policy
 
 pydantic_version = get_pydantic_version()
 
@@ -12,6 +19,8 @@ if pydantic_version.value == 1:
 
         def general_after_validator_function(self): ...
 
+        def with_info_after_validator_function(self): ...
+
         def str_schema(self): ...
 
         def ValidationInfo(self): ...
@@ -23,15 +32,28 @@ if pydantic_version.value == 2:
 
 JsonSchemaValue = Dict[str, Any]
 
+FIELD_ERRORS = {
+    error.code: error
+    for error in (FieldTypeError, FieldMaskError, FieldDigitError, FieldInvalidError)
+}
+
+
+def raise_field_error(code: str) -> None:
+    error = FIELD_ERRORS[code]
+    raise error(error.msg_template)
+
 
 class BasePydanticV2:
+    mode = "any"
+    policy: Optional[ValidationPolicy] = None
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls,
         source,
         handler=None,
     ) -> core_schema.CoreSchema:
-        return core_schema.no_info_after_validator_function(
+        return core_schema.with_info_after_validator_function(
             cls._validate, core_schema.str_schema()
         )
 
@@ -44,30 +66,27 @@ class BasePydanticV2:
         return field_schema
 
     @classmethod
-    def _validate(cls, __input_value: str) -> str:
-        cls.validate_type(__input_value)
-        return cls.validate(__input_value)
+    def _validate(cls, __input_value: str, info=None) -> str:
+        policy = cls.policy
+        context = info and info.context
+        if context and POLICY_CONTEXT_KEY in context:
+            policy = context_policy(context)
+        if policy is None:
+            error = cls.Validator.check(__input_value, cls.mode)
+        else:
+            error = policy.check(cls.Validator, __input_value, cls.mode)
+        if error is not None:
+            raise_field_error(error)
+        return __input_value
 
 
 class BaseMaskV2(BasePydanticV2):
-    @classmethod
-    def _validate(cls, __input_value: str) -> str:
-        cls.validate_type(__input_value)
-        cls.validate_mask(__input_value)
-        return cls.validate(__input_value)
+    mode = "mask"
 
 
 class BaseDigitsV2(BasePydanticV2):
-    @classmethod
-    def _validate(cls, __input_value: str) -> str:
-        cls.validate_type(__input_value)
-        cls.validate_numbers(__input_value)
-        return cls.validate(__input_value)
+    mode = "digits"
 
 
 class BaseAlphanumericV2(BasePydanticV2):
-    @classmethod
-    def _validate(cls, __input_value: str) -> str:
-        cls.validate_type(__input_value)
-        cls.validate_alphanumeric(__input_value)
-        return cls.validate(__input_value)
+    mode = "alphanumeric"
@@ -1,3 +1,6 @@
+from typing import Any, Dict, Union
+
+from ..cep_db import CEPDatabase, Path, get_database
 from ..validators.cep_validator import CEPValidator
 from .base_field import Base, BaseDigits, BaseMask
 
@@ -8,7 +11,24 @@ __all__ = [
 ]
 
 
-class CEP(Base):
+class ExistsOptions:
+    """
+    Mixin that adds the ``exists`` option: ``CEP(exists=True)`` also requires
+    the CEP to be in the CEP database (``True`` for the default database, a
+    path or a ``CEPDatabase``).
+    """
+
+    @classmethod
+    def _options(
+        cls, exists: Union[bool, Path, CEPDatabase] = False, **options
+    ) -> Dict[str, Any]:
+        namespace = super()._options(**options)
+        if exists is not False:
+            namespace["Validator"] = CEPValidator.with_database(get_database(exists))
+        return namespace
+
+
+class CEP(ExistsOptions, Base):
     """
     Only Accepts string of CEP.
 
@@ -21,7 +41,7 @@ class CEP(Base):
     Validator = CEPValidator
 
 
-class CEPMask(BaseMask):
+class CEPMask(ExistsOptions, BaseMask):
     """
     Only Accepts string of CEP with mask.
 
@@ -33,7 +53,7 @@ class CEPMask(BaseMask):
     Validator = CEPValidator
 
 
-class CEPDigits(BaseDigits):
+class CEPDigits(ExistsOptions, BaseDigits):
     """
     Only Accepts string of CEP without mask.
 
@@ -0,0 +1,46 @@
+from ..validators.cpf_or_cnpj_validator import CPFOrCNPJValidator
+from .base_field import Base, BaseAlphanumeric, BaseMask
+
+__all__ = [
+    "CPFOrCNPJ",
+    "CPFOrCNPJMask",
+    "CPFOrCNPJDigits",
+]
+
+
+class CPFOrCNPJ(Base):
+    """
+    Accepts string of CPF or CNPJ with or without mask.
+    The document type is detected from the length and separator layout,
+    so only the matching checksum is computed.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
+
+    format = "cpf or cnpj"
+    Validator = CPFOrCNPJValidator
+
+
+class CPFOrCNPJMask(BaseMask):
+    """
+    Only Accepts string of CPF or CNPJ with mask.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
+
+    format = "cpf or cnpj mask"
+    Validator = CPFOrCNPJValidator
+
+
+class CPFOrCNPJDigits(BaseAlphanumeric):
+    """
+    Only Accepts string of CPF or CNPJ without mask.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
+
+    format = "cpf or cnpj digits"
+    Validator = CPFOrCNPJValidator
@@ -0,0 +1,241 @@
+from typing import Any, Callable, Optional
+
+from ..validators.base_validator import FieldValidator
+from .base_field_v2 import core_schema, raise_field_error
+from .cnh_field import CNH
+from .cnpj_field import CNPJ, CNPJDigits, CNPJMask
+from .cpf_field import CPF, CPFDigits, CPFMask
+from .cpf_or_cnpj_field import CPFOrCNPJ, CPFOrCNPJDigits, CPFOrCNPJMask
+
+__all__ = [
+    "LazyDocument",
+    "LazyCPF",
+    "LazyCPFMask",
+    "LazyCPFDigits",
+    "LazyCNPJ",
+    "LazyCNPJMask",
+    "LazyCNPJDigits",
+    "LazyCNH",
+    "LazyCPFOrCNPJ",
+    "LazyCPFOrCNPJMask",
+    "LazyCPFOrCNPJDigits",
+]
+
+# Ellipsis como marcador de "ainda não conferido" sobrevive a pickle e cópia.
+_PENDING = ...
+
+# Atributos públicos que não disparam a conferência.
+_UNCHECKED_ATTRIBUTES = frozenset(("verify", "verified"))
+
+
+class LazyDocument(str):
+    """
+    Document string whose check digits are verified on first use.
+
+    Any use of the value (string methods, comparisons, ``len``, indexing,
+    ``str()`` or formatting) and serialization of the model verify it first.
+    The outcome is cached; an invalid document raises ``FieldInvalidError``
+    on every use. ``repr`` does not trigger the verification.
+    """
+
+    def __new__(
+        cls,
+        value: str,
+        validator: Optional[Callable[..., FieldValidator]] = None,
+        mode: str = "any",
+    ) -> "LazyDocument":
+        document = super().__new__(cls, value)
+        document._validator = validator
+        document._mode = mode
+        document._error = None if validator is None else _PENDING
+        return document
+
+    def __getattribute__(self, name: str) -> Any:
+        if name[0] != "_" and name not in _UNCHECKED_ATTRIBUTES:
+            LazyDocument.verify(self)
+        return str.__getattribute__(self, name)
+
+    def __repr__(self) -> str:
+        return str.__repr__(self)
+
+    @property
+    def verified(self) -> bool:
+        """Whether the check digits were already verified."""
+        return self._error is not _PENDING
+
+    def verify(self) -> "LazyDocument":
+        """Verify the check digits now, raising the usual field error."""
+        error = self._error
+        if error is _PENDING:
+            error = self._error = self._validator.check(str.__str__(self), self._mode)
+        if error is not None:
+            raise_field_error(error)
+        return self
+
+
+def _verified(name: str) -> Callable:
+    method = getattr(str, name)
+
+    def wrapper(self, *args):
+        LazyDocument.verify(self)
+        return method(self, *args)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# Operações implícitas não passam por __getattribute__.
+for _name in (
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__hash__",
+    "__len__",
+    "__getitem__",
+    "__iter__",
+    "__contains__",
+    "__add__",
+    "__mul__",
+    "__rmul__",
+    "__mod__",
+    "__str__",
+    "__format__",
+):
+    setattr(LazyDocument, _name, _verified(_name))
+
+
+def _serialize(value: str) -> str:
+    if isinstance(value, LazyDocument):
+        value.verify()
+        return str.__str__(value)
+    return value
+
+
+class LazyBase:
+    """
+    Mixin for lazily validated fields: model construction only checks mask,
+    characters and length; the check digits are verified when the value is
+    first used or serialized.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source,
+        handler=None,
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            cls._validate,
+            core_schema.str_schema(),
+            serialization=core_schema.plain_serializer_function_ser_schema(_serialize),
+        )
+
+    @classmethod
+    def _validate(cls, __input_value: str) -> LazyDocument:
+        error = cls.Validator.check_structure(__input_value, cls.mode)
+        if error is not None:
+            raise_field_error(error)
+        return LazyDocument(__input_value, cls.Validator, cls.mode)
+
+
+class LazyCPF(LazyBase, CPF):
+    """
+    Accepts string of CPF with or without mask, verifying the check digits
+    on first use.
+
+    Attributes:
+        number (str): CPF number.
+    """
+
+
+class LazyCPFMask(LazyBase, CPFMask):
+    """
+    Only Accepts string of CPF with mask, verifying the check digits on
+    first use.
+
+    Attributes:
+        number (str): CPF number.
+    """
+
+
+class LazyCPFDigits(LazyBase, CPFDigits):
+    """
+    Only Accepts string of CPF with digits, verifying the check digits on
+    first use.
+
+    Attributes:
+        number (str): CPF number.
+    """
+
+
+class LazyCNPJ(LazyBase, CNPJ):
+    """
+    Accepts string of CNPJ with or without mask, verifying the check digits
+    on first use.
+
+    Attributes:
+        number (str): CNPJ number.
+    """
+
+
+class LazyCNPJMask(LazyBase, CNPJMask):
+    """
+    Only Accepts string of CNPJ with mask, verifying the check digits on
+    first use.
+
+    Attributes:
+        number (str): CNPJ number.
+    """
+
+
+class LazyCNPJDigits(LazyBase, CNPJDigits):
+    """
+    Only Accepts string of CNPJ without mask, verifying the check digits on
+    first use.
+
+    Attributes:
+        number (str): CNPJ number.
+    """
+
+
+class LazyCNH(LazyBase, CNH):
+    """
+    Only Accepts string of CNH with digits, verifying the check digits on
+    first use.
+
+    Attributes:
+        number (str): CNH number.
+    """
+
+
+class LazyCPFOrCNPJ(LazyBase, CPFOrCNPJ):
+    """
+    Accepts string of CPF or CNPJ with or without mask, verifying the check
+    digits on first use.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
+
+
+class LazyCPFOrCNPJMask(LazyBase, CPFOrCNPJMask):
+    """
+    Only Accepts string of CPF or CNPJ with mask, verifying the check digits
+    on first use.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
+
+
+class LazyCPFOrCNPJDigits(LazyBase, CPFOrCNPJDigits):
+    """
+    Only Accepts string of CPF or CNPJ without mask, verifying the check
+    digits on first use.
+
+    Attributes:
+        number (str): CPF or CNPJ number.
+    """
@@ -1,3 +1,5 @@
+from typing import Any, Dict, Optional
+
 from ..validators.rg_validator import RGValidator
 from .base_field import Base, BaseDigits, BaseMask
 
@@ -8,7 +10,21 @@ __all__ = [
 ]
 
 
-class RG(Base):
+class StateOptions:
+    """
+    Mixin that adds the ``uf`` option: ``RG(uf="SP")`` also verifies the
+    check digit with the issuing state's rule.
+    """
+
+    @classmethod
+    def _options(cls, uf: Optional[str] = None, **options) -> Dict[str, Any]:
+        namespace = super()._options(**options)
+        if uf is not None:
+            namespace["Validator"] = RGValidator.for_state(uf)
+        return namespace
+
+
+class RG(StateOptions, Base):
     """
     Accepts string of RG with or without mask.
 
@@ -21,7 +37,7 @@ class RG(Base):
     Validator = RGValidator
 
 
-class RGMask(BaseMask):
+class RGMask(StateOptions, BaseMask):
     """
     Only Accepts string of RG with mask.
 
@@ -33,7 +49,7 @@ class RGMask(BaseMask):
     Validator = RGValidator
 
 
-class RGDigits(BaseDigits):
+class RGDigits(StateOptions, BaseDigits):
     """
     Only Accepts string of RG with digits.
 
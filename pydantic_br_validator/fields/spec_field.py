@@ -0,0 +1,75 @@
+from typing import Tuple, Type
+
+from ..validators.spec_validator import (
+    PISValidator,
+    RENAVAMValidator,
+    SpecMaskValidator,
+    SpecValidator,
+)
+from .base_field import Base, BaseDigits, BaseMask
+
+__all__ = [
+    "PIS",
+    "PISMask",
+    "PISDigits",
+    "RENAVAM",
+]
+
+DOCSTRING = """
+    {summary}
+
+    Attributes:
+        number (str): {label} number.
+    """
+
+
+def spec_fields(
+    validator: Type[SpecValidator], title: str, label: str = ""
+) -> Tuple[Type[Base], ...]:
+    """
+    Gera os campos do documento de um validador criado por ``compile_spec``.
+
+    Com máscara, retorna os campos (com ou sem máscara, só com máscara, só
+    com dígitos), como ``PIS``, ``PISMask`` e ``PISDigits``; sem máscara, só
+    o campo com dígitos, com o nome do documento, como ``RENAVAM``.
+    """
+    spec = validator.spec
+    name = spec.name.upper()
+    label = label or title
+    if issubclass(validator, SpecMaskValidator):
+        variants = [
+            (name, Base, spec.name, "Accepts string of {} with or without mask."),
+            (
+                name + "Mask",
+                BaseMask,
+                f"{spec.name} mask",
+                "Only Accepts string of {} with mask.",
+            ),
+            (
+                name + "Digits",
+                BaseDigits,
+                f"{spec.name} digits",
+                "Only Accepts string of {} with digits.",
+            ),
+        ]
+    else:
+        variants = [
+            (name, BaseDigits, spec.name, "Only Accepts string of {} with digits.")
+        ]
+    return tuple(
+        type(
+            field_name,
+            (base,),
+            {
+                "__doc__": DOCSTRING.format(summary=summary.format(title), label=label),
+                "__module__": __name__,
+                "format": format,
+                "Validator": validator,
+            },
+        )
+        for field_name, base, format, summary in variants
+    )
+
+
+PIS, PISMask, PISDigits = spec_fields(PISValidator, "PIS/PASEP/NIT", "PIS")
+(RENAVAM,) = spec_fields(RENAVAMValidator, "RENAVAM")
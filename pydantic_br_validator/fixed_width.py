@@ -0,0 +1,239 @@
+"""
+Validação de arquivos de registros de tamanho fixo (CNAB e leiautes de
+mainframe), com os documentos em posições conhecidas de cada registro.
+
+    leiaute = [
+        RecordField("cpf", offset=20, length=14, kind="cpf", mode="mask"),
+        RecordField("cep", offset=120, length=8, kind="cep", mode="digits"),
+    ]
+    for falha in read_fixed_width("retorno.rem", leiaute, record_type=(7, b"3")):
+        print(falha.index, falha.offset, falha.errors)  # {"cpf": "invalid_data"}
+
+O arquivo é mapeado em memória (``mmap``) e cada documento é fatiado do
+registro por um ``memoryview`` e conferido sobre os bytes, sem decodificar as
+linhas. Apenas os registros com algum documento inválido são devolvidos.
+
+Os registros podem ser divididos em faixas (``scan_records``) e as faixas
+processadas em paralelo por um ``Executor``: cada faixa mapeia o arquivo por
+conta própria, então um ``ProcessPoolExecutor`` funciona também com o GIL.
+"""
+
+import mmap
+import os
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .batch import get_validator
+from .validators.byte_kernels import KERNELS
+
+__all__ = [
+    "RecordFailure",
+    "RecordField",
+    "read_fixed_width",
+    "record_count",
+    "scan_records",
+]
+
+Source = Union[str, "os.PathLike[str]", bytes, bytearray]
+RecordType = Tuple[int, bytes]
+
+
+class RecordField(NamedTuple):
+    """
+    Documento em um registro: nome, posição (a partir de 0) e tamanho em
+    bytes, tipo de documento e modo de validação. Os espaços nas pontas são
+    descartados; um campo em branco com ``required=False`` não é conferido.
+    """
+
+    name: str
+    offset: int
+    length: int
+    kind: str
+    mode: str = "any"
+    required: bool = True
+
+
+class RecordFailure(NamedTuple):
+    """Registro com documentos inválidos: índice, posição no arquivo e erros."""
+
+    index: int
+    offset: int
+    errors: Dict[str, str]
+
+
+def read_fixed_width(
+    source: Source,
+    layout: Sequence[RecordField],
+    record_length: Optional[int] = None,
+    record_type: Optional[RecordType] = None,
+    encoding: str = "latin-1",
+    executor: Optional[Executor] = None,
+    chunk_records: int = 100_000,
+) -> Iterator[RecordFailure]:
+    """
+    Confere os documentos de todos os registros e devolve, em ordem, os que
+    falharem.
+
+    ``record_length`` é o tamanho de cada registro, incluindo a quebra de
+    linha; por padrão é a posição da primeira quebra de linha mais um. Com
+    ``record_type=(posição, bytes)`` apenas os registros com esses bytes na
+    posição são conferidos (os detalhes, sem o header e o trailer de um CNAB).
+    Valores fora do ASCII são decodificados com ``encoding`` e conferidos
+    por ``Validator.check``.
+
+    Com um ``executor``, os registros são divididos em faixas de
+    ``chunk_records`` conferidas em paralelo. Com um ``ProcessPoolExecutor``
+    ``source`` deve ser o caminho do arquivo.
+    """
+    if chunk_records < 1:
+        raise ValueError("chunk_records must be positive")
+    with _mapped(source) as data:
+        if record_length is None:
+            record_length = _detect_record_length(data, layout)
+        total = record_count(data, record_length)
+    _compile(layout, record_length, record_type)
+    return _read(
+        source,
+        layout,
+        total,
+        record_length,
+        record_type,
+        encoding,
+        executor,
+        chunk_records,
+    )
+
+
+def _read(
+    source: Source,
+    layout: Sequence[RecordField],
+    total: int,
+    record_length: int,
+    record_type: Optional[RecordType],
+    encoding: str,
+    executor: Optional[Executor],
+    chunk_records: int,
+) -> Iterator[RecordFailure]:
+    if executor is None or total <= chunk_records:
+        yield from scan_records(
+            source, layout, 0, total, record_length, record_type, encoding
+        )
+        return
+    starts = range(0, total, chunk_records)
+    stops = [min(start + chunk_records, total) for start in starts]
+    for failures in executor.map(
+        scan_records,
+        repeat(source),
+        repeat(layout),
+        starts,
+        stops,
+        repeat(record_length),
+        repeat(record_type),
+        repeat(encoding),
+    ):
+        yield from failures
+
+
+def scan_records(
+    source: Source,
+    layout: Sequence[RecordField],
+    start: int,
+    stop: int,
+    record_length: int,
+    record_type: Optional[RecordType] = None,
+    encoding: str = "latin-1",
+) -> List[RecordFailure]:
+    """Confere os registros de ``start`` a ``stop`` (exclusivo) e devolve as falhas."""
+    fields = _compile(layout, record_length, record_type)
+    failures = []
+    with _mapped(source) as data:
+        view = memoryview(data)
+        try:
+            stop = min(stop, record_count(data, record_length))
+            for index in range(start, stop):
+                offset = index * record_length
+                if record_type is not None:
+                    position = offset + record_type[0]
+                    if (
+                        view[position : position + len(record_type[1])]
+                        != record_type[1]
+                    ):
+                        continue
+                errors = None
+                for name, begin, end, kernel, check, mode, required in fields:
+                    raw = view[offset + begin : offset + end].tobytes().strip(b" ")
+                    if not raw and not required:
+                        continue
+                    if kernel is not None and raw.isascii():
+                        error = kernel(raw, mode)
+                    else:
+                        error = check(raw.decode(encoding), mode)
+                    if error is not None:
+                        if errors is None:
+                            errors = {}
+                        errors[name] = error
+                if errors is not None:
+                    failures.append(RecordFailure(index, offset, errors))
+        finally:
+            view.release()
+    return failures
+
+
+def record_count(data, record_length: int) -> int:
+    """Quantidade de registros; o último pode não ter a quebra de linha."""
+    if record_length < 1:
+        raise ValueError("record_length must be positive")
+    return -(-len(data) // record_length)
+
+
+def _detect_record_length(data, layout: Sequence[RecordField]) -> int:
+    """Até a primeira quebra de linha; sem dados, o que o leiaute ocupa."""
+    if not data:
+        return max((field.offset + field.length for field in layout), default=1)
+    end = data.find(b"\n")
+    return len(data) if end < 0 else end + 1
+
+
+def _compile(
+    layout: Sequence[RecordField],
+    record_length: int,
+    record_type: Optional[RecordType],
+) -> List[Tuple]:
+    """Confere o leiaute e prepara, por campo, as rotinas de validação."""
+    if record_type is not None:
+        position, marker = record_type
+        if position < 0 or position + len(marker) > record_length:
+            raise ValueError("record_type exceeds the record length")
+    fields = []
+    for field in layout:
+        if field.offset < 0 or field.length < 1:
+            raise ValueError(f"invalid position for field {field.name!r}")
+        if field.offset + field.length > record_length:
+            raise ValueError(f"field {field.name!r} exceeds the record length")
+        fields.append(
+            (
+                field.name,
+                field.offset,
+                field.offset + field.length,
+                KERNELS.get(field.kind),
+                get_validator(field.kind, field.mode).check,
+                field.mode,
+                field.required,
+            )
+        )
+    return fields
+
+
+@contextmanager
+def _mapped(source: Source) -> Iterator:
+    if not isinstance(source, (str, os.PathLike)):
+        yield source
+        return
+    with open(source, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
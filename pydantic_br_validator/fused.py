@@ -0,0 +1,293 @@
+"""
+Validação de todos os documentos de um modelo em uma única chamada.
+
+    class Cliente(FusedValidation, BaseModel):
+        cpf: CPF
+        empresa: CNPJMask
+        cep: Optional[CEP] = None
+
+Sem o mixin, o pydantic-core chama ``_validate`` de cada campo separadamente.
+Com ele, na criação da classe os campos de documento passam a ser validados como
+``str`` pelo pydantic-core, e um único validador do modelo confere todos eles de
+uma vez. Os erros continuam atribuídos a cada campo (``loc``), com os mesmos
+tipos e mensagens, junto com os erros dos demais campos.
+
+Campos sob demanda (``LazyCPF``...) mantêm a sua própria validação. No pydantic
+v1 o mixin não tem efeito e cada campo é validado como antes.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+)
+
+from .fields.base_field_v2 import FIELD_ERRORS, BasePydanticV2, core_schema
+from .get_versions import get_pydantic_version
+from .policy import POLICY_CONTEXT_KEY, context_policy
+
+__all__ = ["FusedValidation"]
+
+pydantic_version = get_pydantic_version()
+
+if pydantic_version.value == 2:
+    from pydantic_core import PydanticCustomError, ValidationError
+
+    # Tipos de erro do pydantic-core, que podem ser recriados pelo nome.
+    KNOWN_ERROR_TYPES = frozenset(get_args(core_schema.ErrorType))
+
+
+class FusedField(NamedTuple):
+    name: str
+    loc: str  # nome no ``loc`` dos erros (alias ou nome do campo)
+    keys: Tuple[Tuple[str, str], ...]  # chaves aceitas na entrada e o seu ``loc``
+    field: Type[BasePydanticV2]
+    check: Callable[..., Optional[str]]  # ``field.Validator.check``
+    validate_default: bool
+    default: Optional[Callable[[], Any]]  # valor padrão, com ``validate_default``
+
+
+def _document_field(schema: Dict[str, Any]) -> Optional[Type[BasePydanticV2]]:
+    function = schema.get("function", {}).get("function")
+    if (
+        schema["type"] == "function-after"
+        and getattr(function, "__func__", None) is BasePydanticV2._validate.__func__
+    ):
+        return function.__self__
+    return None
+
+
+def _default(schema: Dict[str, Any]) -> Optional[Callable[[], Any]]:
+    """O valor padrão de um nó ``default`` do schema, se houver um."""
+    if schema["type"] != "default":
+        return None
+    if "default" in schema:
+        value = schema["default"]
+        return lambda: value
+    if schema.get("default_factory_takes_data"):
+        return None
+    return schema.get("default_factory")
+
+
+def _unwrap(schema: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Desce por ``default`` e ``nullable``: (nó pai, nó do tipo do campo)."""
+    parent = schema
+    while schema["type"] in ("default", "nullable"):
+        parent, schema = schema, schema["schema"]
+    return parent, schema
+
+
+def fuse_schema(
+    schema: Dict[str, Any],
+) -> Tuple[List[FusedField], Dict[str, int]]:
+    """
+    Troca, no schema de um modelo, os validadores dos campos de documento por
+    ``str``. Devolve os campos trocados e a posição de cada campo do modelo,
+    pelo nome usado no ``loc``, para ordenar os erros.
+    """
+    if schema["type"] != "model" or schema["schema"]["type"] != "model-fields":
+        return [], {}
+    config = schema.get("config", {})
+    loc_by_alias = config.get("loc_by_alias", True)
+    # ``validate_by_*`` a partir do pydantic 2.11; antes, ``populate_by_name``.
+    by_alias = config.get("validate_by_alias", True)
+    by_name = config.get("validate_by_name", config.get("populate_by_name", False))
+    fused = []
+    positions = {}
+    for position, (name, field_schema) in enumerate(schema["schema"]["fields"].items()):
+        alias = field_schema.get("validation_alias", name)
+        loc = alias if loc_by_alias and isinstance(alias, str) else name
+        positions[loc] = position
+        positions.setdefault(name, position)
+        outer = field_schema["schema"]
+        parent, inner = _unwrap(outer)
+        field = _document_field(inner)
+        if field is None or not isinstance(alias, str):
+            continue
+        # Os metadados mantêm o formato do campo no JSON Schema.
+        plain = dict(inner["schema"], metadata=inner.get("metadata", {}))
+        if parent is inner:
+            field_schema["schema"] = plain
+        else:
+            parent["schema"] = plain
+        validate_default = outer.get(
+            "validate_default", config.get("validate_default", False)
+        )
+        # O pydantic-core usa no ``loc`` a chave encontrada na entrada.
+        keys = ((alias, loc),) if by_alias else ()
+        if by_name and (name != alias or not by_alias):
+            keys += ((name, name),)
+        fused.append(
+            FusedField(
+                name,
+                loc,
+                keys,
+                field,
+                field.Validator.check,
+                validate_default,
+                _default(outer) if validate_default else None,
+            )
+        )
+    return fused, positions
+
+
+def _line_error(loc: Tuple, value: str, code: str) -> Dict[str, Any]:
+    error = FIELD_ERRORS[code]
+    return {
+        "type": "value_error",
+        "loc": loc,
+        "input": value,
+        "ctx": {"error": error(error.msg_template)},
+    }
+
+
+def check_fields(
+    fields: List[FusedField],
+    values: Dict[str, Any],
+    info,
+    given=None,
+    locs: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Confere os documentos em ``values`` (nome do campo -> valor) e devolve os
+    erros no formato de ``ValidationError.from_exception_data``. ``given`` são
+    os campos informados na entrada: os demais têm o valor padrão, que só é
+    conferido com ``validate_default``. ``locs`` é o ``loc`` de cada campo
+    pela chave encontrada na entrada (alias ou nome do campo).
+    """
+    context = info.context
+    policy = None
+    if context and POLICY_CONTEXT_KEY in context:
+        policy = context_policy(context)
+    errors = []
+    for name, loc, _, field, check, validate_default, _ in fields:
+        value = values.get(name)
+        if not isinstance(value, str):
+            continue
+        if given is not None and not validate_default and name not in given:
+            continue
+        if policy is None and field.policy is None:
+            error = check(value, field.mode)
+        else:
+            error = (policy or field.policy).check(field.Validator, value, field.mode)
+        if error is not None:
+            if locs:
+                loc = locs.get(name, loc)
+            errors.append(_line_error((loc,), value, error))
+    return errors
+
+
+def _lookup(field: FusedField, data: Any, mapping: bool) -> Optional[Tuple[str, Any]]:
+    """O ``loc`` e o valor do campo na entrada, pela primeira chave encontrada."""
+    for key, loc in field.keys:
+        if mapping:
+            if key in data:
+                return loc, data[key]
+        elif hasattr(data, key):
+            return loc, getattr(data, key)
+    return None
+
+
+def _raw_values(
+    fields: List[FusedField], data: Any, from_attributes: bool
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Valores de texto dos documentos na entrada original: as chaves de um
+    dicionário ou, com ``from_attributes``, os atributos de um objeto. Campos
+    ausentes com ``validate_default`` recebem o valor padrão. Devolve também
+    o ``loc`` de cada campo encontrado.
+    """
+    values: Dict[str, Any] = {}
+    locs: Dict[str, str] = {}
+    mapping = isinstance(data, Mapping)
+    if not mapping and not from_attributes:
+        return values, locs
+    for field in fields:
+        found = _lookup(field, data, mapping)
+        if found is not None:
+            locs[field.name], values[field.name] = found
+        elif field.default is not None:
+            values[field.name] = field.default()
+    return values, locs
+
+
+def _input_locs(fields: List[FusedField], data: Any) -> Dict[str, str]:
+    """O ``loc`` dos campos que aceitam mais de uma chave (``populate_by_name``)."""
+    locs = {}
+    mapping = isinstance(data, Mapping)
+    for field in fields:
+        if len(field.keys) > 1:
+            found = _lookup(field, data, mapping)
+            if found is not None:
+                locs[field.name] = found[0]
+    return locs
+
+
+def _reraise(title: str, positions: Dict[str, int], error, extra) -> None:
+    """Junta os erros do pydantic-core e os dos documentos, na ordem dos campos."""
+    failed = {detail["loc"][:1] for detail in error.errors()}
+    details = []
+    for detail in error.errors():
+        if detail["type"] not in KNOWN_ERROR_TYPES:
+            detail["type"] = PydanticCustomError(
+                detail["type"], detail["msg"], detail.get("ctx")
+            )
+        details.append(detail)
+    details.extend(detail for detail in extra if detail["loc"] not in failed)
+    details.sort(
+        key=lambda detail: positions.get(
+            detail["loc"][:1] and detail["loc"][0], len(positions)
+        )
+    )
+    raise ValidationError.from_exception_data(title, details) from None
+
+
+def _fused_validator(title: str, fields: List[FusedField], positions: Dict[str, int]):
+    by_name = any(len(field.keys) > 1 for field in fields)
+
+    def validate(data, handler, info):
+        try:
+            result = handler(data)
+        except ValidationError as error:
+            # Um objeto que não é dicionário só chega aos campos se foi lido
+            # pelos atributos (``from_attributes``, na configuração ou em
+            # ``model_validate``); se foi recusado, o erro não tem ``loc``.
+            from_attributes = all(detail["loc"] for detail in error.errors())
+            values, locs = _raw_values(fields, data, from_attributes)
+            extra = check_fields(fields, values, info, locs=locs)
+            _reraise(title, positions, error, extra)
+        # model-fields devolve (valores, extras, campos informados).
+        locs = _input_locs(fields, data) if by_name else None
+        errors = check_fields(fields, result[0], info, result[2], locs)
+        if errors:
+            raise ValidationError.from_exception_data(title, errors)
+        return result
+
+    return validate
+
+
+class FusedValidation:
+    """
+    Mixin de modelos pydantic v2: valida todos os campos de documento (CPF,
+    CNPJ, CEP, RG, CNH, PIS...) em uma única chamada a Python por modelo, em
+    vez de uma por campo.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler) -> core_schema.CoreSchema:
+        schema = super().__get_pydantic_core_schema__(source, handler)
+        if schema is cls.__dict__.get("__pydantic_core_schema__"):
+            return schema
+        fields, positions = fuse_schema(schema)
+        if fields:
+            schema["schema"] = core_schema.with_info_wrap_validator_function(
+                _fused_validator(cls.__name__, fields, positions), schema["schema"]
+            )
+        return schema
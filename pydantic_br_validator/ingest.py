@@ -0,0 +1,92 @@
+"""
+Ingestão de NDJSON (um documento JSON por linha) direto pelo parser JSON do
+pydantic-core, sem criar dicionários intermediários com ``json.loads``.
+
+    for resultado in ingest_ndjson("clientes.ndjson", Cliente):
+        if resultado.ok:
+            salvar(resultado.value)
+        else:
+            print(resultado.line, resultado.error)
+"""
+
+import io
+import mmap
+import os
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+__all__ = ["IngestResult", "ingest_ndjson"]
+
+Source = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, Iterable]
+
+
+class IngestResult(NamedTuple):
+    """Resultado de uma linha: número (a partir de 1), valor validado ou erro."""
+
+    line: int
+    value: Any
+    error: Optional[ValidationError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def ingest_ndjson(
+    source: Source,
+    model: Any,
+    strict: Optional[bool] = None,
+    context: Optional[dict] = None,
+    use_mmap: bool = True,
+) -> Iterator[IngestResult]:
+    """
+    Valida cada linha de um NDJSON com ``TypeAdapter(model).validate_json``.
+
+    ``source`` pode ser o caminho de um arquivo (mapeado em memória com
+    ``mmap``, ou lido com buffer se ``use_mmap=False``), o conteúdo em bytes
+    ou um iterável de linhas, como um arquivo já aberto. Linhas em branco são
+    ignoradas; as demais geram um ``IngestResult`` com o modelo validado ou o
+    ``ValidationError`` da linha, inclusive para JSON malformado.
+    """
+    adapter = TypeAdapter(model)
+    return _ingest(_lines(source, use_mmap), adapter, strict, context)
+
+
+def _ingest(
+    lines: Iterable,
+    adapter: TypeAdapter,
+    strict: Optional[bool],
+    context: Optional[dict],
+) -> Iterator[IngestResult]:
+    validate_json = adapter.validate_json
+    for number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            value = validate_json(line, strict=strict, context=context)
+        except ValidationError as error:
+            yield IngestResult(number, None, error)
+        else:
+            yield IngestResult(number, value)
+
+
+def _lines(source: Source, use_mmap: bool) -> Iterator:
+    if isinstance(source, (str, os.PathLike)):
+        return _mapped_lines(source) if use_mmap else _file_lines(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return iter(io.BytesIO(source))
+    return iter(source)
+
+
+def _file_lines(path) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        yield from file
+
+
+def _mapped_lines(path) -> Iterator[bytes]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b"")
@@ -0,0 +1,163 @@
+"""
+Políticas de validação: quanto de cada documento é conferido ao validar.
+
+- ``"full"``: validação completa (padrão);
+- ``"structural"``: apenas máscara, caracteres e tamanho, sem os dígitos
+  verificadores, para dados que já foram validados na origem;
+- ``"sampled"``: validação estrutural de todos os valores e completa em 1 a
+  cada ``sample_rate``, contando as divergências encontradas.
+
+A política pode ser definida por campo (``CPF(policy="structural")``) ou por
+chamada, no contexto de validação do pydantic::
+
+    Cliente.model_validate(linha, context={"br_validation_policy": "sampled"})
+
+A política do contexto tem precedência sobre a do campo. Cada campo
+especializado tem a sua própria instância da política; pelo nome, no
+contexto, a instância é criada uma vez por contexto.
+"""
+
+from threading import Lock
+from typing import Any, Dict, Optional, Type, Union
+
+from .validators.base_validator import FieldValidator
+
+__all__ = [
+    "FULL",
+    "POLICY_CONTEXT_KEY",
+    "SAMPLED",
+    "STRUCTURAL",
+    "ValidationPolicy",
+    "context_policy",
+    "get_policy",
+]
+
+FULL = "full"
+STRUCTURAL = "structural"
+SAMPLED = "sampled"
+POLICY_MODES = (FULL, STRUCTURAL, SAMPLED)
+POLICY_CONTEXT_KEY = "br_validation_policy"
+# Instância criada a partir do nome informado no contexto.
+POLICY_INSTANCE_KEY = "br_validation_policy_instance"
+
+
+class ValidationPolicy:
+    """
+    Política de validação com contadores, que podem ser atualizados por
+    várias threads.
+
+    Args:
+        mode: "full", "structural" ou "sampled".
+        sample_rate: no modo "sampled", 1 a cada ``sample_rate`` valores tem
+            os dígitos verificadores conferidos.
+        reject_mismatches: no modo "sampled", se um valor amostrado falhar na
+            validação completa ele é rejeitado (padrão); com False a
+            divergência é apenas contada.
+
+    Attributes:
+        checked: valores que passaram pela política.
+        sampled: valores que tiveram a validação completa por amostragem.
+        mismatches: valores amostrados aprovados na validação estrutural e
+            reprovados na completa, ou seja, dados corrompidos na origem.
+    """
+
+    def __init__(
+        self,
+        mode: str = FULL,
+        sample_rate: int = 100,
+        reject_mismatches: bool = True,
+    ) -> None:
+        if mode not in POLICY_MODES:
+            raise ValueError(
+                f"unknown validation policy {mode!r}, expected one of {POLICY_MODES}"
+            )
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be positive")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.reject_mismatches = reject_mismatches
+        self._lock = Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"ValidationPolicy({self.mode!r}, sample_rate={self.sample_rate})"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checked = 0
+            self.sampled = 0
+            self.mismatches = 0
+            self._position = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "sampled": self.sampled,
+                "mismatches": self.mismatches,
+            }
+
+    def check(
+        self, validator: Type[FieldValidator], value, mode: str = "any"
+    ) -> Optional[str]:
+        """Valida o valor segundo a política e retorna o código do erro."""
+        if self.mode != SAMPLED:
+            with self._lock:
+                self.checked += 1
+            if self.mode == FULL:
+                return validator.check(value, mode)
+            return validator.check_structure(value, mode)
+        error = validator.check_structure(value, mode)
+        with self._lock:
+            self.checked += 1
+            if error is not None:
+                return error
+            # A amostragem conta apenas os valores aprovados na estrutura.
+            position = self._position
+            self._position += 1
+            if position % self.sample_rate:
+                return None
+            self.sampled += 1
+        error = validator.check(value, mode)
+        if error is not None:
+            with self._lock:
+                self.mismatches += 1
+            if not self.reject_mismatches:
+                return None
+        return error
+
+
+def get_policy(
+    policy: Union[str, ValidationPolicy, None],
+    sample_rate: Optional[int] = None,
+) -> Optional[ValidationPolicy]:
+    """
+    Converte o nome de uma política em uma nova instância, com contadores
+    próprios. Instâncias de ``ValidationPolicy`` são devolvidas como estão.
+    """
+    if policy is None or isinstance(policy, ValidationPolicy):
+        if sample_rate is not None:
+            raise ValueError("sample_rate requires the policy name")
+        return policy
+    if sample_rate is not None:
+        return ValidationPolicy(policy, sample_rate)
+    return ValidationPolicy(policy)
+
+
+def context_policy(context: Dict[str, Any]) -> Optional[ValidationPolicy]:
+    """
+    A política informada no contexto de validação. Pelo nome, a instância é
+    criada na primeira consulta e guardada no próprio contexto, de modo que a
+    amostragem e os contadores valem para toda a chamada.
+    """
+    policy = context[POLICY_CONTEXT_KEY]
+    if policy is None or isinstance(policy, ValidationPolicy):
+        return policy
+    instance = context.get(POLICY_INSTANCE_KEY)
+    if instance is None or instance.mode != policy:
+        instance = get_policy(policy)
+        try:
+            context[POLICY_INSTANCE_KEY] = instance
+        except TypeError:
+            pass
+    return instance
@@ -0,0 +1,259 @@
+"""
+Perfil de qualidade de dados para validações em lote, com memória limitada.
+
+    profiler = ValidationProfiler(kind="cpf")
+    for valor, valido, erro in validate_stream(cursor, kind="cpf", profiler=profiler):
+        ...
+    print(profiler.summary())
+
+Os resultados ficam em uma coluna ``array`` de um byte por valor (opcional),
+a contagem de valores distintos em um HyperLogLog e os valores inválidos mais
+frequentes em uma estrutura Space-Saving com ``top_k`` contadores.
+"""
+
+import json
+import math
+from array import array
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .validators.base_validator import INVALID_DATA, INVALID_MASK, NOT_DIGITS, NOT_STR
+
+__all__ = ["HyperLogLog", "TopK", "ValidationProfiler"]
+
+# Índice de cada resultado na coluna de códigos.
+CODES: Tuple[Optional[str], ...] = (
+    None,
+    NOT_STR,
+    INVALID_MASK,
+    NOT_DIGITS,
+    INVALID_DATA,
+)
+CODE_INDEX = {code: index for index, code in enumerate(CODES)}
+
+# Valores inválidos muito longos são truncados no top-k.
+MAX_VALUE_LENGTH = 64
+
+
+def _hash64(key: str) -> int:
+    """Hash estável entre processos, para que perfis possam ser combinados."""
+    return int.from_bytes(
+        blake2b(key.encode("utf-8", "surrogatepass"), digest_size=8).digest(), "big"
+    )
+
+
+class HyperLogLog:
+    """
+    Contagem aproximada de elementos distintos com ``2 ** precision``
+    registradores de um byte (erro padrão de ``1.04 / sqrt(2 ** precision)``).
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+        self._shift = 64 - precision
+        self._mask = (1 << self._shift) - 1
+
+    def add(self, key: str) -> None:
+        hashed = _hash64(key)
+        index = hashed >> self._shift
+        rank = self._shift - (hashed & self._mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = (
+            alpha * size * size / math.fsum(2.0**-rank for rank in self.registers)
+        )
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Correção para cardinalidades pequenas (linear counting).
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+
+class TopK:
+    """
+    Elementos mais frequentes pelo algoritmo Space-Saving com ``k``
+    contadores: cada contagem é no máximo ``error`` acima da real, e todo
+    elemento com frequência acima de ``total / k`` está na lista.
+    """
+
+    def __init__(self, k: int = 20) -> None:
+        if k < 1:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, key: str, count: int = 1) -> None:
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+        elif len(counts) < self.k:
+            counts[key] = count
+            self.errors[key] = 0
+        else:
+            evicted = min(counts, key=counts.__getitem__)
+            floor = counts.pop(evicted)
+            del self.errors[evicted]
+            counts[key] = floor + count
+            self.errors[key] = floor
+
+    def merge(self, other: "TopK") -> None:
+        for key, count in other.counts.items():
+            self.add(key, count)
+            self.errors[key] += other.errors[key]
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Lista de ``(valor, contagem, erro máximo)`` em ordem decrescente."""
+        ranked = sorted(self.counts.items(), key=lambda item: -item[1])[:n]
+        return [(key, count, self.errors[key]) for key, count in ranked]
+
+
+class ValidationProfiler:
+    """
+    Acumula o perfil de uma validação em lote: taxa de falha por código de
+    erro, proporção de valores com e sem máscara, quantidade aproximada de
+    documentos distintos e valores inválidos mais frequentes.
+
+    Com ``keep_codes=False`` apenas os contadores são mantidos e a memória
+    não cresce com a entrada; caso contrário o resultado de cada valor fica
+    em ``codes`` (um byte por valor, índice em ``CODES``).
+    """
+
+    def __init__(
+        self,
+        kind: Optional[str] = None,
+        top_k: int = 20,
+        precision: int = 14,
+        keep_codes: bool = True,
+    ) -> None:
+        self.kind = kind
+        self.codes: Optional[array] = array("B") if keep_codes else None
+        self.counts = [0] * len(CODES)
+        self.masked = 0
+        self.unmasked = 0
+        self.distinct = HyperLogLog(precision)
+        self.invalid = TopK(top_k)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, values: Sequence, errors: Sequence[Optional[str]]) -> None:
+        """Registra um bloco de valores e os códigos de erro correspondentes."""
+        indexes = bytes(map(CODE_INDEX.__getitem__, errors))
+        if self.codes is not None:
+            self.codes.frombytes(indexes)
+        counts = self.counts
+        for index in range(len(CODES)):
+            counts[index] += indexes.count(index)
+        # HyperLogLog.add expandido no laço, que roda uma vez por valor.
+        sketch = self.distinct
+        registers, shift, mask = sketch.registers, sketch._shift, sketch._mask
+        add_invalid = self.invalid.add
+        masked = unmasked = 0
+        for value, index in zip(values, indexes):
+            if isinstance(value, str):
+                stripped = value.replace(".", "").replace("-", "").replace("/", "")
+                if len(stripped) == len(value):
+                    unmasked += 1
+                else:
+                    masked += 1
+                hashed = _hash64(stripped.upper())
+                key = value
+            else:
+                key = repr(value)
+                hashed = _hash64(f"\0{type(value).__name__}:{key}")
+            slot = hashed >> shift
+            rank = shift - (hashed & mask).bit_length() + 1
+            if rank > registers[slot]:
+                registers[slot] = rank
+            if index:
+                add_invalid(key[:MAX_VALUE_LENGTH])
+        self.masked += masked
+        self.unmasked += unmasked
+
+    def merge(self, other: "ValidationProfiler") -> None:
+        """Combina o perfil de outro lote (por exemplo, de outro processo)."""
+        if self.codes is not None:
+            if other.codes is None:
+                raise ValueError("cannot merge a profiler without codes")
+            self.codes.extend(other.codes)
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.masked += other.masked
+        self.unmasked += other.unmasked
+        self.distinct.merge(other.distinct)
+        self.invalid.merge(other.invalid)
+
+    def errors(self) -> List[Optional[str]]:
+        """Reconstrói a lista de códigos de erro a partir da coluna ``codes``."""
+        if self.codes is None:
+            raise ValueError("codes are not kept (keep_codes=False)")
+        return [CODES[index] for index in self.codes]
+
+    def report(self) -> Dict[str, Any]:
+        total = self.total
+        strings = self.masked + self.unmasked
+        return {
+            "kind": self.kind,
+            "total": total,
+            "valid": self.counts[0],
+            "invalid": total - self.counts[0],
+            "failure_rate": _rate(total - self.counts[0], total),
+            "errors": {
+                code: {"count": count, "rate": _rate(count, total)}
+                for code, count in zip(CODES[1:], self.counts[1:])
+            },
+            "masked": {"count": self.masked, "rate": _rate(self.masked, strings)},
+            "unmasked": {"count": self.unmasked, "rate": _rate(self.unmasked, strings)},
+            "distinct": self.distinct.count(),
+            "top_invalid": [
+                {"value": value, "count": count, "error": error}
+                for value, count, error in self.invalid.most_common()
+            ],
+        }
+
+    def to_json(self, **options) -> str:
+        return json.dumps(self.report(), ensure_ascii=False, **options)
+
+    def summary(self) -> str:
+        """Resumo em texto do relatório."""
+        report = self.report()
+        title = "Perfil de validação"
+        if report["kind"]:
+            title += f" ({report['kind']})"
+        lines = [
+            title,
+            f"  total: {report['total']}",
+            f"  válidos: {report['valid']}",
+            f"  inválidos: {report['invalid']} ({report['failure_rate']:.2%})",
+        ]
+        for code, error in report["errors"].items():
+            lines.append(f"    {code}: {error['count']} ({error['rate']:.2%})")
+        lines += [
+            f"  com máscara: {report['masked']['count']} "
+            f"({report['masked']['rate']:.2%})",
+            f"  sem máscara: {report['unmasked']['count']} "
+            f"({report['unmasked']['rate']:.2%})",
+            f"  distintos (aprox.): {report['distinct']}",
+        ]
+        if report["top_invalid"]:
+            lines.append("  inválidos mais frequentes:")
+            for item in report["top_invalid"]:
+                lines.append(f"    {item['value']!r}: {item['count']}")
+        return "\n".join(lines)
+
+
+def _rate(count: int, total: int) -> float:
+    return count / total if total else 0.0
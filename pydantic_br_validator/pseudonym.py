@@ -0,0 +1,295 @@
+"""
+Pseudonimização determinística de CPF e CNPJ que preserva o formato.
+
+Cada documento é trocado por outro documento válido, sempre o mesmo para a
+mesma chave: a base (9 dígitos do CPF, raiz de 8 caracteres do CNPJ) passa
+por uma permutação com chave (rede de Feistel sobre os algarismos, como no
+FF1) e os dígitos verificadores são recalculados. Separadores e posições da
+entrada são mantidos, então ``"123.456.789-09"`` vira outro CPF com máscara e
+``"12345678909"`` outro CPF só com dígitos.
+
+No CNPJ apenas a raiz é trocada: filiais da mesma empresa continuam com a
+mesma raiz entre si, e a ordem da filial é mantida. Raízes numéricas geram
+raízes numéricas e raízes alfanuméricas geram raízes alfanuméricas.
+"""
+
+import hashlib
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .fields.base_field_v2 import raise_field_error
+from .validators import cnpj_engine
+from .validators.cnpj_validator import CNPJValidator
+from .validators.cpf_or_cnpj_validator import detect_document
+from .validators.cpf_validator import CPFValidator
+
+__all__ = ["Pseudonymizer"]
+
+ROUNDS = 10
+# Metades com até este número de valores usam tabelas pré-calculadas por
+# rodada; as demais (raízes alfanuméricas) calculam a função a cada chamada.
+TABLE_LIMIT = 1 << 17
+
+KINDS = ("cpf", "cnpj", "cpf_or_cnpj")
+ON_INVALID = ("raise", "keep", "null")
+
+DIGITS = frozenset("0123456789")
+ALPHANUMERIC = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+BASE36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Bases de CPF com todos os dígitos iguais geram CPFs rejeitados.
+REPEATED_CPF_BASES = frozenset(digit * 111_111_111 for digit in range(10))
+
+CPF_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+CPF_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3)
+CPF_LOW_SIZE = 100_000
+
+
+def _weighted_sums(weights) -> bytes:
+    """Soma ponderada (módulo 11) dos algarismos de cada número de 0 a 10**n - 1."""
+    table = [0]
+    for weight in weights:
+        table = [
+            (total + weight * digit) % 11 for total in table for digit in range(10)
+        ]
+    return bytes(table)
+
+
+# Os dígitos verificadores saem de duas consultas por soma: os 4 primeiros
+# algarismos da base e os 5 últimos.
+_CPF_FIRST_HIGH = _weighted_sums(CPF_FIRST_WEIGHTS[:4])
+_CPF_FIRST_LOW = _weighted_sums(CPF_FIRST_WEIGHTS[4:])
+_CPF_SECOND_HIGH = _weighted_sums(CPF_SECOND_WEIGHTS[:4])
+_CPF_SECOND_LOW = _weighted_sums(CPF_SECOND_WEIGHTS[4:])
+
+
+class _FeistelPermutation:
+    """
+    Permutação com chave dos inteiros em ``[0, radix ** length)``, tratados
+    como ``length`` algarismos divididos em duas metades que se alternam.
+    """
+
+    def __init__(self, key: bytes, tweak: bytes, radix: int, length: int, rounds: int):
+        left = length // 2
+        self.left_size = radix**left
+        self.right_size = radix ** (length - left)
+        prefix = len(key).to_bytes(2, "big") + key + tweak
+        self._rounds = []
+        for round_ in range(rounds):
+            # Rodadas pares somam sobre a metade esquerda usando a direita
+            # como entrada; as ímpares fazem o contrário.
+            if round_ % 2 == 0:
+                inputs, modulus = self.right_size, self.left_size
+            else:
+                inputs, modulus = self.left_size, self.right_size
+            seed = prefix + bytes([round_])
+            if inputs <= TABLE_LIMIT:
+                function = self._table(seed, inputs).__getitem__
+            else:
+                function = self._hasher(seed)
+            self._rounds.append((function, modulus))
+
+    @staticmethod
+    def _table(seed: bytes, size: int) -> array:
+        table = array("I")
+        table.frombytes(hashlib.shake_256(seed).digest(4 * size))
+        if sys.byteorder == "big":
+            table.byteswap()
+        return table
+
+    @staticmethod
+    def _hasher(seed: bytes) -> Callable[[int], int]:
+        base = hashlib.shake_256(seed)
+
+        def function(value: int) -> int:
+            state = base.copy()
+            state.update(value.to_bytes(8, "little"))
+            return int.from_bytes(state.digest(4), "little")
+
+        return function
+
+    def encrypt(self, value: int) -> int:
+        left, right = divmod(value, self.right_size)
+        for function, modulus in self._rounds:
+            left, right = right, (left + function(right)) % modulus
+        return left * self.right_size + right
+
+
+class Pseudonymizer:
+    """
+    Troca CPFs e CNPJs por pseudônimos válidos, estáveis para a mesma chave.
+
+    A mesma chave gera sempre os mesmos pseudônimos, inclusive entre
+    processos, então uma base pode ser anonimizada em partes ou em paralelo
+    (um processo por partição) mantendo as referências entre tabelas.
+    """
+
+    def __init__(self, key: Union[str, bytes], rounds: int = ROUNDS) -> None:
+        if isinstance(key, str):
+            key = key.encode()
+        if not key:
+            raise ValueError("key must not be empty")
+        if rounds < 2 or rounds % 2:
+            raise ValueError("rounds must be a positive even number")
+        self._cpf = _FeistelPermutation(key, b"cpf", 10, 9, rounds)
+        self._cnpj_numeric = _FeistelPermutation(key, b"cnpj", 10, 8, rounds)
+        self._cnpj_alphanumeric = _FeistelPermutation(key, b"cnpj36", 36, 8, rounds)
+
+    def cpf(self, value: str) -> str:
+        """Pseudônimo de um CPF válido (com ou sem máscara)."""
+        error = CPFValidator.check(value)
+        if error is not None:
+            raise_field_error(error)
+        digits = value.replace(".", "").replace("-", "")
+        if len(digits) != 11 or not digits.isdigit():
+            digits = "".join(char for char in value if char in DIGITS)
+        base = self._cpf.encrypt(int(digits[:9]))
+        # Cycle walking: reaplica a permutação até sair das bases proibidas,
+        # o que mantém o mapeamento injetivo dentro das bases válidas.
+        while base in REPEATED_CPF_BASES:
+            base = self._cpf.encrypt(base)
+        new_digits = f"{base:09d}{_cpf_check_digits(base):02d}"
+        if len(value) == 11:
+            return new_digits
+        if (
+            len(value) == 14
+            and value[3] == "."
+            and value[7] == "."
+            and value[11] == "-"
+        ):
+            d = new_digits
+            return f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+        return _render(value, new_digits, DIGITS)
+
+    def cnpj(self, value: str) -> str:
+        """Pseudônimo de um CNPJ válido numérico ou alfanumérico."""
+        error = CNPJValidator.check(value)
+        if error is not None:
+            raise_field_error(error)
+        cnpj = cnpj_engine.strip_separators(value).upper()
+        if len(cnpj) != 14 or not cnpj.isalnum():
+            cnpj = "".join(char for char in value if char in ALPHANUMERIC).upper()
+        root = cnpj[: cnpj_engine.ROOT_SIZE]
+        if root.isdigit():
+            new_root = f"{self._cnpj_numeric.encrypt(int(root)):08d}"
+        else:
+            number = self._cnpj_alphanumeric.encrypt(int(root, 36))
+            new_root = _base36(number)
+            while new_root.isdigit():
+                number = self._cnpj_alphanumeric.encrypt(number)
+                new_root = _base36(number)
+        base = new_root + cnpj[cnpj_engine.ROOT_SIZE : 12]
+        new_cnpj = base + cnpj_engine.check_digits(base)
+        if len(value) == 14:
+            return new_cnpj
+        if (
+            len(value) == 18
+            and value[2] == "."
+            and value[6] == "."
+            and value[10] == "/"
+        ):
+            c = new_cnpj
+            return f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}"
+        return _render(value, new_cnpj, ALPHANUMERIC)
+
+    def pseudonymize(self, value: str, kind: str = "cpf_or_cnpj") -> str:
+        """Pseudônimo de um documento do tipo ``kind`` (cpf, cnpj ou cpf_or_cnpj)."""
+        return self._function(kind)(value)
+
+    def pseudonymize_many(
+        self,
+        values: Iterable,
+        kind: str = "cpf_or_cnpj",
+        on_invalid: str = "raise",
+    ) -> List[Optional[str]]:
+        """
+        Pseudonimiza um lote; valores repetidos são calculados uma única vez.
+
+        ``on_invalid`` define o que fazer com documentos inválidos: "raise"
+        (padrão) lança o erro de validação, "keep" mantém o valor original e
+        "null" o troca por None.
+        """
+        function = self._function(kind, on_invalid)
+        seen: Dict[Any, Optional[str]] = {}
+        results: List[Optional[str]] = []
+        for value in values:
+            try:
+                result = seen[value]
+            except KeyError:
+                result = seen[value] = function(value)
+            except TypeError:
+                result = function(value)
+            results.append(result)
+        return results
+
+    def pseudonymize_stream(
+        self,
+        iterable: Iterable,
+        kind: str = "cpf_or_cnpj",
+        on_invalid: str = "raise",
+    ) -> Iterator[Optional[str]]:
+        """
+        Pseudonimiza valores de qualquer iterável (cursor de banco, arquivo)
+        sem materializar a entrada; a memória usada é constante.
+        """
+        return map(self._function(kind, on_invalid), iterable)
+
+    def _function(self, kind: str, on_invalid: str = "raise") -> Callable:
+        if kind == "cpf":
+            function = self.cpf
+        elif kind == "cnpj":
+            function = self.cnpj
+        elif kind == "cpf_or_cnpj":
+            function = self._cpf_or_cnpj
+        else:
+            raise ValueError(f"unknown document kind {kind!r}, expected one of {KINDS}")
+        if on_invalid not in ON_INVALID:
+            raise ValueError(
+                f"unknown on_invalid {on_invalid!r}, expected one of {ON_INVALID}"
+            )
+        if on_invalid == "raise":
+            return function
+
+        def tolerant(value):
+            try:
+                return function(value)
+            except ValueError:
+                return value if on_invalid == "keep" else None
+
+        return tolerant
+
+    def _cpf_or_cnpj(self, value: str) -> str:
+        document = detect_document(value)
+        if document.kind == "cnpj":
+            return self.cnpj(value)
+        if document.kind == "cpf":
+            return self.cpf(value)
+        raise_field_error(document.error)
+
+
+def _cpf_check_digits(base: int) -> int:
+    high, low = divmod(base, CPF_LOW_SIZE)
+    first_digit = (_CPF_FIRST_HIGH[high] + _CPF_FIRST_LOW[low]) * 10 % 11 % 10
+    second_sum = _CPF_SECOND_HIGH[high] + _CPF_SECOND_LOW[low] + first_digit * 2
+    return first_digit * 10 + second_sum * 10 % 11 % 10
+
+
+def _base36(number: int) -> str:
+    chars = []
+    for _ in range(cnpj_engine.ROOT_SIZE):
+        number, remainder = divmod(number, 36)
+        chars.append(BASE36[remainder])
+    return "".join(reversed(chars))
+
+
+def _render(value: str, chars: str, replaceable: frozenset) -> str:
+    """Escreve ``chars`` nas posições de ``value`` ocupadas por ``replaceable``."""
+    if len(value) == len(chars):
+        return chars
+    replacements = iter(chars)
+    return "".join(
+        next(replacements) if char in replaceable else char for char in value
+    )
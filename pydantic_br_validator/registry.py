@@ -0,0 +1,210 @@
+"""
+Consulta assíncrona da situação cadastral de CNPJs em um serviço de registro.
+
+O dígito verificador só diz se o número é bem formado; este cliente pergunta a
+um endpoint configurável se a empresa está ativa. O protocolo esperado é::
+
+    POST <base_url><lookup_path>   {"cnpjs": ["47895328000187", ...]}
+    200 {"results": {"47895328000187": {"status": "ATIVA", ...}, ...}}
+
+CNPJs ausentes de ``results`` são tratados como não encontrados. Um servidor
+local compatível, para testes sem rede, está em
+``pydantic_br_validator.stubs.RegistryStubServer``.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from ._http import ConnectionPool
+from ._lru import LRUCache
+from .fields.base_field_v2 import raise_field_error
+from .validators import cnpj_engine
+from .validators.cnpj_validator import CNPJValidator
+
+__all__ = [
+    "CNPJRegistryClient",
+    "RateLimiter",
+    "RegistrationStatus",
+    "RegistryError",
+]
+
+ACTIVE_STATUS = "ATIVA"
+
+
+class RegistryError(Exception):
+    """Falha ao consultar o serviço de registro."""
+
+
+class RegistrationStatus(NamedTuple):
+    cnpj: str
+    status: Optional[str]
+    data: Dict[str, Any]
+
+    @property
+    def found(self) -> bool:
+        return self.status is not None
+
+    @property
+    def active(self) -> bool:
+        active = self.data.get("active")
+        if isinstance(active, bool):
+            return active
+        return self.status is not None and self.status.upper() == ACTIVE_STATUS
+
+
+class RateLimiter:
+    """Limitador token bucket: até ``rate`` aquisições por segundo."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = self.clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CNPJRegistryClient:
+    """
+    Cliente assíncrono de situação cadastral com pool de conexões.
+
+    Consultas simultâneas do mesmo CNPJ compartilham uma única requisição,
+    CNPJs distintos são agrupados em lotes de até ``batch_size`` (aguardando
+    no máximo ``batch_delay`` segundos), as requisições respeitam
+    ``rate_limit`` por segundo e os resultados ficam em cache por ``ttl``
+    segundos.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        lookup_path: str = "/cnpj/lookup",
+        max_connections: int = 10,
+        batch_size: int = 100,
+        batch_delay: float = 0.005,
+        rate_limit: Optional[float] = None,
+        ttl: Optional[float] = 3600.0,
+        cache_size: int = 100_000,
+        timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lookup_path = lookup_path
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.requests = 0
+        self.pool = ConnectionPool(base_url, max_connections, timeout)
+        self.cache = LRUCache(cache_size, ttl, clock)
+        self.rate_limiter = RateLimiter(rate_limit, clock=clock) if rate_limit else None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending: List[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: "set[asyncio.Task]" = set()
+
+    async def __aenter__(self) -> "CNPJRegistryClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.pool.close()
+
+    async def lookup(self, cnpj: str) -> RegistrationStatus:
+        """Consulta a situação de um CNPJ (com ou sem máscara)."""
+        error = CNPJValidator.check(cnpj)
+        if error is not None:
+            raise_field_error(error)
+        key = cnpj_engine.strip_separators(cnpj).upper()
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._enqueue(key)
+        return await asyncio.shield(future)
+
+    async def lookup_many(self, cnpjs: Iterable[str]) -> List[RegistrationStatus]:
+        """Consulta vários CNPJs; os resultados seguem a ordem de entrada."""
+        return list(await asyncio.gather(*(self.lookup(cnpj) for cnpj in cnpjs)))
+
+    def _enqueue(self, key: str) -> None:
+        self._pending.append(key)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.batch_delay, self._flush)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            keys = self._pending[: self.batch_size]
+            del self._pending[: self.batch_size]
+            task = asyncio.ensure_future(self._send(keys))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, keys: List[str]) -> None:
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            self.requests += 1
+            status, body = await self.pool.request(
+                "POST", self.lookup_path, {"cnpjs": keys}
+            )
+            if status != 200 or not isinstance(body, dict):
+                raise RegistryError(f"registry responded with HTTP {status}")
+            results = body.get("results") or {}
+            if not isinstance(results, dict):
+                raise RegistryError("registry responded with malformed results")
+            statuses = []
+            for key in keys:
+                data = results.get(key)
+                if isinstance(data, dict):
+                    statuses.append(RegistrationStatus(key, data.get("status"), data))
+                else:
+                    statuses.append(RegistrationStatus(key, None, {}))
+        except Exception as exc:
+            if not isinstance(exc, RegistryError):
+                exc = RegistryError(f"registry lookup failed: {exc!r}")
+            for key in keys:
+                future = self._inflight.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, result in zip(keys, statuses):
+            self.cache.set(key, result)
+            future = self._inflight.pop(key)
+            if not future.done():
+                future.set_result(result)
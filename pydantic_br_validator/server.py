@@ -0,0 +1,287 @@
+"""
+Serviço HTTP local de validação (sidecar), apenas com a biblioteca padrão.
+
+    python -m pydantic_br_validator serve --port 8080
+
+Rotas:
+    GET  /validate/<tipo>?value=...&mode=any   valida um documento
+    POST /validate/<tipo>  {"values": [...], "mode": "any"}   valida um lote
+    POST /typeahead/<tipo> {"input": "...", "state": ...}     validação incremental
+    GET  /stats                                 contadores de vazão e latência
+    GET  /health
+
+Requisições unitárias simultâneas do mesmo tipo e modo são agrupadas em uma
+única chamada de validação em lote.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from ._http import REASONS, HTTPError, Request, encode_response, read_request
+from .batch import VALIDATORS, get_validator, validate_batch
+from .typeahead import TYPEAHEAD, TypeaheadState, feed, start
+
+__all__ = ["Coalescer", "ValidationServer", "serve"]
+
+LATENCY_SAMPLES = 10_000
+
+
+class Coalescer:
+    """
+    Agrupa validações unitárias pendentes por tipo e modo e as resolve com um
+    único ``check_many`` quando o lote enche ou após ``max_delay`` segundos.
+    """
+
+    def __init__(self, max_batch: int = 256, max_delay: float = 0.001) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.documents = 0
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+
+    def submit(self, kind: str, mode: str, value: str) -> "asyncio.Future":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (kind, mode)
+        pending = self._pending.setdefault(key, [])
+        pending.append((value, future))
+        if len(pending) >= self.max_batch:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+        return future
+
+    def _flush(self, key: Tuple[str, str]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(key, [])
+        if not pending:
+            return
+        kind, mode = key
+        self.batches += 1
+        self.documents += len(pending)
+        try:
+            errors = get_validator(kind).check_many([v for v, _ in pending], mode)
+        except Exception as exc:  # pragma: no cover - falha inesperada do validador
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), error in zip(pending, errors):
+            if not future.done():
+                future.set_result(error)
+
+
+class ServerStats:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.requests = 0
+        self.documents = 0
+        self.errors = 0
+        self.connections = 0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, documents: int, latency: float) -> None:
+        self.requests += 1
+        self.documents += documents
+        self.latencies.append(latency)
+
+    def snapshot(self, coalescer: Coalescer) -> Dict:
+        uptime = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(fraction * len(latencies)))
+            return round(latencies[index] * 1000, 3)
+
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "requests": self.requests,
+            "documents": self.documents,
+            "errors": self.errors,
+            "connections": self.connections,
+            "requests_per_second": round(self.requests / uptime, 3),
+            "documents_per_second": round(self.documents / uptime, 3),
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p90": percentile(0.9),
+                "p99": percentile(0.99),
+                "max": percentile(1.0),
+            },
+            "coalesced_batches": coalescer.batches,
+            "coalesced_documents": coalescer.documents,
+        }
+
+
+class ValidationServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_batch: int = 256,
+        max_delay: float = 0.001,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.coalescer = Coalescer(max_batch, max_delay)
+        self.stats = ServerStats()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> Tuple[str, int]:
+        """Inicia o servidor e retorna o endereço efetivo (útil com porta 0)."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as exc:
+                    self.stats.errors += 1
+                    writer.write(
+                        encode_response(exc.status, {"error": str(exc)}, False)
+                    )
+                    break
+                if request is None:
+                    break
+                start = time.perf_counter()
+                try:
+                    status, payload, documents = await self._dispatch(request)
+                except HTTPError as exc:
+                    status, payload, documents = exc.status, {"error": str(exc)}, 0
+                    self.stats.errors += 1
+                except Exception:
+                    # Uma falha inesperada responde 500 em vez de derrubar a
+                    # conexão sem resposta.
+                    status, payload, documents = 500, {"error": REASONS[500]}, 0
+                    self.stats.errors += 1
+                self.stats.record(documents, time.perf_counter() - start)
+                writer.write(encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Request) -> Tuple[int, object, int]:
+        if request.path == "/health":
+            return 200, {"status": "ok"}, 0
+        if request.path == "/stats":
+            return 200, self.stats.snapshot(self.coalescer), 0
+
+        prefix, _, kind = request.path.rpartition("/")
+        if prefix == "/typeahead":
+            return self._typeahead(kind, request)
+        if prefix != "/validate":
+            raise HTTPError(404)
+        if kind not in VALIDATORS:
+            raise HTTPError(404, f"unknown document kind {kind!r}")
+
+        if request.method == "GET":
+            mode = self._mode(kind, request.query.get("mode", "any"))
+            value = request.query.get("value")
+            if value is None:
+                raise HTTPError(400, "missing 'value' parameter")
+            error = await self.coalescer.submit(kind, mode, value)
+            return 200, {"value": value, "valid": error is None, "error": error}, 1
+
+        if request.method == "POST":
+            body = request.json()
+            if not isinstance(body, dict) or not isinstance(body.get("values"), list):
+                raise HTTPError(400, "expected a JSON object with a 'values' list")
+            mode = self._mode(kind, body.get("mode", "any"))
+            values = body["values"]
+            if len(values) > self.coalescer.max_batch:
+                # Lotes grandes saem do loop para não atrasar as demais conexões.
+                errors = await asyncio.get_running_loop().run_in_executor(
+                    None, validate_batch, values, kind, mode
+                )
+            else:
+                errors = validate_batch(values, kind, mode)
+            results = [{"valid": error is None, "error": error} for error in errors]
+            return 200, {"results": results}, len(results)
+
+        raise HTTPError(405)
+
+    def _typeahead(self, kind: str, request: Request) -> Tuple[int, object, int]:
+        """
+        Validação incremental sem sessão: o cliente envia o estado anterior
+        (ou nada, no primeiro caractere) e os caracteres digitados desde então.
+        """
+        if kind not in TYPEAHEAD:
+            raise HTTPError(404, f"unknown document kind {kind!r}")
+        if request.method != "POST":
+            raise HTTPError(405)
+        body = request.json()
+        if not isinstance(body, dict) or not isinstance(body.get("input"), str):
+            raise HTTPError(400, "expected a JSON object with an 'input' string")
+        if body.get("state") is None:
+            state = start(kind, self._mode(kind, body.get("mode", "any")))
+        else:
+            try:
+                state = TypeaheadState.loads(body["state"])
+            except ValueError as exc:
+                raise HTTPError(400, str(exc)) from None
+            if state.kind != kind:
+                raise HTTPError(400, f"state is not a {kind!r} state")
+        state = feed(state, body["input"])
+        payload = {
+            "status": state.status,
+            "error": state.error,
+            "expected": state.expected,
+            "state": state.dumps(),
+        }
+        return 200, payload, 1
+
+    @staticmethod
+    def _mode(kind: str, mode: str) -> str:
+        try:
+            get_validator(kind, mode)
+        except ValueError as exc:
+            raise HTTPError(400, str(exc)) from None
+        return mode
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    max_batch: int = 256,
+    max_delay: float = 0.001,
+) -> None:
+    """Executa o servidor até ser interrompido."""
+    server = ValidationServer(host, port, max_batch, max_delay)
+
+    async def run() -> None:
+        address = await server.start()
+        print(f"pydantic-br-validator serving on http://{address[0]}:{address[1]}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,207 @@
+"""
+Tipos de coluna do SQLAlchemy que guardam CPF e CNPJ como inteiros.
+
+    from pydantic_br_validator.sqlalchemy_types import CNPJType, CPFType
+
+    clientes = Table(
+        "clientes",
+        metadata,
+        Column("cpf", CPFType(masked=True)),  # BIGINT; lido como "041.200.390-21"
+        Column("cnpj", CNPJType()),  # BIGINT; lido como "47895328000187"
+    )
+
+O documento é validado ao ser gravado (o erro é o mesmo dos campos) e volta
+como texto, com ou sem máscara, ao ser lido. O CPF é guardado com os seus 11
+dígitos. O CNPJ numérico também; o alfanumérico guarda apenas a base de 12
+caracteres em base 36, somada a ``ALPHANUMERIC_CNPJ_OFFSET``, e os dígitos
+verificadores são recalculados na leitura.
+
+Requer o SQLAlchemy (``pip install sqlalchemy``).
+"""
+
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+try:
+    from sqlalchemy import BigInteger, bindparam
+    from sqlalchemy.types import TypeDecorator
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "pydantic_br_validator.sqlalchemy_types requires SQLAlchemy "
+        "(pip install sqlalchemy)"
+    ) from error
+
+from .fields.base_field_v2 import raise_field_error
+from .validators import cnpj_engine
+from .validators.base_validator import FieldValidator
+from .validators.cnpj_validator import CNPJValidator
+from .validators.cpf_validator import CPFValidator
+
+__all__ = [
+    "ALPHANUMERIC_CNPJ_OFFSET",
+    "CNPJType",
+    "CPFType",
+    "DocumentType",
+    "decode_cnpj",
+    "decode_cpf",
+    "encode_cnpj",
+    "encode_cpf",
+    "insert_many",
+]
+
+# CNPJs numéricos ficam abaixo de 10**14; os alfanuméricos, a partir daqui
+# (36**12 + 10**14 ainda cabe em um BIGINT com sinal).
+ALPHANUMERIC_CNPJ_OFFSET = 10**14
+
+NON_DIGITS = re.compile("[^0-9]")
+
+
+def encode_cpf(value: str) -> int:
+    """Valida o CPF (com ou sem máscara) e retorna os 11 dígitos como inteiro."""
+    error = CPFValidator.check(value)
+    if error is not None:
+        raise_field_error(error)
+    return _cpf_number(value)
+
+
+def _cpf_number(value: str) -> int:
+    if len(value) == 11 and value.isascii():
+        return int(value)
+    return int(NON_DIGITS.sub("", value))
+
+
+def decode_cpf(number: int, masked: bool = False) -> str:
+    cpf = f"{number:011d}"
+    if masked:
+        return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+    return cpf
+
+
+def encode_cnpj(value: str) -> int:
+    """Valida o CNPJ (numérico ou alfanumérico) e retorna a sua chave inteira."""
+    error = CNPJValidator.check(value)
+    if error is not None:
+        raise_field_error(error)
+    return _cnpj_number(value)
+
+
+def _cnpj_number(value: str) -> int:
+    cnpj = CNPJValidator._normalize(value) if value.isascii() else None
+    if cnpj is None:
+        raise_field_error("invalid_data")
+    if cnpj.isdigit():
+        return int(cnpj)
+    return ALPHANUMERIC_CNPJ_OFFSET + int(cnpj[:12], 36)
+
+
+def decode_cnpj(number: int, masked: bool = False) -> str:
+    if number < ALPHANUMERIC_CNPJ_OFFSET:
+        cnpj = f"{number:014d}"
+    else:
+        base = _base36(number - ALPHANUMERIC_CNPJ_OFFSET).rjust(12, "0")
+        cnpj = base + cnpj_engine.check_digits(base)
+    if masked:
+        return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+    return cnpj
+
+
+def _base36(number: int) -> str:
+    chars = []
+    while number:
+        number, digit = divmod(number, 36)
+        chars.append("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"[digit])
+    return "".join(reversed(chars))
+
+
+class DocumentType(TypeDecorator):
+    """
+    Base dos tipos de documento: valida e converte para inteiro ao gravar e
+    devolve o texto ao ler, com máscara se ``masked=True``.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    # Definidos pelas subclasses: o validador e as conversões de e para
+    # inteiro, como ``staticmethod``.
+    Validator: FieldValidator
+    _encode: Callable[[str], int]
+    _decode: Callable[[int, bool], str]
+
+    def __init__(self, masked: bool = False) -> None:
+        super().__init__()
+        self.masked = masked
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        error = self.Validator.check(value)
+        if error is not None:
+            raise_field_error(error)
+        return self._encode(value)
+
+    def process_literal_param(self, value: Optional[str], dialect) -> str:
+        number = self.process_bind_param(value, dialect)
+        return "NULL" if number is None else str(number)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self._decode(value, self.masked)
+
+    def encode_many(self, values: Iterable[Optional[str]]) -> List[Optional[int]]:
+        """
+        Valida e converte um lote de uma vez com ``check_many`` (no CNPJ, com
+        as somas da raiz compartilhadas entre filiais). ``None`` é mantido.
+        """
+        values = values if isinstance(values, list) else list(values)
+        present = [value for value in values if value is not None]
+        for error in self.Validator.check_many(present):
+            if error is not None:
+                raise_field_error(error)
+        encode = self._encode
+        return [None if value is None else encode(value) for value in values]
+
+
+class CPFType(DocumentType):
+    """CPF guardado como BIGINT com os 11 dígitos."""
+
+    Validator = CPFValidator
+    cache_ok = True
+    _encode = staticmethod(_cpf_number)
+    _decode = staticmethod(decode_cpf)
+
+
+class CNPJType(DocumentType):
+    """CNPJ numérico ou alfanumérico guardado como BIGINT."""
+
+    Validator = CNPJValidator
+    cache_ok = True
+    _encode = staticmethod(_cnpj_number)
+    _decode = staticmethod(decode_cnpj)
+
+
+def insert_many(connection, table, rows: Sequence[Mapping[str, Any]]):
+    """
+    Insere várias linhas com um único ``executemany``, convertendo cada
+    coluna de documento em uma só passagem pelo lote (``encode_many``) em vez
+    de uma conversão por parâmetro.
+    """
+    rows = [dict(row) for row in rows]
+    binds: Dict[str, Any] = {}
+    for column in table.columns:
+        if isinstance(column.type, DocumentType) and rows and column.key in rows[0]:
+            encoded = column.type.encode_many([row[column.key] for row in rows])
+            for row, number in zip(rows, encoded):
+                row[column.key] = number
+            binds[column.key] = bindparam(column.key, type_=BigInteger())
+    return connection.execute(table.insert().values(binds), rows)
@@ -0,0 +1,95 @@
+"""
+Servidores HTTP locais que imitam serviços externos, para testar os clientes
+de enriquecimento sem acesso à rede.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._http import HTTPError, HTTPStubServer, Request
+
+__all__ = ["CEPStubServer", "RegistryStubServer"]
+
+
+class RegistryStubServer(HTTPStubServer):
+    """
+    Imita o serviço de situação cadastral usado por ``CNPJRegistryClient``.
+
+    Args:
+        statuses: situação de cada CNPJ (14 caracteres, sem máscara).
+        latency: atraso artificial de cada resposta, em segundos.
+        fail_with: status HTTP a responder em todas as requisições.
+    """
+
+    def __init__(
+        self,
+        statuses: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+        fail_with: Optional[int] = None,
+        lookup_path: str = "/cnpj/lookup",
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.statuses = dict(statuses or {})
+        self.latency = latency
+        self.fail_with = fail_with
+        self.lookup_path = lookup_path
+        self.batches: List[List[str]] = []
+
+    async def handle(self, request: Request) -> Tuple[int, Any]:
+        if request.path != self.lookup_path:
+            raise HTTPError(404)
+        if request.method != "POST":
+            raise HTTPError(405)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_with is not None:
+            raise HTTPError(self.fail_with)
+        cnpjs = request.json().get("cnpjs", [])
+        self.batches.append(cnpjs)
+        results = {
+            cnpj: {"status": self.statuses[cnpj]}
+            for cnpj in cnpjs
+            if cnpj in self.statuses
+        }
+        return 200, {"results": results}
+
+
+class CEPStubServer(HTTPStubServer):
+    """
+    Imita um serviço de CEP no formato ``GET /cep/<cep>`` usado por
+    ``HTTPUpstream``: responde 200 com o endereço ou 404.
+
+    Args:
+        addresses: endereço de cada CEP (8 dígitos, sem máscara).
+        latency: atraso artificial de cada resposta, em segundos.
+    """
+
+    def __init__(
+        self,
+        addresses: Optional[Dict[str, Dict[str, Any]]] = None,
+        latency: float = 0.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.addresses = dict(addresses or {})
+        self.latency = latency
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, request: Request) -> Tuple[int, Any]:
+        prefix, _, cep = request.path.rpartition("/")
+        if prefix != "/cep":
+            raise HTTPError(404)
+        if request.method != "GET":
+            raise HTTPError(405)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        if cep not in self.addresses:
+            raise HTTPError(404, "CEP not found")
+        return 200, self.addresses[cep]
@@ -0,0 +1,302 @@
+"""
+Validação incremental de CPF, CNPJ e CEP, caractere a caractere (digitação).
+
+    state = start("cpf", mode="mask")
+    state = feed(state, "364.912.850-")
+    state.status  # "incomplete"
+    state.expected  # "06"
+    feed(state, "06").status  # "complete_valid"
+
+O estado guarda apenas as somas ponderadas parciais, a posição na máscara e o
+primeiro erro encontrado, então cada caractere custa O(1) e nada é revalidado.
+Ele é uma tupla imutável que pode ser enviada ao cliente e devolvida na
+próxima requisição (``dumps``/``loads``), sem guardar sessão no servidor.
+
+Quando o documento está completo, ``state.error`` é o mesmo código de
+``Validator.check`` para o texto digitado.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, NamedTuple, Optional, Tuple, Type, Union
+
+from .validators.base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    MODES,
+    NOT_DIGITS,
+    NOT_STR,
+)
+from .validators.cnpj_engine import (
+    CHAR_VALUES,
+    FIRST_WEIGHTS,
+    INVALID_CHAR,
+    SECOND_WEIGHTS,
+)
+
+__all__ = [
+    "COMPLETE_INVALID",
+    "COMPLETE_VALID",
+    "INCOMPLETE",
+    "INVALID_SO_FAR",
+    "TYPEAHEAD",
+    "CEPTypeahead",
+    "CNPJTypeahead",
+    "CPFTypeahead",
+    "TypeaheadState",
+    "TypeaheadValidator",
+    "feed",
+    "start",
+]
+
+INCOMPLETE = "incomplete"
+INVALID_SO_FAR = "invalid_so_far"
+COMPLETE_VALID = "complete_valid"
+COMPLETE_INVALID = "complete_invalid"
+
+ERRORS = (None, NOT_STR, INVALID_MASK, NOT_DIGITS, INVALID_DATA)
+
+
+class TypeaheadState(NamedTuple):
+    kind: str
+    mode: str
+    position: int = 0  # caracteres recebidos
+    count: int = 0  # caracteres do documento (sem separadores)
+    first_sum: int = 0  # somas ponderadas da base
+    second_sum: int = 0
+    leading: int = -1  # primeiro dígito, para rejeitar CPFs repetidos
+    repeated: bool = True
+    error: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        validator = TYPEAHEAD[self.kind]
+        if self.mode == "mask":
+            return self.position == len(validator.mask)
+        return self.count == validator.length
+
+    @property
+    def status(self) -> str:
+        if self.error is None:
+            return COMPLETE_VALID if self.complete else INCOMPLETE
+        return COMPLETE_INVALID if self.complete else INVALID_SO_FAR
+
+    @property
+    def expected(self) -> Optional[str]:
+        """Dígitos verificadores esperados, assim que a base está completa."""
+        validator = TYPEAHEAD[self.kind]
+        if not validator.digits or self.count < validator.base:
+            return None
+        first = validator._check_digit(self.first_sum)
+        second = validator._check_digit(self.second_sum + first * 2)
+        return f"{first}{second}"
+
+    def dumps(self) -> str:
+        return json.dumps(list(self), separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, data: str) -> "TypeaheadState":
+        """Reconstrói o estado de ``dumps``, conferindo tipos e valores."""
+        try:
+            fields = json.loads(data)
+            state = cls(*fields)
+        except (TypeError, ValueError) as error:
+            raise ValueError("invalid typeahead state") from error
+        numbers = state[2:7]
+        if (
+            not isinstance(state.kind, str)
+            or state.kind not in TYPEAHEAD
+            or state.mode not in MODES
+            or state.error not in ERRORS
+            or not isinstance(state.repeated, bool)
+            or not all(type(number) is int for number in numbers)
+            or min(numbers) < -1
+        ):
+            raise ValueError("invalid typeahead state")
+        return state
+
+
+class TypeaheadValidator(ABC):
+    """
+    Regras de um tipo de documento para a validação incremental. Cada
+    subclasse define a máscara (``#`` marca um caractere do documento), o
+    tamanho da base e os pesos dos dígitos verificadores.
+    """
+
+    kind: str
+    mask: str
+    base: int
+    length: int
+    digits = 2
+    first_weights: Tuple[int, ...] = ()
+    second_weights: Tuple[int, ...] = ()
+    reject_repeated = False
+
+    @classmethod
+    def start(cls, mode: str = "any") -> TypeaheadState:
+        if mode not in MODES:
+            raise ValueError(f"unknown mode {mode!r}")
+        return TypeaheadState(cls.kind, mode)
+
+    @classmethod
+    def feed(cls, state: TypeaheadState, text: str) -> TypeaheadState:
+        """Acrescenta ``text`` ao que já foi digitado."""
+        kind, mode, position, count, first_sum, second_sum, leading, repeated, error = (
+            state
+        )
+        mask, base, length = cls.mask, cls.base, cls.length
+        for char in text:
+            if mode != "mask":
+                value = cls._value(char, mode, count)
+            elif position >= len(mask):
+                value = INVALID_MASK
+            elif mask[position] != "#":
+                value = None if char == mask[position] else INVALID_MASK
+            else:
+                value = cls._value(char, mode, count)
+            position += 1
+            if value is None:
+                continue
+            if isinstance(value, str):
+                # Erros de formato têm precedência, como em ``check``.
+                if error is None or error == INVALID_DATA:
+                    error = value
+                continue
+            if count < base:
+                if cls.digits:
+                    first_sum += value * cls.first_weights[count]
+                    second_sum += value * cls.second_weights[count]
+            elif count < length:
+                digit = cls._check_digit(first_sum)
+                if count > base:
+                    digit = cls._check_digit(second_sum + digit * 2)
+                if value != digit and error is None:
+                    error = INVALID_DATA
+            elif error is None:
+                error = INVALID_DATA
+            if leading < 0:
+                leading = value
+            elif value != leading:
+                repeated = False
+            count += 1
+            if count == length and repeated and cls.reject_repeated and error is None:
+                error = INVALID_DATA
+        return TypeaheadState(
+            kind, mode, position, count, first_sum, second_sum, leading, repeated, error
+        )
+
+    @classmethod
+    @abstractmethod
+    def _value(cls, char: str, mode: str, index: int) -> Union[int, str, None]:
+        """
+        Valor de um caractere do documento, None para um caractere ignorado
+        ou o código do erro.
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _check_digit(total: int) -> int:
+        """Dígito verificador para a soma ponderada ``total``."""
+
+
+class CPFTypeahead(TypeaheadValidator):
+    kind = "cpf"
+    mask = "###.###.###-##"
+    base = 9
+    length = 11
+    first_weights = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+    second_weights = (11, 10, 9, 8, 7, 6, 5, 4, 3)
+    reject_repeated = True
+
+    @classmethod
+    def _value(cls, char: str, mode: str, index: int) -> Union[int, str, None]:
+        if "0" <= char <= "9":
+            return ord(char) - 48
+        if mode == "mask":
+            return INVALID_DATA
+        if mode == "digits":
+            return None if char.isdigit() else NOT_DIGITS
+        if mode == "alphanumeric":
+            return None if char.isalnum() else NOT_DIGITS
+        return None
+
+    @staticmethod
+    def _check_digit(total: int) -> int:
+        return total * 10 % 11 % 10
+
+
+class CNPJTypeahead(TypeaheadValidator):
+    kind = "cnpj"
+    mask = "##.###.###/####-##"
+    base = 12
+    length = 14
+    first_weights = FIRST_WEIGHTS
+    second_weights = SECOND_WEIGHTS[:12]
+
+    @classmethod
+    def _value(cls, char: str, mode: str, index: int) -> Union[int, str, None]:
+        if mode == "digits" and not char.isdigit():
+            return NOT_DIGITS
+        if mode == "alphanumeric" and not char.isalnum():
+            return NOT_DIGITS
+        if mode == "any" and char in ".-/":
+            return None
+        if index >= cls.base and not "0" <= char <= "9":
+            return INVALID_DATA
+        if char.isascii():
+            value = CHAR_VALUES[ord(char)]
+            return INVALID_DATA if value == INVALID_CHAR else value
+        # Fora do ASCII vale a regra de ``CNPJValidator.validate``: dígitos
+        # Unicode e letras cuja maiúscula está entre A e Z entram com o
+        # código - 48. Maiúsculas de mais de um caractere não são aceitas.
+        upper = char.upper()
+        if len(upper) != 1 or not (char.isdigit() or "A" <= upper <= "Z"):
+            return INVALID_DATA
+        return ord(upper) - 48
+
+    @staticmethod
+    def _check_digit(total: int) -> int:
+        remainder = total % 11
+        return 0 if remainder < 2 else 11 - remainder
+
+
+class CEPTypeahead(TypeaheadValidator):
+    kind = "cep"
+    mask = "#####-###"
+    base = 8
+    length = 8
+    digits = 0
+
+    @classmethod
+    def _value(cls, char: str, mode: str, index: int) -> Union[int, str, None]:
+        if mode == "digits":
+            return 0 if char.isdigit() else NOT_DIGITS
+        if mode == "alphanumeric":
+            return 0 if char.isalnum() else NOT_DIGITS
+        if char == "-":
+            return INVALID_DATA if mode == "mask" else None
+        return 0
+
+    @staticmethod
+    def _check_digit(total: int) -> int:
+        # O CEP não tem dígito verificador (``base == length``): nunca chamado.
+        return 0
+
+
+TYPEAHEAD: Dict[str, Type[TypeaheadValidator]] = {
+    "cpf": CPFTypeahead,
+    "cnpj": CNPJTypeahead,
+    "cep": CEPTypeahead,
+}
+
+
+def start(kind: str, mode: str = "any") -> TypeaheadState:
+    """Estado inicial (nada digitado) para o tipo de documento e modo."""
+    if kind not in TYPEAHEAD:
+        raise ValueError(f"unknown document kind {kind!r}")
+    return TYPEAHEAD[kind].start(mode)
+
+
+def feed(state: TypeaheadState, text: str) -> TypeaheadState:
+    """Novo estado depois de digitar ``text`` (um ou mais caracteres)."""
+    return TYPEAHEAD[state.kind].feed(state, text)
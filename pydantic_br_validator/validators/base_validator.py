@@ -1,4 +1,19 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+NOT_STR = "not_str"
+INVALID_MASK = "invalid_mask"
+NOT_DIGITS = "not_digits"
+INVALID_DATA = "invalid_data"
+
+MODES = ("any", "mask", "digits", "alphanumeric")
+
+
+def count_digits(value: str) -> int:
+    """Quantidade de dígitos ASCII (0-9) no valor."""
+    if value.isdigit() and value.isascii():
+        return len(value)
+    return sum(map(value.count, "0123456789"))
 
 
 class FieldValidator(ABC):
@@ -6,6 +21,54 @@ class FieldValidator(ABC):
     def validate(self):
         ...
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida o valor no modo informado ("any", "mask", "digits" ou
+        "alphanumeric") e retorna o código do erro, ou None se for válido.
+
+        Esta implementação executa as etapas em sequência; os validadores
+        concretos sobrescrevem com uma rotina de passagem única.
+        """
+        cls.check_mode(mode)
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode == "mask" and not cls(value).validate_mask():
+            return INVALID_MASK
+        if mode == "digits" and not value.isdigit():
+            return NOT_DIGITS
+        if mode == "alphanumeric" and not value.isalnum():
+            return NOT_DIGITS
+        if not cls(value).validate():
+            return INVALID_DATA
+        return None
+
+    @classmethod
+    def check_mode(cls, mode: str) -> None:
+        """
+        Rejeita modos desconhecidos e o modo "mask" em documentos sem
+        máscara (CNH, por exemplo).
+        """
+        if mode not in MODES:
+            raise ValueError(f"unknown mode {mode!r}, expected one of {MODES}")
+        if mode == "mask" and not issubclass(cls, FieldMaskValidator):
+            raise ValueError(f"{cls.__name__} has no mask mode")
+
+    @classmethod
+    def check_structure(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida apenas máscara, caracteres e tamanho, sem conferir os dígitos
+        verificadores. Documentos sem dígito verificador usam a validação
+        completa.
+        """
+        return cls.check(value, mode)
+
+    @classmethod
+    def check_many(cls, values: Iterable, mode: str = "any") -> List[Optional[str]]:
+        """Valida um lote de valores e retorna o código do erro de cada um."""
+        check = cls.check
+        return [check(value, mode) for value in values]
+
 
 class FieldMaskValidator(FieldValidator):
     @abstractmethod
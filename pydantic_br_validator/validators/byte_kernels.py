@@ -0,0 +1,83 @@
+"""
+Validação de CPF, CNPJ e CEP direto sobre bytes ASCII, sem decodificar o valor
+em ``str``. Usadas por quem lê os documentos de buffers (colunas do Arrow,
+arquivos de registros de tamanho fixo); o resultado é o mesmo de
+``Validator.check`` para valores ASCII.
+"""
+
+from operator import mul
+from typing import Callable, Dict, Optional
+
+from . import cnpj_engine
+from .base_validator import INVALID_DATA, INVALID_MASK, NOT_DIGITS
+
+__all__ = ["KERNELS", "Kernel", "check_cep", "check_cnpj", "check_cpf"]
+
+DOT, DASH, SLASH = b".-/"
+NOT_DIGIT_BYTES = bytes(byte for byte in range(256) if not 48 <= byte <= 57)
+
+CPF_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+CPF_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_FIRST_OFFSET = 48 * sum(CPF_FIRST_WEIGHTS)
+_CPF_SECOND_OFFSET = 48 * sum(CPF_SECOND_WEIGHTS)
+
+Kernel = Callable[[bytes, str], Optional[str]]
+
+
+def check_cpf(raw: bytes, mode: str) -> Optional[str]:
+    if mode == "mask":
+        if len(raw) != 14 or raw[3] != DOT or raw[7] != DOT or raw[11] != DASH:
+            return INVALID_MASK
+    elif mode == "digits" and not raw.isdigit():
+        return NOT_DIGITS
+    elif mode == "alphanumeric" and not raw.isalnum():
+        return NOT_DIGITS
+    digits = raw.translate(None, NOT_DIGIT_BYTES)
+    if len(digits) != 11 or digits.count(digits[0]) == 11:
+        return INVALID_DATA
+    first_sum = sum(map(mul, digits, CPF_FIRST_WEIGHTS)) - _CPF_FIRST_OFFSET
+    if first_sum * 10 % 11 % 10 != digits[9] - 48:
+        return INVALID_DATA
+    second_sum = sum(map(mul, digits, CPF_SECOND_WEIGHTS)) - _CPF_SECOND_OFFSET
+    if second_sum * 10 % 11 % 10 != digits[10] - 48:
+        return INVALID_DATA
+    return None
+
+
+def check_cnpj(raw: bytes, mode: str) -> Optional[str]:
+    if mode == "mask":
+        if (
+            len(raw) != 18
+            or raw[2] != DOT
+            or raw[6] != DOT
+            or raw[10] != SLASH
+            or raw[15] != DASH
+        ):
+            return INVALID_MASK
+    elif mode == "alphanumeric":
+        if not raw.isalnum():
+            return NOT_DIGITS
+    elif mode == "digits" and not raw.isdigit():
+        return NOT_DIGITS
+    if not raw.isalnum():
+        raw = raw.translate(None, b".-/")
+    return None if cnpj_engine.verify_bytes(raw) else INVALID_DATA
+
+
+def check_cep(raw: bytes, mode: str) -> Optional[str]:
+    if mode == "mask":
+        if len(raw) != 9 or raw[5] != DASH:
+            return INVALID_MASK
+    elif mode == "digits":
+        if not raw.isdigit():
+            return NOT_DIGITS
+    elif mode == "alphanumeric" and not raw.isalnum():
+        return NOT_DIGITS
+    return None if len(raw) - raw.count(b"-") == 8 else INVALID_DATA
+
+
+KERNELS: Dict[str, Kernel] = {
+    "cpf": check_cpf,
+    "cnpj": check_cnpj,
+    "cep": check_cep,
+}
@@ -1,4 +1,12 @@
-from .base_validator import FieldMaskValidator
+from typing import Container, Optional, Type
+
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+)
 
 __all__ = ["CEPValidator"]
 
@@ -11,9 +19,51 @@ class CEPValidator(FieldMaskValidator):
         if len(self.cep) == 9:
             return self.cep[5] == "-"
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """Valida máscara, caracteres e tamanho do CEP em uma única rotina."""
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode == "mask":
+            if len(value) != 9 or value[5] != "-":
+                return INVALID_MASK
+        elif mode == "digits":
+            if not value.isdigit():
+                return NOT_DIGITS
+        elif mode != "any":
+            return super().check(value, mode)
+        if len(value) - value.count("-") != 8:
+            return INVALID_DATA
+        return None
+
     def validate(self) -> bool:
         cep = self.cep.replace("-", "")
 
         if len(cep) != 8:
             return False
         return True
+
+    @classmethod
+    def with_database(cls, database: Container) -> Type["CEPValidator"]:
+        """
+        Retorna um validador que, além do formato, exige que o CEP exista em
+        ``database`` (uma ``CEPDatabase``). A validação estrutural
+        (``check_structure``) não consulta a base.
+        """
+        return type(
+            "CEPDatabaseValidator",
+            (cls,),
+            {
+                "database": database,
+                "check": classmethod(_check_exists),
+                "check_structure": classmethod(CEPValidator.check.__func__),
+                "__module__": cls.__module__,
+            },
+        )
+
+
+def _check_exists(cls, value, mode: str = "any") -> Optional[str]:
+    error = CEPValidator.check.__func__(cls, value, mode)
+    if error is None and value not in cls.database:
+        return INVALID_DATA
+    return error
@@ -1,6 +1,13 @@
 import re
+from typing import Optional, Tuple
 
-from .base_validator import FieldValidator
+from .base_validator import (
+    INVALID_DATA,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldValidator,
+    count_digits,
+)
 
 __all__ = ["CNHValidator"]
 
@@ -9,6 +16,67 @@ class CNHValidator(FieldValidator):
     def __init__(self, cnh: str) -> None:
         self.cnh = cnh
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida os caracteres e os dois dígitos verificadores em uma única
+        passagem, incluindo o ajuste do segundo dígito quando o primeiro é 10.
+        """
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode not in ("any", "digits") or not value.isascii():
+            return super().check(value, mode)
+        if mode == "digits" and not value.isdigit():
+            return NOT_DIGITS
+
+        count = first_sum = second_sum = 0
+        first_digit = second_digit = 0
+        leading = None
+        repeated = True
+        for char in value:
+            if char < "0" or char > "9":
+                continue
+            digit = ord(char) - 48
+            if leading is None:
+                leading = digit
+            elif digit != leading:
+                repeated = False
+            if count < 9:
+                first_sum += digit * (9 - count)
+                second_sum += digit * (count + 1)
+            elif count == 9:
+                first_digit = digit
+            elif count == 10:
+                second_digit = digit
+            count += 1
+
+        if count != 11 or repeated:
+            return INVALID_DATA
+        expected, dsc = first_sum % 11, 0
+        if expected >= 10:
+            expected, dsc = 0, 2
+        if expected != first_digit:
+            return INVALID_DATA
+        expected = (second_sum % 11 - dsc) % 11
+        if expected >= 10:
+            expected = 0
+        if expected != second_digit:
+            return INVALID_DATA
+        return None
+
+    @classmethod
+    def check_structure(cls, value, mode: str = "any") -> Optional[str]:
+        """Valida os caracteres e a quantidade de dígitos (11)."""
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode not in ("any", "digits") or not value.isascii():
+            return cls.check(value, mode)
+        if mode == "digits" and not value.isdigit():
+            return NOT_DIGITS
+        if count_digits(value) != 11:
+            return INVALID_DATA
+        return None
+
     def validate(self) -> bool:
         cnh = re.sub("[^0-9]", "", str(self.cnh))
 
@@ -18,12 +86,16 @@ class CNHValidator(FieldValidator):
         if len(cnh) != 11:
             return False
 
-        first_digit = self._validate_first_digit(cnh)
-        second_digit = self._validate_second_digit(cnh)
+        first_digit, dsc = self._validate_first_digit(cnh)
+        second_digit = self._validate_second_digit(cnh, dsc)
         return cnh[9] == first_digit and cnh[10] == second_digit
 
-    def _validate_first_digit(self, cnh: str) -> str:
-        self.dsc = 0
+    def _validate_first_digit(self, cnh: str) -> Tuple[str, int]:
+        """
+        Retorna o primeiro dígito e o desconto (dsc) a aplicar no segundo,
+        sem guardar estado na instância.
+        """
+        dsc = 0
         sum = 0
 
         for i in range(9, 0, -1):
@@ -31,10 +103,10 @@ class CNHValidator(FieldValidator):
 
         first_digit = sum % 11
         if first_digit >= 10:
-            first_digit, self.dsc = 0, 2
-        return str(first_digit)
+            first_digit, dsc = 0, 2
+        return str(first_digit), dsc
 
-    def _validate_second_digit(self, cnh: str) -> str:
+    def _validate_second_digit(self, cnh: str, dsc: int) -> str:
         sum = 0
 
         for i in range(1, 10):
@@ -42,7 +114,7 @@ class CNHValidator(FieldValidator):
 
         rest = sum % 11
 
-        second_digit = rest - self.dsc
+        second_digit = rest - dsc
         if second_digit < 0:
             second_digit += 11
         if second_digit >= 10:
@@ -0,0 +1,121 @@
+"""
+Cálculo dos dígitos verificadores do CNPJ numérico e alfanumérico.
+
+Os caracteres são convertidos pelos valores de uma tabela de 256 posições
+(código ASCII - 48 para 0-9 e A-Z, aceitando minúsculas), aplicada de uma vez
+com ``bytes.translate``. CNPJs só com dígitos, ainda a grande maioria, usam um
+caminho direto sobre os bytes, sem a tabela.
+"""
+
+from operator import mul
+from typing import Dict, Iterable, List, Tuple
+
+__all__ = [
+    "CHAR_VALUES",
+    "FIRST_WEIGHTS",
+    "SECOND_WEIGHTS",
+    "check_digits",
+    "strip_separators",
+    "verify",
+    "verify_bytes",
+    "verify_many",
+]
+
+FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+SECOND_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+ROOT_SIZE = 8
+INVALID_CHAR = 0xFF
+
+_FIRST_DIGIT_OFFSET = 48 * sum(FIRST_WEIGHTS)
+_SECOND_DIGIT_OFFSET = 48 * sum(SECOND_WEIGHTS)
+_FIRST_BRANCH_WEIGHTS = FIRST_WEIGHTS[ROOT_SIZE:]
+_SECOND_BRANCH_WEIGHTS = SECOND_WEIGHTS[ROOT_SIZE:12]
+
+
+def _build_char_values() -> bytes:
+    table = bytearray([INVALID_CHAR]) * 256
+    for char in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        table[ord(char)] = table[ord(char.lower())] = ord(char) - 48
+    return bytes(table)
+
+
+CHAR_VALUES = _build_char_values()
+
+
+def _digit(total: int) -> int:
+    remainder = total % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def strip_separators(value: str) -> str:
+    """Remove pontos, barras e hífens (o valor deve ser ASCII)."""
+    if value.isalnum():
+        return value
+    return value.replace(".", "").replace("-", "").replace("/", "")
+
+
+def verify(cnpj: str) -> bool:
+    """Confere um CNPJ ASCII já sem separadores, em qualquer caixa."""
+    return len(cnpj) == 14 and verify_bytes(cnpj.encode("ascii"))
+
+
+def verify_bytes(raw: bytes) -> bool:
+    """Como ``verify``, sobre os bytes ASCII do CNPJ (por exemplo, de um buffer)."""
+    if len(raw) != 14:
+        return False
+    if raw.isdigit():
+        first_digit = _digit(sum(map(mul, raw, FIRST_WEIGHTS)) - _FIRST_DIGIT_OFFSET)
+        if raw[12] - 48 != first_digit:
+            return False
+        second_sum = sum(map(mul, raw, SECOND_WEIGHTS)) - _SECOND_DIGIT_OFFSET
+        return raw[13] - 48 == _digit(second_sum)
+
+    if not raw[12:].isdigit():
+        return False
+    values = raw.translate(CHAR_VALUES)
+    if INVALID_CHAR in values:
+        return False
+    first_digit = _digit(sum(map(mul, values, FIRST_WEIGHTS)))
+    if values[12] != first_digit:
+        return False
+    return values[13] == _digit(sum(map(mul, values, SECOND_WEIGHTS)))
+
+
+def verify_many(cnpjs: Iterable[str]) -> List[bool]:
+    """
+    Confere um lote de CNPJs ASCII sem separadores. As somas ponderadas da
+    raiz (8 primeiros caracteres) são calculadas uma vez por empresa.
+    """
+    roots: Dict[bytes, Tuple[int, int]] = {}
+    results: List[bool] = []
+    append = results.append
+    for cnpj in cnpjs:
+        values = cnpj.encode("ascii").translate(CHAR_VALUES)
+        if len(values) != 14 or INVALID_CHAR in values or values[12] > 9:
+            append(False)
+            continue
+        root = values[:ROOT_SIZE]
+        sums = roots.get(root)
+        if sums is None:
+            sums = roots[root] = (
+                sum(map(mul, root, FIRST_WEIGHTS)),
+                sum(map(mul, root, SECOND_WEIGHTS)),
+            )
+        branch = values[ROOT_SIZE:12]
+        first_digit = _digit(sums[0] + sum(map(mul, branch, _FIRST_BRANCH_WEIGHTS)))
+        second_sum = sums[1] + sum(map(mul, branch, _SECOND_BRANCH_WEIGHTS))
+        append(
+            values[12] == first_digit
+            and values[13] == _digit(second_sum + first_digit * 2)
+        )
+    return results
+
+
+def check_digits(base: str) -> str:
+    """Calcula os dois dígitos verificadores de uma base de 12 caracteres."""
+    values = base.encode("ascii").translate(CHAR_VALUES)
+    if len(values) != 12 or INVALID_CHAR in values:
+        raise ValueError(f"invalid CNPJ base: {base!r}")
+    first_digit = _digit(sum(map(mul, values, FIRST_WEIGHTS)))
+    second_digit = _digit(sum(map(mul, values, SECOND_WEIGHTS)) + first_digit * 2)
+    return f"{first_digit}{second_digit}"
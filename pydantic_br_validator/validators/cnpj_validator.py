@@ -1,9 +1,21 @@
 import re
+from typing import Dict, Iterable, List, Optional
 
-from .base_validator import FieldMaskValidator
+from . import cnpj_engine
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+)
 
 __all__ = ["CNPJValidator"]
 
+FIRST_WEIGHTS = cnpj_engine.FIRST_WEIGHTS
+SECOND_WEIGHTS = cnpj_engine.SECOND_WEIGHTS
+ROOT_SIZE = cnpj_engine.ROOT_SIZE
+
 
 class CNPJValidator(FieldMaskValidator):
     def __init__(self, cnpj) -> None:
@@ -20,6 +32,112 @@ class CNPJValidator(FieldMaskValidator):
                 return True
         return False
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida máscara, caracteres (numéricos ou alfanuméricos) e os dois
+        dígitos verificadores usando a tabela de valores do cnpj_engine.
+        """
+        if not isinstance(value, str):
+            return NOT_STR
+        if not value.isascii():
+            return super().check(value, mode)
+        error = cls._check_format(value, mode)
+        if error is not None:
+            return error
+        if not cnpj_engine.verify(cnpj_engine.strip_separators(value)):
+            return INVALID_DATA
+        return None
+
+    @classmethod
+    def check_structure(cls, value, mode: str = "any") -> Optional[str]:
+        """Valida máscara, caracteres e tamanho, sem os dígitos verificadores."""
+        if not isinstance(value, str):
+            return NOT_STR
+        if not value.isascii():
+            return cls.check(value, mode)
+        error = cls._check_format(value, mode)
+        if error is None and cls._normalize(value) is None:
+            return INVALID_DATA
+        return error
+
+    @classmethod
+    def check_many(cls, values: Iterable, mode: str = "any") -> List[Optional[str]]:
+        """
+        Valida um lote de CNPJs calculando as somas ponderadas da raiz (os 8
+        primeiros caracteres) uma única vez por empresa; para cada filial são
+        somadas apenas as contribuições da ordem e do primeiro dígito.
+        """
+        results: List[Optional[str]] = []
+        pending: List[int] = []
+        cnpjs: List[str] = []
+        for value in values:
+            if not isinstance(value, str) or not value.isascii():
+                results.append(cls.check(value, mode))
+                continue
+            error = cls._check_format(value, mode)
+            if error is None:
+                pending.append(len(results))
+                cnpjs.append(cnpj_engine.strip_separators(value))
+            results.append(error)
+        for index, valid in zip(pending, cnpj_engine.verify_many(cnpjs)):
+            if not valid:
+                results[index] = INVALID_DATA
+        return results
+
+    @classmethod
+    def root(cls, value) -> Optional[str]:
+        """
+        Retorna a raiz do CNPJ (8 primeiros caracteres, em maiúsculas), que
+        identifica a empresa, ou None se o valor não tiver formato de CNPJ.
+        """
+        if not isinstance(value, str) or not value.isascii():
+            return None
+        cnpj = cls._normalize(value)
+        return None if cnpj is None else cnpj[:ROOT_SIZE]
+
+    @classmethod
+    def group_by_root(cls, values: Iterable) -> Dict[str, List[int]]:
+        """
+        Agrupa os índices dos valores pela raiz do CNPJ. Valores sem formato
+        de CNPJ ficam de fora.
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, value in enumerate(values):
+            root = cls.root(value)
+            if root is not None:
+                groups.setdefault(root, []).append(index)
+        return groups
+
+    @classmethod
+    def _check_format(cls, value: str, mode: str) -> Optional[str]:
+        if mode == "mask":
+            if (
+                len(value) != 18
+                or value[2] != "."
+                or value[6] != "."
+                or value[10] != "/"
+                or value[15] != "-"
+            ):
+                return INVALID_MASK
+        elif mode == "alphanumeric":
+            if not value.isalnum():
+                return NOT_DIGITS
+        elif mode == "digits":
+            if not value.isdigit():
+                return NOT_DIGITS
+        elif mode != "any":
+            cls.check_mode(mode)
+        return None
+
+    @staticmethod
+    def _normalize(value: str) -> Optional[str]:
+        """Remove a formatação e confere tamanho e caracteres (apenas ASCII)."""
+        cnpj = cnpj_engine.strip_separators(value).upper()
+        if len(cnpj) != 14 or not cnpj[:12].isalnum() or not cnpj[12:].isdigit():
+            return None
+        return cnpj
+
     def _get_char_value(self, char: str) -> int:
         """
         Retorna o valor do caractere para cálculo do dígito verificador.
@@ -58,10 +176,9 @@ class CNPJValidator(FieldMaskValidator):
 
     def _validate_first_digit(self, cnpj: str) -> str:
         total = 0
-        weight = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 
         for n in range(12):
-            value = self._get_char_value(cnpj[n]) * weight[n]
+            value = self._get_char_value(cnpj[n]) * FIRST_WEIGHTS[n]
             total = total + value
 
         check_digit = total % 11
@@ -74,9 +191,8 @@ class CNPJValidator(FieldMaskValidator):
 
     def _validate_second_digit(self, cnpj: str) -> str:
         total = 0
-        weight = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
         for n in range(13):
-            total = total + self._get_char_value(cnpj[n]) * weight[n]
+            total = total + self._get_char_value(cnpj[n]) * SECOND_WEIGHTS[n]
 
         check_digit = total % 11
 
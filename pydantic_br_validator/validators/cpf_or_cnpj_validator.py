@@ -0,0 +1,121 @@
+from typing import NamedTuple, Optional
+
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+)
+from .cnpj_validator import CNPJValidator
+from .cpf_validator import CPFValidator
+
+__all__ = ["CPFOrCNPJValidator", "DetectedDocument", "detect_document"]
+
+VALIDATORS = {"cpf": CPFValidator, "cnpj": CNPJValidator}
+SIZES = {"cpf": 11, "cnpj": 14}
+
+
+class DetectedDocument(NamedTuple):
+    """
+    Resultado da detecção: o tipo do documento ("cpf", "cnpj" ou None quando
+    o formato não corresponde a nenhum dos dois) e o código do erro, se houver.
+    """
+
+    kind: Optional[str]
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.kind is not None and self.error is None
+
+
+def _classify(value: str, mode: str) -> Optional[str]:
+    """Classifica o valor pelo tamanho e pela posição dos separadores."""
+    size = len(value)
+    if size == 14 and value[3] == "." and value[7] == "." and value[11] == "-":
+        return "cpf"
+    if (
+        size == 18
+        and value[2] == "."
+        and value[6] == "."
+        and value[10] == "/"
+        and value[15] == "-"
+    ):
+        return "cnpj"
+    if mode == "mask":
+        return None
+    size -= value.count(".") + value.count("-") + value.count("/")
+    if size == 11:
+        return "cpf"
+    if size == 14:
+        return "cnpj"
+    return None
+
+
+def detect_document(value, mode: str = "any") -> DetectedDocument:
+    """
+    Identifica se o valor é um CPF ou um CNPJ pelo formato e valida apenas o
+    documento detectado. Quando o formato não decide (espaços, letras ou
+    dígitos fora do ASCII), aceita o valor como ``Union[CPF, CNPJ]``.
+    """
+    return _detect(value, mode, "check")
+
+
+def _detect(value, mode: str, method: str) -> DetectedDocument:
+    if not isinstance(value, str):
+        return DetectedDocument(None, NOT_STR)
+    kind = _classify(value, mode)
+    if kind is not None:
+        error = getattr(VALIDATORS[kind], method)(value, _mode(kind, mode))
+        if error is None or _decisive(value, kind):
+            return DetectedDocument(kind, error)
+    # Formato ambíguo (espaços, letras, dígitos fora do ASCII): como em
+    # Union[CPF, CNPJ], vale o primeiro documento que aceitar o valor.
+    for other in ("cpf", "cnpj"):
+        if other == kind:
+            continue
+        if getattr(VALIDATORS[other], method)(value, _mode(other, mode)) is None:
+            return DetectedDocument(other, None)
+    if kind is not None:
+        return DetectedDocument(kind, error)
+    if mode == "mask":
+        return DetectedDocument(None, INVALID_MASK)
+    if mode in ("digits", "alphanumeric") and not value.isalnum():
+        return DetectedDocument(None, NOT_DIGITS)
+    return DetectedDocument(None, INVALID_DATA)
+
+
+def _mode(kind: str, mode: str) -> str:
+    """O CPF não tem letras: "alphanumeric" vale "digits", como em CPFDigits."""
+    return "digits" if kind == "cpf" and mode == "alphanumeric" else mode
+
+
+def _decisive(value: str, kind: str) -> bool:
+    """
+    Apenas dígitos ASCII e separadores, na quantidade do tipo: o valor não
+    pode ser o outro documento.
+    """
+    if not value.isascii() or value.strip("0123456789.-/"):
+        return False
+    size = len(value) - value.count(".") - value.count("-") - value.count("/")
+    return size == SIZES[kind]
+
+
+class CPFOrCNPJValidator(FieldMaskValidator):
+    def __init__(self, document: str) -> None:
+        self.document = document
+
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        return detect_document(value, mode).error
+
+    @classmethod
+    def check_structure(cls, value, mode: str = "any") -> Optional[str]:
+        return _detect(value, mode, "check_structure").error
+
+    def validate_mask(self) -> bool:
+        return _classify(self.document, "mask") is not None
+
+    def validate(self) -> bool:
+        return detect_document(self.document).valid
@@ -1,6 +1,14 @@
 import re
+from typing import Optional
 
-from .base_validator import FieldMaskValidator
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+    count_digits,
+)
 
 __all__ = ["CPFValidator"]
 
@@ -15,6 +23,84 @@ class CPFValidator(FieldMaskValidator):
                 return True
         return False
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida máscara, caracteres e os dois dígitos verificadores em uma
+        única passagem pelos caracteres.
+        """
+        if not isinstance(value, str):
+            return NOT_STR
+        if not value.isascii():
+            return super().check(value, mode)
+        if mode == "mask":
+            if (
+                len(value) != 14
+                or value[3] != "."
+                or value[7] != "."
+                or value[11] != "-"
+            ):
+                return INVALID_MASK
+        elif mode == "digits":
+            if not value.isdigit():
+                return NOT_DIGITS
+        elif mode == "alphanumeric":
+            if not value.isalnum():
+                return NOT_DIGITS
+        elif mode != "any":
+            return super().check(value, mode)
+
+        count = first_sum = second_sum = 0
+        first_digit = second_digit = 0
+        leading = None
+        repeated = True
+        for char in value:
+            if char < "0" or char > "9":
+                continue
+            digit = ord(char) - 48
+            if leading is None:
+                leading = digit
+            elif digit != leading:
+                repeated = False
+            if count < 9:
+                first_sum += digit * (10 - count)
+                second_sum += digit * (11 - count)
+            elif count == 9:
+                first_digit = digit
+                second_sum += digit * 2
+            elif count == 10:
+                second_digit = digit
+            count += 1
+
+        if count != 11 or repeated:
+            return INVALID_DATA
+        if (first_sum * 10) % 11 % 10 != first_digit:
+            return INVALID_DATA
+        if (second_sum * 10) % 11 % 10 != second_digit:
+            return INVALID_DATA
+        return None
+
+    @classmethod
+    def check_structure(cls, value, mode: str = "any") -> Optional[str]:
+        """Valida máscara, caracteres e a quantidade de dígitos (11)."""
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode not in ("any", "mask", "digits") or not value.isascii():
+            return cls.check(value, mode)
+        if mode == "mask":
+            if (
+                len(value) != 14
+                or value[3] != "."
+                or value[7] != "."
+                or value[11] != "-"
+            ):
+                return INVALID_MASK
+        elif mode == "digits" and not value.isdigit():
+            return NOT_DIGITS
+        if count_digits(value) != 11:
+            return INVALID_DATA
+        return None
+
     def validate(self) -> bool:
         cpf = re.sub("[^0-9]", "", str(self.cpf))
 
@@ -1,6 +1,50 @@
-from .base_validator import FieldMaskValidator
+from operator import mul
+from typing import Dict, NamedTuple, Optional, Tuple, Type
 
-__all__ = ["RGValidator"]
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+)
+
+__all__ = ["RGRule", "RGValidator", "RG_RULES", "UFS"]
+
+# Posições da máscara XX.XXX.XXX-X: separadores literais e, para cada
+# posição de dígito, o índice do bloco ao qual ela pertence.
+MASK_LAYOUT = "00.111.222-2"
+
+UFS = (
+    "AC", "AL", "AM", "AP", "BA", "CE", "DF", "ES", "GO", "MA", "MG", "MS", "MT", "PA",
+    "PB", "PE", "PI", "PR", "RJ", "RN", "RO", "RR", "RS", "SC", "SE", "SP", "TO",
+)  # fmt: skip
+
+
+class RGRule(NamedTuple):
+    """
+    Regra do dígito verificador do RG de um estado.
+
+    Attributes:
+        weights: pesos aplicados aos dígitos que antecedem o verificador.
+        remainders: dígito esperado para cada resto de ``soma % modulus``.
+        modulus: módulo da soma ponderada.
+    """
+
+    weights: Tuple[int, ...]
+    remainders: str
+    modulus: int = 11
+
+
+# SP: pesos 2 a 9 e dígito 11 - resto, com 10 virando X e 11 virando 0.
+SP_RULE = RGRule(weights=(2, 3, 4, 5, 6, 7, 8, 9), remainders="0X987654321")
+
+# Tabela de despacho por UF. Os estados sem regra pública de dígito
+# verificador (None) têm apenas máscara, caracteres e tamanho conferidos.
+RG_RULES: Dict[str, Optional[RGRule]] = dict.fromkeys(UFS)
+RG_RULES["SP"] = SP_RULE
+
+_STATE_VALIDATORS: Dict[str, Type["RGValidator"]] = {}
 
 
 class RGValidator(FieldMaskValidator):
@@ -19,6 +63,57 @@ class RGValidator(FieldMaskValidator):
             return False
         return all(part.replace("-", "").isdigit() for part in parts)
 
+    @classmethod
+    def check(cls, value, mode: str = "any") -> Optional[str]:
+        """
+        Valida máscara, caracteres e tamanho do RG em uma única passagem,
+        sem reavaliar a máscara separadamente.
+        """
+        if not isinstance(value, str):
+            return NOT_STR
+        if mode == "digits":
+            if not value.isdigit():
+                return NOT_DIGITS
+            if len(value) not in (8, 9):
+                return INVALID_DATA
+            return None
+        if mode not in ("any", "mask") or not value.isascii():
+            return super().check(value, mode)
+
+        masked = len(value) == 12
+        block_digits = [0, 0, 0]
+        count = non_digits = 0
+        has_separator = False
+        last = ""
+        for index, char in enumerate(value):
+            is_digit = "0" <= char <= "9"
+            if masked:
+                slot = MASK_LAYOUT[index]
+                if slot == "." or slot == "-":
+                    masked = char == slot
+                elif is_digit:
+                    block_digits[ord(slot) - 48] += 1
+                elif char != "-":
+                    masked = False
+            if char == "." or char == "-":
+                has_separator = True
+                continue
+            if not is_digit:
+                non_digits += 1
+            last = char
+            count += 1
+        masked = masked and all(block_digits)
+
+        if mode == "mask" and not masked:
+            return INVALID_MASK
+        if count != 8 and count != 9:
+            return INVALID_DATA
+        if non_digits and (non_digits > 1 or (last != "X" and last != "x")):
+            return INVALID_DATA
+        if has_separator and not masked:
+            return INVALID_DATA
+        return None
+
     def validate(self) -> bool:
         """Valida se o RG tem 8 ou 9 caracteres, permitindo máscara e X no final."""
         rg_clean = self.rg.replace(".", "").replace("-", "")
@@ -36,12 +131,49 @@ class RGValidator(FieldMaskValidator):
             return self.validate_mask()
         return True
 
-    def _validate_digit_verify(self, rg: str) -> str:
-        """Valida o dígito verificador do RG."""
-        sum = 0
-        for i in range(9, 1, -1):
-            sum += int(rg[9 - i]) * i
-        sum = sum % 11
-        if sum == 10:
-            sum = 0
-        return str(sum)
+    @classmethod
+    def for_state(cls, uf: str) -> Type["RGValidator"]:
+        """
+        Retorna o validador do RG emitido por ``uf``, que também confere o
+        dígito verificador quando o estado tem uma regra em ``RG_RULES``.
+        """
+        key = uf.upper() if isinstance(uf, str) else uf
+        validator = _STATE_VALIDATORS.get(key)
+        if validator is not None:
+            return validator
+        if key not in RG_RULES:
+            raise ValueError(f"unknown UF {uf!r}, expected one of {list(UFS)}")
+        rule = RG_RULES[key]
+        namespace = {"uf": key, "rule": rule, "__module__": cls.__module__}
+        if rule is not None:
+            # A soma é feita direto sobre os bytes ASCII dos dígitos e o
+            # deslocamento de 48 por dígito é descontado de uma só vez.
+            namespace.update(
+                length=len(rule.weights) + 1,
+                offset=48 * sum(rule.weights),
+                check=classmethod(_check_state),
+                check_structure=classmethod(RGValidator.check.__func__),
+                validate=_validate_state,
+            )
+        validator = type(f"RGValidator{key}", (cls,), namespace)
+        _STATE_VALIDATORS[key] = validator
+        return validator
+
+
+def _check_state(cls, value, mode: str = "any") -> Optional[str]:
+    """Validação estrutural do RG seguida do dígito verificador do estado."""
+    error = RGValidator.check(value, mode)
+    if error is not None:
+        return error
+    raw = value.replace(".", "").replace("-", "") if len(value) > 9 else value
+    if len(raw) != cls.length:
+        return INVALID_DATA
+    rule = cls.rule
+    total = sum(map(mul, raw[:-1].encode(), rule.weights)) - cls.offset
+    if raw[-1].upper() != rule.remainders[total % rule.modulus]:
+        return INVALID_DATA
+    return None
+
+
+def _validate_state(self) -> bool:
+    return self.check(self.rg) is None
@@ -0,0 +1,299 @@
+"""
+Documentos descritos de forma declarativa e compilados em validadores.
+
+Um ``DocumentSpec`` descreve tamanho, máscara, alfabeto e a regra de cada
+dígito verificador (pesos, módulo e a tabela que converte o resto no
+dígito). ``compile_spec`` gera, na importação, o código de uma função
+``check`` com as somas ponderadas desenroladas para aquele documento, como
+as rotinas escritas à mão de ``CPFValidator`` e ``CNHValidator``, e retorna
+a classe do validador.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, Type
+
+from .base_validator import (
+    INVALID_DATA,
+    INVALID_MASK,
+    NOT_DIGITS,
+    NOT_STR,
+    FieldMaskValidator,
+    FieldValidator,
+)
+
+__all__ = [
+    "CheckDigit",
+    "DocumentSpec",
+    "PISValidator",
+    "RENAVAMValidator",
+    "SpecMaskValidator",
+    "SpecValidator",
+    "compile_spec",
+]
+
+DIGITS = "0123456789"
+MASK_SLOT = "0"
+INVALID_CHAR = 0xFF
+
+
+class CheckDigit(NamedTuple):
+    """
+    Regra de um dígito verificador.
+
+    Attributes:
+        position: posição do dígito no documento sem máscara.
+        weights: pesos aplicados aos caracteres a partir da posição 0 (podem
+            incluir dígitos verificadores anteriores).
+        remainders: valor esperado do dígito para cada resto de
+            ``soma % modulus``.
+        modulus: módulo da soma ponderada.
+    """
+
+    position: int
+    weights: Tuple[int, ...]
+    remainders: Tuple[int, ...]
+    modulus: int = 11
+
+
+class DocumentSpec(NamedTuple):
+    """
+    Descrição declarativa de um documento.
+
+    Attributes:
+        name: nome do documento, usado no ``format`` dos campos.
+        length: quantidade de caracteres sem máscara.
+        check_digits: regras dos dígitos verificadores, na ordem de cálculo.
+        mask: máscara com ``0`` em cada posição de caractere e os
+            separadores literais (por exemplo ``"000.00000.00-0"``), ou None
+            se o documento não tiver máscara.
+        alphabet: caracteres aceitos; o valor de cada um é a sua posição.
+        reject_repeated: rejeita documentos com todos os caracteres iguais.
+    """
+
+    name: str
+    length: int
+    check_digits: Tuple[CheckDigit, ...]
+    mask: Optional[str] = None
+    alphabet: str = DIGITS
+    reject_repeated: bool = False
+
+
+def mod11_complement(remainder: int) -> int:
+    """11 - resto, com 0 quando o resultado passa de 9 (PIS, CNPJ)."""
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def mod11_times_ten(remainder: int) -> int:
+    """Resto de (soma * 10) % 11, com 10 virando 0 (CPF, RENAVAM)."""
+    return remainder * 10 % 11 % 10
+
+
+def remainder_table(
+    mapping: Callable[[int], int], modulus: int = 11
+) -> Tuple[int, ...]:
+    return tuple(mapping(remainder) for remainder in range(modulus))
+
+
+def _char_values(alphabet: str) -> bytes:
+    table = bytearray([INVALID_CHAR]) * 256
+    for value, char in enumerate(alphabet):
+        table[ord(char)] = value
+        table[ord(char.lower())] = value
+    return bytes(table)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _validate_spec(spec: DocumentSpec) -> None:
+    # Tamanho, posições, pesos e módulos entram no código gerado.
+    if not _is_int(spec.length) or spec.length < 1:
+        raise TypeError(f"{spec.name}: length must be a positive int")
+    for rule in spec.check_digits:
+        numbers = (rule.position, rule.modulus, *rule.weights, *rule.remainders)
+        if not all(map(_is_int, numbers)) or rule.modulus < 1:
+            raise TypeError(
+                f"{spec.name}: position, weights, remainders and modulus must be "
+                "ints (modulus positive)"
+            )
+    if not spec.alphabet.isascii() or len(spec.alphabet) >= INVALID_CHAR:
+        raise ValueError(f"{spec.name}: alphabet must be ASCII")
+    if spec.mask is not None and spec.mask.count(MASK_SLOT) != spec.length:
+        raise ValueError(f"{spec.name}: mask must have {spec.length} slots")
+    for rule in spec.check_digits:
+        if not 0 <= rule.position < spec.length:
+            raise ValueError(f"{spec.name}: check digit position out of range")
+        if len(rule.weights) > rule.position and rule.weights[rule.position]:
+            raise ValueError(f"{spec.name}: check digit weighs on itself")
+        if len(rule.remainders) != rule.modulus:
+            raise ValueError(f"{spec.name}: one remainder mapping per residue")
+
+
+def _source(spec: DocumentSpec, structural: bool) -> str:
+    """Gera o código da função ``check`` (ou ``check_structure``) do documento."""
+    length = spec.length
+    digits_only = spec.alphabet == DIGITS
+    code = [
+        "def check(value, mode='any'):",
+        "    if not isinstance(value, str):",
+        "        return NOT_STR",
+    ]
+    # Sem máscara, o modo "mask" cai em ``check_mode``, que o rejeita.
+    keyword = "if"
+    if spec.mask is not None:
+        conditions = [f"len(value) != {len(spec.mask)}"]
+        conditions += [
+            f"value[{index}] != {char!r}"
+            for index, char in enumerate(spec.mask)
+            if char != MASK_SLOT
+        ]
+        code += [
+            "    if mode == 'mask':",
+            f"        if {' or '.join(conditions)}:",
+            "            return INVALID_MASK",
+        ]
+        keyword = "elif"
+    code += [
+        f"    {keyword} mode == 'digits':",
+        "        if not value.isdigit():",
+        "            return NOT_DIGITS",
+        "    elif mode == 'alphanumeric':",
+        "        if not value.isalnum():",
+        "            return NOT_DIGITS",
+        "    elif mode != 'any':",
+        "        check_mode(mode)",
+        f"    raw = value if len(value) == {length} else value.translate(STRIP)",
+        f"    if len(raw) != {length} or not raw.isascii():",
+        "        return INVALID_DATA",
+    ]
+    if digits_only:
+        code += [
+            "    if not raw.isdigit():",
+            "        return INVALID_DATA",
+        ]
+        if spec.reject_repeated or not structural:
+            code.append("    values = raw.encode()")
+    else:
+        code += [
+            "    values = raw.encode().translate(CHAR_VALUES)",
+            "    if INVALID_CHAR in values:",
+            "        return INVALID_DATA",
+        ]
+    if spec.reject_repeated:
+        code += [
+            f"    if values.count(values[0]) == {length}:",
+            "        return INVALID_DATA",
+        ]
+    if not structural:
+        # Nos documentos numéricos os bytes ASCII são somados diretamente e o
+        # deslocamento de 48 por caractere é descontado de uma só vez.
+        offset = 48 if digits_only else 0
+        for number, rule in enumerate(spec.check_digits):
+            terms = " + ".join(
+                f"values[{index}] * {weight}"
+                for index, weight in enumerate(rule.weights)
+                if weight
+            )
+            correction = offset * sum(rule.weights)
+            expected = f"values[{rule.position}]" + (f" - {offset}" if offset else "")
+            code += [
+                f"    total = {terms} - {correction}"
+                if correction
+                else f"    total = {terms}",
+                f"    if {expected} != REMAINDERS_{number}[total % {rule.modulus}]:",
+                "        return INVALID_DATA",
+            ]
+    code.append("    return None")
+    return "\n".join(code) + "\n"
+
+
+def _build(spec: DocumentSpec, structural: bool) -> Callable:
+    namespace: Dict[str, object] = {
+        "NOT_STR": NOT_STR,
+        "INVALID_MASK": INVALID_MASK,
+        "NOT_DIGITS": NOT_DIGITS,
+        "INVALID_DATA": INVALID_DATA,
+        "INVALID_CHAR": INVALID_CHAR,
+        "CHAR_VALUES": _char_values(spec.alphabet),
+        "STRIP": {ord(char): None for char in set(spec.mask or "") - {MASK_SLOT}},
+    }
+    for number, rule in enumerate(spec.check_digits):
+        namespace[f"REMAINDERS_{number}"] = rule.remainders
+    source = _source(spec, structural)
+    name = "check_structure" if structural else "check"
+    exec(compile(source, f"<{spec.name} {name}>", "exec"), namespace)
+    function = namespace["check"]
+    function.__name__ = function.__qualname__ = name
+    function.source = source
+    return function
+
+
+class SpecValidator(FieldValidator):
+    """Base dos validadores gerados por ``compile_spec``."""
+
+    spec: DocumentSpec
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def validate(self) -> bool:
+        return self.check(self.value) is None
+
+
+class SpecMaskValidator(SpecValidator, FieldMaskValidator):
+    """Base dos validadores gerados de documentos com máscara."""
+
+    def validate_mask(self) -> bool:
+        return self.check(self.value, "mask") != INVALID_MASK
+
+
+def compile_spec(spec: DocumentSpec, name: Optional[str] = None) -> Type[SpecValidator]:
+    """Gera a classe do validador do documento descrito por ``spec``."""
+    _validate_spec(spec)
+    name = name or f"{spec.name.upper()}Validator"
+    check = _build(spec, structural=False)
+    check_structure = _build(spec, structural=True)
+    validator = type(
+        name,
+        (SpecValidator if spec.mask is None else SpecMaskValidator,),
+        {
+            "spec": spec,
+            "check": staticmethod(check),
+            "check_structure": staticmethod(check_structure),
+            "__module__": __name__,
+        },
+    )
+    # O código gerado rejeita os demais modos como a classe do validador.
+    for function in (check, check_structure):
+        function.__globals__["check_mode"] = validator.check_mode
+    return validator
+
+
+PIS_SPEC = DocumentSpec(
+    name="pis",
+    length=11,
+    mask="000.00000.00-0",
+    reject_repeated=True,
+    check_digits=(
+        CheckDigit(
+            position=10,
+            weights=(3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+            remainders=remainder_table(mod11_complement),
+        ),
+    ),
+)
+
+RENAVAM_SPEC = DocumentSpec(
+    name="renavam",
+    length=11,
+    check_digits=(
+        CheckDigit(
+            position=10,
+            weights=(3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+            remainders=remainder_table(mod11_times_ten),
+        ),
+    ),
+)
+
+PISValidator = compile_spec(PIS_SPEC)
+RENAVAMValidator = compile_spec(RENAVAM_SPEC)
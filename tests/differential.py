@@ -0,0 +1,442 @@
+"""
+Teste diferencial dos validadores contra a referência congelada em
+``tests/reference_validators.py``.
+
+Entradas válidas são geradas para cada tipo de documento, formatadas com e
+sem máscara e mutadas (troca, remoção, inserção e transposição de
+caracteres, caixa, separadores, dígitos Unicode, valores que não são str).
+Cada entrada passa por todos os backends do tipo (``check``, ``check_many``,
+lotes, validadores por estado, validação estrutural seguida da completa) em
+todos os modos, e qualquer diferença em relação à referência é reduzida a
+um reprodutor mínimo.
+
+Para rodar com milhões de entradas:
+
+    python -m tests.differential --count 1000000 --seed 7 --jobs 8
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic_br_validator.batch import (
+    classify_rgs,
+    get_validator,
+    validate_batch,
+    validate_batch_parallel,
+)
+from pydantic_br_validator.validators.cep_validator import CEPValidator
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_or_cnpj_validator import (
+    CPFOrCNPJValidator,
+)
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+from pydantic_br_validator.validators.rg_validator import RGValidator
+
+from . import reference_validators as reference
+
+MODES = ("any", "mask", "digits", "alphanumeric")
+
+Outcome = Optional[str]
+Run = Callable[[List, str], List[Outcome]]
+
+
+class Backend(NamedTuple):
+    """
+    Implementação comparada com a referência. ``expected`` substitui a
+    referência do tipo.
+    """
+
+    name: str
+    run: Run
+    expected: Optional[Run] = None
+
+
+class Mismatch(NamedTuple):
+    kind: str
+    backend: str
+    mode: str
+    value: object
+    minimal: object
+    expected: Outcome
+    actual: Outcome
+
+    def __str__(self) -> str:
+        return (
+            f"{self.kind}/{self.backend} mode={self.mode}: {self.minimal!r} "
+            f"(de {self.value!r}) esperado {self.expected!r}, obtido {self.actual!r}"
+        )
+
+
+def outcome(function: Callable, *args) -> Outcome:
+    """Código do erro, ou o tipo da exceção levantada."""
+    try:
+        return function(*args)
+    except Exception as error:
+        return f"raises {type(error).__name__}"
+
+
+def single(function: Callable[[object, str], Outcome]) -> Run:
+    return lambda values, mode: [outcome(function, value, mode) for value in values]
+
+
+def batched(function: Callable[[List, str], List[Outcome]]) -> Run:
+    """Backend de lote; se o lote inteiro falhar, cada valor é rodado sozinho."""
+
+    def run(values: List, mode: str) -> List[Outcome]:
+        try:
+            return list(function(values, mode))
+        except Exception:
+            return [outcome(lambda: function([value], mode)[0]) for value in values]
+
+    return run
+
+
+def referenced(validator) -> Run:
+    return single(lambda value, mode: reference.check(validator, value, mode))
+
+
+def validity(run: Run) -> Run:
+    return lambda values, mode: [
+        "valid" if result is None else "invalid" for result in run(values, mode)
+    ]
+
+
+def either(first: Run, second: Run) -> Run:
+    """Válido quando for válido para uma das duas referências."""
+
+    def run(values: List, mode: str) -> List[Outcome]:
+        pairs = zip(first(values, mode), second(values, mode))
+        return ["valid" if None in pair else "invalid" for pair in pairs]
+
+    return run
+
+
+def cpf_digits(run: Run) -> Run:
+    """O CPF da união é CPFDigits: no modo "alphanumeric" vale "digits"."""
+    return lambda values, mode: run(
+        values, "digits" if mode == "alphanumeric" else mode
+    )
+
+
+def structural_then_full(validator) -> Run:
+    """Como os campos sob demanda: estrutura na carga, dígitos no uso."""
+
+    def check(value, mode: str) -> Outcome:
+        return validator.check_structure(value, mode) or validator.check(value, mode)
+
+    return single(check)
+
+
+REFERENCES: Dict[str, Run] = {
+    "cpf": referenced(reference.CPFReference),
+    "cnpj": referenced(reference.CNPJReference),
+    "cnh": referenced(reference.CNHReference),
+    "rg": referenced(reference.RGReference),
+    "cep": referenced(reference.CEPReference),
+}
+
+BACKENDS: Dict[str, List[Backend]] = {
+    kind: [
+        Backend("check", single(validator.check)),
+        Backend("check_many", batched(validator.check_many)),
+        Backend(
+            "validate_batch",
+            batched(lambda values, mode, kind=kind: validate_batch(values, kind, mode)),
+        ),
+        Backend(
+            "validate_batch_parallel",
+            batched(
+                lambda values, mode, kind=kind: validate_batch_parallel(
+                    values, kind, mode, workers=4, chunk_size=97
+                )
+            ),
+        ),
+        Backend("check_structure+check", structural_then_full(validator)),
+    ]
+    for kind, validator in (
+        ("cpf", CPFValidator),
+        ("cnpj", CNPJValidator),
+        ("cnh", CNHValidator),
+        ("rg", RGValidator),
+        ("cep", CEPValidator),
+    )
+}
+BACKENDS["rg"] += [
+    Backend("for_state(MG)", single(RGValidator.for_state("MG").check)),
+    Backend(
+        "classify_rgs", batched(lambda values, mode: classify_rgs(values, "MG", mode))
+    ),
+]
+for _kind in ("cpf", "cnpj"):
+    BACKENDS[_kind].append(
+        Backend(
+            "CPFOrCNPJ",
+            validity(single(CPFOrCNPJValidator.check)),
+            either(cpf_digits(REFERENCES["cpf"]), REFERENCES["cnpj"]),
+        )
+    )
+
+
+def _cpf_digits(base: str) -> str:
+    for weight in (10, 11):
+        total = sum(int(d) * w for d, w in zip(base, range(weight, 1, -1)))
+        base += str(total * 10 % 11 % 10)
+    return base
+
+
+def _cnpj_digits(base: str) -> str:
+    for weights in (
+        (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+        (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2),
+    ):
+        total = sum((ord(c.upper()) - 48) * w for c, w in zip(base, weights))
+        remainder = total % 11
+        base += str(0 if remainder < 2 else 11 - remainder)
+    return base
+
+
+def _cnh_digits(base: str) -> str:
+    first = sum(int(d) * w for d, w in zip(base, range(9, 0, -1))) % 11
+    dsc = 0
+    if first >= 10:
+        first, dsc = 0, 2
+    second = (sum(int(d) * w for d, w in zip(base, range(1, 10))) % 11 - dsc) % 11
+    return base + str(first) + str(0 if second >= 10 else second)
+
+
+def _document(kind: str, rng: random.Random) -> str:
+    digits = string.digits
+    if kind == "cpf":
+        if rng.random() < 0.02:
+            return rng.choice(digits) * 11
+        return _cpf_digits("".join(rng.choices(digits, k=9)))
+    if kind == "cnpj":
+        alphabet = digits + string.ascii_uppercase if rng.random() < 0.3 else digits
+        cnpj = _cnpj_digits("".join(rng.choices(alphabet, k=12)))
+        return cnpj.lower() if rng.random() < 0.1 else cnpj
+    if kind == "cnh":
+        if rng.random() < 0.02:
+            return rng.choice(digits) * 11
+        return _cnh_digits("".join(rng.choices(digits, k=9)))
+    if kind == "rg":
+        size = rng.choice((8, 9))
+        last = rng.choice(digits + "Xx")
+        return "".join(rng.choices(digits, k=size - 1)) + last
+    return "".join(rng.choices(digits, k=8))
+
+
+MASKS = {
+    "cpf": "000.000.000-00",
+    "cnpj": "00.000.000/0000-00",
+    "cnh": "00000000000",
+    "rg": "00.000.000-0",
+    "cep": "00000-000",
+}
+
+NOISE = string.digits + string.ascii_letters + ".-/ _\t\n" + "٣１²¹€çÁ"
+
+
+def _format(kind: str, document: str, rng: random.Random) -> str:
+    choice = rng.random()
+    if choice < 0.4:
+        return document
+    mask = MASKS[kind]
+    if mask.count("0") != len(document):
+        return document
+    chars = iter(document)
+    masked = "".join(next(chars) if slot == "0" else slot for slot in mask)
+    if choice < 0.85:
+        return masked
+    # Máscara parcial ou com separadores trocados.
+    separators = [
+        index for index, char in enumerate(masked) if char != "0" and not char.isalnum()
+    ]
+    if not separators:
+        return masked
+    index = rng.choice(separators)
+    replacement = rng.choice(("", ".", "-", "/", " "))
+    return masked[:index] + replacement + masked[index + 1 :]
+
+
+def _mutate(value: str, rng: random.Random) -> str:
+    operation = rng.randrange(7)
+    index = rng.randrange(len(value) + 1)
+    if operation == 0 and value:
+        index = min(index, len(value) - 1)
+        return value[:index] + rng.choice(NOISE) + value[index + 1 :]
+    if operation == 1 and value:
+        return value[:index] + value[index + 1 :]
+    if operation == 2:
+        return value[:index] + rng.choice(NOISE) + value[index:]
+    if operation == 3 and len(value) > 1:
+        index = min(index, len(value) - 2)
+        return value[:index] + value[index + 1] + value[index] + value[index + 2 :]
+    if operation == 4:
+        return value.swapcase()
+    if operation == 5:
+        return value[: rng.randrange(len(value) + 1)]
+    return value + value[-rng.randrange(1, 3) :] if value else value
+
+
+def generate(kind: str, count: int, seed: Union[int, str] = 0) -> Iterator[object]:
+    """Entradas do tipo: válidas, formatadas e mutadas, e alguns não-str."""
+    rng = random.Random(f"{kind}:{seed}")
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.01:
+            yield rng.choice((None, 0, 12345678909, b"04120039021", 1.5, ["x"]))
+            continue
+        value = _format(kind, _document(kind, rng), rng)
+        if roll > 0.35:
+            for _ in range(1 + (roll > 0.85)):
+                value = _mutate(value, rng)
+        yield value
+
+
+def shrink(value, fails: Callable[[object], bool]) -> object:
+    """Reduz a entrada enquanto ela continuar reproduzindo a diferença."""
+    if not isinstance(value, str):
+        return value
+    changed = True
+    while changed:
+        changed = False
+        for index in range(len(value)):
+            candidate = value[:index] + value[index + 1 :]
+            if fails(candidate):
+                value, changed = candidate, True
+                break
+        else:
+            for index, char in enumerate(value):
+                if char != "0":
+                    candidate = value[:index] + "0" + value[index + 1 :]
+                    if fails(candidate):
+                        value, changed = candidate, True
+                        break
+    return value
+
+
+def supports(kind: str, mode: str) -> bool:
+    """O modo existe para o tipo (a CNH não tem máscara)."""
+    try:
+        get_validator(kind, mode)
+    except ValueError:
+        return False
+    return True
+
+
+def compare(
+    kind: str,
+    values: Sequence,
+    backends: Optional[Sequence[Backend]] = None,
+    modes: Sequence[str] = MODES,
+) -> List[Mismatch]:
+    """Compara cada backend com a referência; um reprodutor por backend e modo."""
+    mismatches = []
+    for backend in BACKENDS[kind] if backends is None else backends:
+        expected_run = backend.expected or REFERENCES[kind]
+        for mode in modes:
+            if not supports(kind, mode):
+                continue
+            expected = expected_run(values, mode)
+            actual = backend.run(values, mode)
+            for value, want, got in zip(values, expected, actual):
+                if want != got:
+                    minimal = shrink(
+                        value, _reproduces(backend, expected_run, mode, want, got)
+                    )
+                    mismatches.append(
+                        Mismatch(kind, backend.name, mode, value, minimal, want, got)
+                    )
+                    break
+    return mismatches
+
+
+def _reproduces(
+    backend: Backend, expected_run: Run, mode: str, want: Outcome, got: Outcome
+) -> Callable[[object], bool]:
+    """A entrada reduzida deve reproduzir a mesma diferença."""
+
+    def fails(candidate) -> bool:
+        return expected_run([candidate], mode) == [want] and backend.run(
+            [candidate], mode
+        ) == [got]
+
+    return fails
+
+
+def run(
+    count: int,
+    seed: int = 0,
+    kinds: Sequence[str] = tuple(BACKENDS),
+    chunk_size: int = 10_000,
+    jobs: int = 1,
+) -> List[Mismatch]:
+    """
+    Roda ``count`` entradas geradas de cada tipo por todos os backends, em
+    blocos de ``chunk_size`` com sementes próprias, divididos entre ``jobs``
+    processos.
+    """
+    tasks = [
+        (kind, min(chunk_size, count - start), f"{seed}:{start}")
+        for kind in kinds
+        for start in range(0, count, chunk_size)
+    ]
+    if jobs > 1:
+        with ProcessPoolExecutor(jobs) as executor:
+            results = list(executor.map(_run_chunk, tasks))
+    else:
+        results = list(map(_run_chunk, tasks))
+    mismatches: List[Mismatch] = []
+    seen = set()
+    for result in results:
+        mismatches += _new(result, seen)
+    return mismatches
+
+
+def _run_chunk(task) -> List[Mismatch]:
+    kind, size, seed = task
+    return compare(kind, list(generate(kind, size, seed)))
+
+
+def _new(mismatches: List[Mismatch], seen: set) -> List[Mismatch]:
+    fresh = []
+    for mismatch in mismatches:
+        key = mismatch[:3]
+        if key not in seen:
+            seen.add(key)
+            fresh.append(mismatch)
+    return fresh
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000, help="entradas por tipo")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--kind", action="append", choices=sorted(BACKENDS))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    kinds = args.kind or tuple(BACKENDS)
+    mismatches = run(args.count, args.seed, kinds, jobs=args.jobs)
+    for mismatch in mismatches:
+        print(mismatch)
+    print(f"{len(mismatches)} diferença(s)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
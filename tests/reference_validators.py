@@ -0,0 +1,242 @@
+"""
+Cópia congelada dos validadores como eram antes das rotinas de passagem
+única, usada como referência pelo teste diferencial (tests/differential.py).
+
+Não altere este arquivo para acompanhar otimizações: ele define o
+comportamento esperado. Mudanças intencionais de comportamento devem ser
+feitas aqui e nos validadores, no mesmo commit.
+"""
+
+import re
+from typing import Optional
+
+NOT_STR = "not_str"
+INVALID_MASK = "invalid_mask"
+NOT_DIGITS = "not_digits"
+INVALID_DATA = "invalid_data"
+
+
+def check(validator, value, mode: str = "any") -> Optional[str]:
+    """Validação em etapas, como ``FieldValidator.check`` original."""
+    if not isinstance(value, str):
+        return NOT_STR
+    if mode == "mask" and not validator(value).validate_mask():
+        return INVALID_MASK
+    if mode == "digits" and not value.isdigit():
+        return NOT_DIGITS
+    if mode == "alphanumeric" and not value.isalnum():
+        return NOT_DIGITS
+    if not validator(value).validate():
+        return INVALID_DATA
+    return None
+
+
+class CPFReference:
+    def __init__(self, cpf: str) -> None:
+        self.cpf = cpf
+
+    def validate_mask(self) -> bool:
+        if len(self.cpf) == 14:
+            if self.cpf[3:4] == "." and self.cpf[7:8] == "." and self.cpf[11:12] == "-":
+                return True
+        return False
+
+    def validate(self) -> bool:
+        cpf = re.sub("[^0-9]", "", str(self.cpf))
+
+        if len(set(cpf)) == 1:
+            return False
+
+        if len(cpf) != 11:
+            return False
+
+        first_digit = self._validate_first_digit(cpf)
+        second_digit = self._validate_second_digit(cpf)
+        return cpf[9] == first_digit and cpf[10] == second_digit
+
+    def _validate_first_digit(self, cpf: str) -> str:
+        sum = 0
+
+        for i in range(10, 1, -1):
+            sum += int(cpf[10 - i]) * i
+
+        sum = (sum * 10) % 11
+
+        if sum == 10:
+            sum = 0
+
+        return str(sum)
+
+    def _validate_second_digit(self, cpf: str) -> str:
+        sum = 0
+
+        for i in range(11, 1, -1):
+            sum += int(cpf[11 - i]) * i
+
+        sum = (sum * 10) % 11
+
+        if sum == 10:
+            sum = 0
+
+        return str(sum)
+
+
+class CNPJReference:
+    def __init__(self, cnpj) -> None:
+        self.cnpj = cnpj
+
+    def validate_mask(self) -> bool:
+        if len(self.cnpj) == 18:
+            if (
+                self.cnpj[2:3] == "."
+                and self.cnpj[6:7] == "."
+                and self.cnpj[10:11] == "/"
+                and self.cnpj[15:16] == "-"
+            ):
+                return True
+        return False
+
+    def _get_char_value(self, char: str) -> int:
+        return ord(char.upper()) - 48
+
+    def _is_valid_cnpj_char(self, char: str) -> bool:
+        return char.isdigit() or (char.upper() >= "A" and char.upper() <= "Z")
+
+    def _clean_cnpj(self, cnpj: str) -> str:
+        return re.sub(r"[.\-/]", "", cnpj).upper()
+
+    def validate(self) -> bool:
+        cnpj = self._clean_cnpj(self.cnpj)
+
+        if len(cnpj) != 14:
+            return False
+
+        for char in cnpj[:12]:
+            if not self._is_valid_cnpj_char(char):
+                return False
+
+        if not cnpj[12:14].isdigit():
+            return False
+
+        first_digit = self._validate_first_digit(cnpj)
+        second_digit = self._validate_second_digit(cnpj)
+        return cnpj[12] == first_digit and cnpj[13] == second_digit
+
+    def _validate_first_digit(self, cnpj: str) -> str:
+        total = 0
+        weight = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+
+        for n in range(12):
+            value = self._get_char_value(cnpj[n]) * weight[n]
+            total = total + value
+
+        check_digit = total % 11
+
+        if check_digit < 2:
+            first_digit = 0
+        else:
+            first_digit = 11 - check_digit
+        return str(first_digit)
+
+    def _validate_second_digit(self, cnpj: str) -> str:
+        total = 0
+        weight = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+        for n in range(13):
+            total = total + self._get_char_value(cnpj[n]) * weight[n]
+
+        check_digit = total % 11
+
+        if check_digit < 2:
+            second_digit = 0
+        else:
+            second_digit = 11 - check_digit
+        return str(second_digit)
+
+
+class CNHReference:
+    def __init__(self, cnh: str) -> None:
+        self.cnh = cnh
+
+    def validate(self) -> bool:
+        cnh = re.sub("[^0-9]", "", str(self.cnh))
+
+        if len(set(cnh)) == 1:
+            return False
+
+        if len(cnh) != 11:
+            return False
+
+        first_digit = self._validate_first_digit(cnh)
+        second_digit = self._validate_second_digit(cnh)
+        return cnh[9] == first_digit and cnh[10] == second_digit
+
+    def _validate_first_digit(self, cnh: str) -> str:
+        self.dsc = 0
+        sum = 0
+
+        for i in range(9, 0, -1):
+            sum += int(cnh[9 - i]) * i
+
+        first_digit = sum % 11
+        if first_digit >= 10:
+            first_digit, self.dsc = 0, 2
+        return str(first_digit)
+
+    def _validate_second_digit(self, cnh: str) -> str:
+        sum = 0
+
+        for i in range(1, 10):
+            sum += int(cnh[i - 1]) * i
+
+        rest = sum % 11
+
+        second_digit = rest - self.dsc
+        if second_digit < 0:
+            second_digit += 11
+        if second_digit >= 10:
+            second_digit = 0
+        return str(second_digit)
+
+
+class RGReference:
+    def __init__(self, rg: str) -> None:
+        self.rg = rg
+
+    def validate_mask(self) -> bool:
+        parts = self.rg.split(".")
+        if len(parts) != 3:
+            return False
+        if len(parts[0]) != 2 or len(parts[1]) != 3 or len(parts[2]) != 5:
+            return False
+        if parts[2][3] != "-":
+            return False
+        return all(part.replace("-", "").isdigit() for part in parts)
+
+    def validate(self) -> bool:
+        rg_clean = self.rg.replace(".", "").replace("-", "")
+        if len(rg_clean) not in [8, 9]:
+            return False
+        if rg_clean[-1].upper() == "X":
+            if not rg_clean[:-1].isdigit():
+                return False
+        elif not rg_clean.isdigit():
+            return False
+        if "." in self.rg or "-" in self.rg:
+            return self.validate_mask()
+        return True
+
+
+class CEPReference:
+    def __init__(self, cep) -> None:
+        self.cep = cep
+
+    def validate_mask(self) -> bool:
+        if len(self.cep) == 9:
+            return self.cep[5] == "-"
+
+    def validate(self) -> bool:
+        cep = self.cep.replace("-", "")
+
+        if len(cep) != 8:
+            return False
+        return True
@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from pydantic_br_validator._http import encode_request
+from pydantic_br_validator.address import (
+    Address,
+    AddressError,
+    CEPResolver,
+    HTTPUpstream,
+)
+from pydantic_br_validator.stubs import CEPStubServer
+
+PAULISTA = {
+    "cep": "01310-100",
+    "logradouro": "Avenida Paulista",
+    "bairro": "Bela Vista",
+    "localidade": "São Paulo",
+    "uf": "SP",
+}
+SE = {
+    "street": "Praça da Sé",
+    "district": "Sé",
+    "city": "São Paulo",
+    "state": "SP",
+}
+ADDRESSES = {"01310100": PAULISTA, "01001000": SE}
+
+
+def run_with_resolver(scenario, latency=0.0, **options):
+    async def main():
+        async with CEPStubServer(ADDRESSES, latency=latency) as stub:
+            async with CEPResolver(stub.base_url, **options) as resolver:
+                return await scenario(resolver, stub)
+
+    return asyncio.run(main())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DictUpstream:
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.calls = []
+
+    async def fetch(self, cep):
+        self.calls.append(cep)
+        await asyncio.sleep(0)
+        return self.addresses.get(cep)
+
+
+def test_resolve_address():
+    async def scenario(resolver, stub):
+        return await resolver.resolve("01310-100")
+
+    address = run_with_resolver(scenario)
+    assert address == Address(
+        "01310100", "Avenida Paulista", "Bela Vista", "São Paulo", "SP", PAULISTA
+    )
+
+
+def test_resolve_many_keeps_order_and_unknown_ceps():
+    async def scenario(resolver, stub):
+        return await resolver.resolve_many(["01001000", "99999999", "01310100"])
+
+    se, unknown, paulista = run_with_resolver(scenario)
+    assert (se.street, se.district, se.state) == ("Praça da Sé", "Sé", "SP")
+    assert unknown is None
+    assert paulista.city == "São Paulo"
+
+
+def test_concurrent_resolutions_are_deduplicated():
+    async def scenario(resolver, stub):
+        await resolver.resolve_many(["01310100", "01310-100", "01310100"])
+        return resolver.fetches, len(stub.requests)
+
+    assert run_with_resolver(scenario, latency=0.01) == (1, 1)
+
+
+def test_concurrency_limit():
+    async def scenario(resolver, stub):
+        ceps = [f"{n:08d}" for n in range(10)]
+        await resolver.resolve_many(ceps)
+        return stub.max_active, resolver.upstream.pool.connections_opened
+
+    max_active, opened = run_with_resolver(scenario, latency=0.01, max_concurrency=3)
+    assert max_active == 3
+    assert opened == 3
+
+
+def test_cache_hits_and_ttl():
+    clock = FakeClock()
+    upstream = DictUpstream(ADDRESSES)
+
+    async def scenario():
+        resolver = CEPResolver(upstream, ttl=60, clock=clock)
+        await resolver.resolve("01310100")
+        await resolver.resolve("99999999")
+        await resolver.resolve("01310100")
+        await resolver.resolve("99999999")
+        clock.now = 61
+        await resolver.resolve("01310100")
+        return resolver.cache.hits
+
+    assert asyncio.run(scenario()) == 2
+    assert upstream.calls == ["01310100", "99999999", "01310100"]
+
+
+def test_invalid_cep_is_rejected():
+    upstream = DictUpstream(ADDRESSES)
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await CEPResolver(upstream).resolve("0131010")
+
+    asyncio.run(scenario())
+    assert upstream.calls == []
+
+
+def test_upstream_failure_is_not_cached():
+    class FlakyUpstream(DictUpstream):
+        async def fetch(self, cep):
+            if not self.calls:
+                self.calls.append(cep)
+                raise ConnectionError("boom")
+            return await super().fetch(cep)
+
+    upstream = FlakyUpstream(ADDRESSES)
+
+    async def scenario():
+        resolver = CEPResolver(upstream)
+        with pytest.raises(AddressError):
+            await resolver.resolve("01310100")
+        return await resolver.resolve("01310100")
+
+    assert asyncio.run(scenario()).street == "Avenida Paulista"
+
+
+def test_http_upstream_path_template():
+    async def scenario():
+        async with CEPStubServer(ADDRESSES) as stub:
+            upstream = HTTPUpstream(stub.base_url + "/cep", path="/{cep}")
+            try:
+                return (
+                    await upstream.fetch("01001-000"),
+                    await upstream.fetch("99999999"),
+                )
+            finally:
+                await upstream.close()
+
+    assert asyncio.run(scenario()) == (SE, None)
+
+
+@pytest.mark.parametrize(
+    "cep", ["../admin", "abcdefgh", "0131\r\nX:", "0131010\uff10", "01310 100"]
+)
+def test_only_normalized_ceps_must_reach_the_upstream(cep):
+    upstream = DictUpstream(ADDRESSES)
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await CEPResolver(upstream).resolve(cep)
+        with pytest.raises(ValueError):
+            await HTTPUpstream("http://127.0.0.1:1").fetch(cep)
+
+    asyncio.run(scenario())
+    assert upstream.calls == []
+
+
+@pytest.mark.parametrize("path", ["/cep/a\r\nX:cd", "/cep/a b", "/cep/\u00e9"])
+def test_request_line_must_not_carry_control_characters(path):
+    with pytest.raises(ValueError, match="invalid request path"):
+        encode_request("GET", path, "localhost")
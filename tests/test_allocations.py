@@ -0,0 +1,179 @@
+import gc
+import platform
+import sys
+
+import pytest
+
+import pydantic_br_validator as fields
+from pydantic_br_validator.batch import validate_batch
+
+if platform.python_implementation() != "CPython":
+    pytest.skip(
+        "os orçamentos são tamanhos de objetos do CPython", allow_module_level=True
+    )
+
+tracemalloc = pytest.importorskip("tracemalloc")
+
+
+def _tracing() -> bool:
+    """A cobertura (pytest --cov) também aloca memória a cada linha executada."""
+    if sys.gettrace() is not None:
+        return True
+    coverage = sys.modules.get("coverage")
+    return coverage is not None and coverage.Coverage.current() is not None
+
+
+pytestmark = pytest.mark.skipif(_tracing(), reason="medição inválida sob cobertura")
+
+# Orçamento de alocação, em bytes no pico por validação, acima do custo de uma
+# chamada vazia, conferido no CPython 3.9, 3.10 e 3.11. O caminho válido não
+# deve criar objetos além de uma ou outra cópia do valor sem máscara; um
+# aumento aqui quase sempre é um re.sub, um set(), uma fatia ou um objeto
+# validador novo no caminho quente. Se uma mudança precisar de mais memória,
+# o orçamento deve ser revisto junto com ela.
+VALID_BUDGETS = {
+    "CPF": ("041.200.390-21", 128),
+    "CPFMask": ("041.200.390-21", 128),
+    "CPFDigits": ("04120039021", 128),
+    "CNPJ": ("47.895.328/0001-87", 448),
+    "CNPJMask": ("47.895.328/0001-87", 448),
+    "CNPJDigits": ("47895328000187", 384),
+    "CNH": ("49761142867", 128),
+    "CEP": ("59151-650", 128),
+    "CEPMask": ("59151-650", 128),
+    "CEPDigits": ("59151650", 128),
+    "RG": ("12.345.678-9", 384),
+    "RGMask": ("12.345.678-9", 384),
+    "RGDigits": ("123456789", 128),
+    "CPFOrCNPJ": ("47.895.328/0001-87", 512),
+    "CPFOrCNPJMask": ("041.200.390-21", 320),
+    "CPFOrCNPJDigits": ("04120039021", 320),
+    "PIS": ("120.56789.01-0", 512),
+    "PISMask": ("120.56789.01-0", 320),
+    "PISDigits": ("12056789010", 256),
+    "RENAVAM": ("63929292926", 192),
+    # O valor guardado é um LazyDocument, com os atributos da conferência.
+    "LazyCPF": ("041.200.390-21", 768),
+    "LazyCNPJ": ("47.895.328/0001-87", 768),
+}
+
+# Os inválidos pagam pela exceção (instância, argumentos e traceback).
+INVALID_BUDGET = 1280
+
+# Blocos ainda vivos depois de todas as chamadas, independente do número de
+# chamadas: variáveis do próprio laço de medição e caches do interpretador
+# (mais numerosos no 3.9 e no 3.10). Um vazamento deixa um bloco por chamada.
+RETAINED_BLOCKS = 32
+
+
+def call(function, value):
+    try:
+        function(value)
+    except ValueError:
+        pass
+
+
+def peak_allocation(function, value, calls=50):
+    """Maior pico de memória alocada em uma chamada, acima de uma chamada vazia."""
+    return _peak(function, value, calls) - _peak(lambda value: None, value, calls)
+
+
+def _peak(function, value, calls):
+    for _ in range(10):
+        call(function, value)
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        worst = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            call(function, value)
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - start)
+        return worst
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+
+def retained_blocks(function, value, calls=1000):
+    """Blocos alocados durante as chamadas que continuam vivos no final."""
+    for _ in range(10):
+        call(function, value)
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(calls):
+            call(function, value)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    before, after = before.filter_traces(ignore), after.filter_traces(ignore)
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+@pytest.mark.parametrize("name", VALID_BUDGETS)
+def test_valid_path_must_stay_within_budget(name):
+    field = getattr(fields, name)
+    value, budget = VALID_BUDGETS[name]
+    assert field._validate(value) == value
+    assert peak_allocation(field._validate, value) <= budget
+
+
+@pytest.mark.parametrize("name", VALID_BUDGETS)
+@pytest.mark.parametrize(
+    "invalid",
+    [
+        pytest.param(lambda value: value[:-2], id="invalid_data"),
+        pytest.param(lambda value: "0" + value, id="invalid_length"),
+        pytest.param(lambda value: 5, id="not_str"),
+    ],
+)
+def test_invalid_path_must_stay_within_budget(name, invalid):
+    field = getattr(fields, name)
+    value = invalid(VALID_BUDGETS[name][0])
+    with pytest.raises(ValueError):
+        field._validate(value)
+    assert peak_allocation(field._validate, value) <= INVALID_BUDGET
+
+
+@pytest.mark.parametrize("name", VALID_BUDGETS)
+def test_check_must_stay_within_the_field_budget(name):
+    field = getattr(fields, name)
+    value, budget = VALID_BUDGETS[name]
+    check = field.Validator.check
+    assert peak_allocation(lambda value: check(value, field.mode), value) <= budget
+
+
+@pytest.mark.parametrize("name", ["CPF", "CNPJ", "RG", "CPFOrCNPJ", "PIS"])
+@pytest.mark.parametrize("valid", [True, False])
+def test_validation_must_not_retain_memory(name, valid):
+    field = getattr(fields, name)
+    value = VALID_BUDGETS[name][0]
+    value = value if valid else value[:-2]
+    assert retained_blocks(field._validate, value) <= RETAINED_BLOCKS
+
+
+@pytest.mark.parametrize(
+    "kind, value, budget",
+    [
+        ("cpf", "041.200.390-21", 0),
+        ("cnh", "49761142867", 0),
+        ("rg", "12.345.678-9", 0),
+        ("cep", "59151-650", 0),
+        # O lote de CNPJs guarda a cópia sem máscara de cada valor para somar
+        # as raízes uma única vez por empresa.
+        ("cnpj", "47.895.328/0001-87", 160),
+    ],
+)
+def test_batch_must_stay_within_budget(kind, value, budget):
+    batch = [value] * 1000
+    # Além do orçamento por valor: uma referência por resultado, a folga de
+    # crescimento da lista e o custo de uma validação isolada.
+    total = len(batch) * (budget + 9) + 640
+    assert peak_allocation(lambda batch: validate_batch(batch, kind), batch) <= total
@@ -0,0 +1,128 @@
+import pytest
+from faker import Faker
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pydantic_br_validator import arrow  # noqa: E402
+from pydantic_br_validator.arrow import validate_array, validate_parquet  # noqa: E402
+from pydantic_br_validator.batch import get_validator  # noqa: E402
+
+from .differential import generate  # noqa: E402
+
+fake = Faker("pt-BR")
+
+MODES = ["any", "mask", "digits", "alphanumeric"]
+
+
+def strings(kind, count=1500):
+    values = generate(kind, count, seed="arrow")
+    return [value for value in values if isinstance(value, str)] + [None]
+
+
+@pytest.mark.parametrize("string_type", [pa.string(), pa.large_string()])
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("kind", ["cpf", "cnpj", "cep", "rg"])
+def test_validate_array_must_agree_with_check(kind, mode, string_type):
+    values = strings(kind)
+    # A fatia começa fora do início dos buffers.
+    column = pa.array([None] + values, string_type).slice(1)
+    result = validate_array(column, kind, mode)
+    expected = [
+        None if value is None else get_validator(kind).check(value, mode)
+        for value in values
+    ]
+    assert result.errors.to_pylist() == expected
+    assert result.valid.to_pylist() == [
+        None if value is None else error is None
+        for value, error in zip(values, expected)
+    ]
+
+
+def test_documents_in_exact_format_must_skip_the_per_value_scan(monkeypatch):
+    def scan(*args):
+        raise AssertionError("unexpected per-value scan")
+
+    monkeypatch.setattr(arrow, "_scan", scan)
+    cnpjs = [fake.cnpj() for _ in range(50)]
+    column = pa.array(
+        cnpjs
+        + [cnpj.replace(".", "").replace("/", "").replace("-", "") for cnpj in cnpjs]
+        + [None]
+    )
+    assert validate_array(column, "cnpj").valid.true_count == 100
+    column = pa.array(["12.ABC.345/01DE-35", "12abc34501de35", "12ABC34501DE36"])
+    assert validate_array(column, "cnpj").valid.to_pylist() == [True, True, False]
+    column = pa.array([fake.cpf() for _ in range(50)] + ["111.111.111-11"])
+    assert validate_array(column, "cpf").valid.false_count == 1
+
+
+@pytest.mark.parametrize(
+    "kind, values, normalized",
+    [
+        (
+            "cpf",
+            ["041.200.390-21", "04120039021", "041.200.390-22"],
+            ["04120039021", "04120039021", None],
+        ),
+        (
+            "cnpj",
+            ["12.abc.345/01de-35", "47895328000187", None],
+            ["12ABC34501DE35", "47895328000187", None],
+        ),
+        ("cep", ["59151-650", "5915165"], ["59151650", None]),
+    ],
+)
+def test_normalized_column_must_hold_valid_documents_only(kind, values, normalized):
+    result = validate_array(pa.array(values), kind, normalize=True)
+    assert result.normalized.type == pa.string()
+    assert result.normalized.to_pylist() == normalized
+
+
+def test_errors_must_be_a_compact_dictionary_column():
+    result = validate_array(
+        pa.array(["04120039021", "0412003902", None]), "cpf", "mask"
+    )
+    assert result.errors.type == pa.dictionary(pa.int8(), pa.string())
+    assert result.errors.dictionary.to_pylist() == [
+        "not_str",
+        "invalid_mask",
+        "not_digits",
+        "invalid_data",
+    ]
+    assert result.errors.to_pylist() == ["invalid_mask", "invalid_mask", None]
+
+
+def test_dictionary_and_chunked_arrays():
+    values = [fake.cnpj() for _ in range(5)] * 3 + ["00.000.000/0000-00", None]
+    plain = validate_array(pa.array(values), "cnpj", normalize=True)
+    encoded = validate_array(
+        pa.array(values).dictionary_encode(), "cnpj", normalize=True
+    )
+    chunked = validate_array(
+        pa.chunked_array([pa.array(values[:7]), pa.array(values[7:])]),
+        "cnpj",
+        normalize=True,
+    )
+    for result in (encoded, chunked):
+        assert result.valid.to_pylist() == plain.valid.to_pylist()
+        assert result.errors.to_pylist() == plain.errors.to_pylist()
+        assert result.normalized.to_pylist() == plain.normalized.to_pylist()
+
+
+def test_validate_parquet_must_read_row_group_by_row_group(tmp_path):
+    cpfs = [fake.cpf() for _ in range(25)] + ["000.000.000-00"]
+    path = tmp_path / "clientes.parquet"
+    pq.write_table(pa.table({"cpf": cpfs}), path, row_group_size=10)
+    results = list(validate_parquet(path, "cpf", kind="cpf", normalize=True))
+    assert [index for index, _ in results] == [0, 1, 2]
+    assert [len(result.valid) for _, result in results] == [10, 10, 6]
+    assert results[-1][1].valid.to_pylist()[-1] is False
+    assert sum(result.valid.to_pylist().count(True) for _, result in results) == 25
+
+
+def test_validate_array_must_reject_other_types_and_kinds():
+    with pytest.raises(TypeError, match="expected a string array"):
+        validate_array(pa.array([1, 2]), "cpf")
+    with pytest.raises(ValueError, match="unknown document kind"):
+        validate_array(pa.array(["1"]), "pis")
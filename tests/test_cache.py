@@ -0,0 +1,108 @@
+import pytest
+
+from pydantic_br_validator.batch import validate_batch
+from pydantic_br_validator.cache import ValidationStore
+
+VALUES = [
+    "041.200.390-21",
+    "04120039021",
+    "04120039022",
+    "11111111111",
+    "041.200.390-21",
+]
+
+
+class CountingStore(ValidationStore):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.written = []
+
+    def put_many(self, kind, mode, results):
+        self.written.extend(results)
+        super().put_many(kind, mode, results)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.sqlite")
+
+
+def test_validate_batch_must_match_without_store(path):
+    with ValidationStore(path) as store:
+        assert validate_batch(VALUES + [123], "cpf", store=store) == validate_batch(
+            VALUES + [123], "cpf"
+        )
+
+
+def test_results_must_persist_between_runs(path):
+    with CountingStore(path) as store:
+        first = validate_batch(VALUES, "cpf", store=store)
+        assert sorted(store.written) == sorted(set(VALUES))
+    with CountingStore(path) as store:
+        assert validate_batch(VALUES, "cpf", store=store) == first
+        assert store.written == []
+        validate_batch(VALUES + ["52998224725"], "cpf", store=store)
+        assert store.written == ["52998224725"]
+
+
+def test_results_must_be_keyed_by_kind_and_mode(path):
+    with ValidationStore(path) as store:
+        assert validate_batch(["04120039021"], "cpf", "any", store=store) == [None]
+        assert validate_batch(["04120039021"], "cpf", "mask", store=store) == [
+            "invalid_mask"
+        ]
+        assert validate_batch(["04120039021"], "cnh", store=store) == ["invalid_data"]
+        assert len(store) == 3
+
+
+def test_warm_store_must_answer_from_memory(path):
+    with ValidationStore(path) as store:
+        validate_batch(VALUES, "cpf", store=store)
+    with ValidationStore(path, warm=True) as store:
+        assert store.get_many("cpf", "any", ["04120039022", "52998224725"]) == {
+            "04120039022": "invalid_data"
+        }
+
+
+def test_store_must_evict_least_recently_used(path):
+    with ValidationStore(path, max_entries=3) as store:
+        validate_batch(["04120039021", "52998224725"], "cpf", store=store)
+        validate_batch(["04120039021"], "cpf", store=store)
+        validate_batch(["11144477735", "12345678909"], "cpf", store=store)
+        assert len(store) == 3
+        cached = store.get_many("cpf", "any", ["04120039021", "52998224725"])
+        assert list(cached) == ["04120039021"]
+
+
+def test_warm_store_must_evict_least_recently_used(path):
+    with ValidationStore(path, max_entries=3, warm=True) as store:
+        validate_batch(["04120039021", "52998224725"], "cpf", store=store)
+        validate_batch(["04120039021"], "cpf", store=store)
+        validate_batch(["11144477735", "12345678909"], "cpf", store=store)
+        assert len(store) == 3
+        cached = store.get_many("cpf", "any", ["04120039021", "52998224725"])
+        assert list(cached) == ["04120039021"]
+
+
+def test_warm_hits_must_be_kept_between_runs(path):
+    with ValidationStore(path) as store:
+        validate_batch(["04120039021", "52998224725"], "cpf", store=store)
+    with ValidationStore(path, warm=True) as store:
+        store.get_many("cpf", "any", ["04120039021"])
+    with ValidationStore(path, max_entries=2) as store:
+        validate_batch(["11144477735"], "cpf", store=store)
+        cached = store.get_many("cpf", "any", ["04120039021", "52998224725"])
+        assert list(cached) == ["04120039021"]
+
+
+def test_clear(path):
+    with ValidationStore(path) as store:
+        validate_batch(VALUES, "cpf", store=store)
+        store.clear()
+        assert len(store) == 0
+        assert store.get_many("cpf", "any", VALUES) == {}
+
+
+def test_unknown_kind_must_fail():
+    with pytest.raises(ValueError):
+        validate_batch(VALUES, "pis")
@@ -0,0 +1,177 @@
+import os
+import random
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ValidationError
+
+from pydantic_br_validator import CEP, CEPDigits, CEPMask, cep_db
+from pydantic_br_validator.__main__ import main
+from pydantic_br_validator.cep_db import (
+    DATABASE_ENV,
+    MAGIC,
+    CEPDatabase,
+    build_cep_db,
+    cep_key,
+    set_default_database,
+)
+from pydantic_br_validator.policy import POLICY_CONTEXT_KEY
+
+fake = Faker("pt-BR")
+
+KNOWN_CEPS = ["01310-100", "59151650", "01001000", "99999999", "00000000"]
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    path = tmp_path / "ceps.bin"
+    build_cep_db(["cep", *KNOWN_CEPS, "01310-100", "", "abc"], path)
+    return path
+
+
+@pytest.fixture
+def default_database(database_path):
+    set_default_database(database_path)
+    yield database_path
+    set_default_database(None)
+
+
+@pytest.mark.parametrize(
+    "value, key",
+    [
+        ("01310-100", 1310100),
+        ("01310100", 1310100),
+        (59151650, 59151650),
+        ("0131010", None),
+        ("0131010a", None),
+        ("０１３１０１００", None),
+        (True, None),
+        (100_000_000, None),
+        (None, None),
+    ],
+)
+def test_cep_key(value, key):
+    assert cep_key(value) == key
+
+
+def test_build_must_write_sorted_unique_uint32_values(database_path):
+    data = database_path.read_bytes()
+    assert data[:8] == MAGIC
+    assert len(data) == 8 + 4 * len(KNOWN_CEPS)
+    with CEPDatabase(database_path) as database:
+        assert list(database.entries) == sorted(map(cep_key, KNOWN_CEPS))
+
+
+def test_lookups_must_use_binary_search_on_the_mapped_file(tmp_path):
+    ceps = random.Random(7).sample(range(100_000_000), 20_000)
+    path = tmp_path / "ceps.bin"
+    assert build_cep_db((f"{cep:08d}" for cep in ceps), path) == (20_000, 0)
+    assert os.path.getsize(path) == 8 + 4 * 20_000
+    database = CEPDatabase(path)
+    assert not database.loaded
+    present = set(ceps)
+    probes = ceps[:500] + list(range(0, 100_000_000, 199_999))
+    assert database.contains_many(probes) == [probe in present for probe in probes]
+    assert [f"{probe:08d}" in database for probe in probes] == [
+        probe in present for probe in probes
+    ]
+    assert database.loaded and len(database) == 20_000
+    database.close()
+    assert not database.loaded
+
+
+def test_build_must_read_a_column_of_delimited_files(tmp_path):
+    path = tmp_path / "ceps.bin"
+    lines = ['"UF";"CEP"', '"SP";"01310-100"', '"RN";"59151650"', '"SP"']
+    assert build_cep_db(lines, path, column=1, delimiter=";") == (2, 2)
+    assert CEPDatabase(path).contains_many(["01310100", "59151-650"]) == [True, True]
+
+
+def test_invalid_files_must_be_rejected(tmp_path):
+    path = tmp_path / "ceps.bin"
+    path.write_bytes(b"not a database")
+    with pytest.raises(ValueError, match="is not a CEP database"):
+        len(CEPDatabase(path))
+    path.write_bytes(b"BRCEP\x00\x00\x02")
+    with pytest.raises(ValueError, match="is not a CEP database"):
+        len(CEPDatabase(path))
+
+
+class Address(BaseModel):
+    cep: CEP(exists=True)
+    cep_mask: CEPMask(exists=True) = "01310-100"
+    cep_digits: CEPDigits = "12345678"
+
+
+@pytest.mark.parametrize(
+    "cep, valid",
+    [("01310-100", True), ("59151650", True), ("12345-678", False), ("1310100", False)],
+)
+def test_exists_option_must_require_the_cep_in_the_default_database(
+    default_database, cep, valid
+):
+    if valid:
+        assert Address(cep=cep).cep == cep
+    else:
+        with pytest.raises(ValidationError, match="invalid data"):
+            Address(cep=cep)
+
+
+def test_exists_option_must_keep_mode_errors_and_policies(default_database):
+    with pytest.raises(ValidationError, match="invalid mask format"):
+        Address(cep="01310100", cep_mask="01310100")
+    # A validação estrutural não consulta a base.
+    context = {POLICY_CONTEXT_KEY: "structural"}
+    assert Address.model_validate({"cep": "12345-678"}, context=context)
+
+
+def test_exists_option_with_a_path_or_database(database_path):
+    class Shipping(BaseModel):
+        origin: CEP(exists=database_path)
+        destination: CEPDigits(exists=CEPDatabase(database_path))
+
+    assert Shipping(origin="01310-100", destination="99999999")
+    with pytest.raises(ValidationError) as error:
+        Shipping(origin="12345-678", destination="12345678")
+    assert [detail["loc"] for detail in error.value.errors()] == [
+        ("origin",),
+        ("destination",),
+    ]
+    with pytest.raises(TypeError, match="exists must be True"):
+        CEP(exists=1)
+
+
+def test_changing_the_default_database_must_not_close_the_previous_one(
+    default_database, tmp_path
+):
+    assert Address(cep="59151650")
+    entries = cep_db.DEFAULT_DATABASE.entries
+    other = tmp_path / "other.bin"
+    build_cep_db(["12345-678"], other)
+    set_default_database(other)
+    # Consultas em andamento continuam com a base anterior.
+    assert list(entries) == sorted(map(cep_key, KNOWN_CEPS))
+    # Campos já criados passam a usar a nova base.
+    assert Address(cep="12345-678", cep_mask="12345-678")
+    with pytest.raises(ValidationError, match="invalid data"):
+        Address(cep="59151650")
+
+
+def test_default_database_must_be_configured(monkeypatch, database_path):
+    monkeypatch.delenv(DATABASE_ENV, raising=False)
+    with pytest.raises(RuntimeError, match="no CEP database configured"):
+        Address(cep="01310-100")
+    monkeypatch.setenv(DATABASE_ENV, str(database_path))
+    assert Address(cep="01310-100")
+    set_default_database(None)
+
+
+def test_build_cep_db_command(tmp_path, capsys):
+    source = tmp_path / "ceps.csv"
+    source.write_text("cidade,cep\nSão Paulo,01310-100\nNatal,59151-650\n", "latin-1")
+    destination = tmp_path / "ceps.bin"
+    main(["build-cep-db", str(source), str(destination), "--column", "1"])
+    assert capsys.readouterr().out.strip() == (
+        f"2 CEPs written to {destination} (1 lines skipped)"
+    )
+    assert "59151650" in CEPDatabase(destination)
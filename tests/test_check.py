@@ -0,0 +1,93 @@
+import pytest
+
+from pydantic_br_validator.batch import get_validator, validate_batch
+from pydantic_br_validator.validators.base_validator import FieldValidator
+from pydantic_br_validator.validators.cep_validator import CEPValidator
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+from pydantic_br_validator.validators.rg_validator import RGValidator
+from pydantic_br_validator.validators.spec_validator import PISValidator
+
+
+@pytest.mark.parametrize(
+    "validator, value, mode, error",
+    [
+        (CPFValidator, "041.200.390-21", "mask", None),
+        (CPFValidator, "04120039021", "mask", "invalid_mask"),
+        (CPFValidator, "041.200.390-22", "mask", "invalid_data"),
+        (CPFValidator, "041.200.390-21", "digits", "not_digits"),
+        (CPFValidator, "11111111111", "digits", "invalid_data"),
+        (CPFValidator, "041.200.390-21", "alphanumeric", "not_digits"),
+        (CPFValidator, "04120039021", "alphanumeric", None),
+        (CPFValidator, 4120039021, "any", "not_str"),
+        (CNPJValidator, "47.895.328/0001-87", "mask", None),
+        (CNPJValidator, "47895328000187", "mask", "invalid_mask"),
+        (CNPJValidator, "12abc34501de35", "any", None),
+        (CNPJValidator, "12ABC34501DE35", "alphanumeric", None),
+        (CNPJValidator, "12ABC345@1DE35", "alphanumeric", "not_digits"),
+        (CNPJValidator, "12ABC34501DEA5", "any", "invalid_data"),
+        (CNHValidator, "49761142867", "digits", None),
+        (CNHValidator, "49761142868", "digits", "invalid_data"),
+        (CEPValidator, "59151-650", "mask", None),
+        (CEPValidator, "59151650", "mask", "invalid_mask"),
+        (CEPValidator, "59151-650", "digits", "not_digits"),
+        (RGValidator, "12.345.678-9", "mask", None),
+        (RGValidator, "12345678X", "any", None),
+        (RGValidator, "12.345.678-X", "any", "invalid_data"),
+        (RGValidator, "12.345.678-X", "mask", "invalid_mask"),
+        (RGValidator, "--.345.678-9", "mask", "invalid_mask"),
+    ],
+)
+def test_check_must_report_the_applicable_error(validator, value, mode, error):
+    assert validator.check(value, mode) == error
+
+
+@pytest.mark.parametrize(
+    "validator, mode",
+    [
+        (CPFValidator, "any"),
+        (CPFValidator, "mask"),
+        (CPFValidator, "digits"),
+        (CNPJValidator, "any"),
+        (CNPJValidator, "alphanumeric"),
+        (RGValidator, "any"),
+        (RGValidator, "mask"),
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    ["041.200.390-21", "٠٤١٢٠٠٣٩٠٢١", "12.345.678-9²", "47.895.328/0001-87ß"],
+)
+def test_check_must_match_staged_validation_for_non_ascii(validator, mode, value):
+    assert validator.check(value, mode) == FieldValidator.check.__func__(
+        validator, value, mode
+    )
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        CPFValidator,
+        CNPJValidator,
+        CNHValidator,
+        RGValidator,
+        CEPValidator,
+        PISValidator,
+    ],
+)
+@pytest.mark.parametrize("value", ["041.200.390-21", "04120039021", "٠٤١٢٠٠٣٩٠٢١"])
+def test_unknown_modes_must_be_rejected(validator, value):
+    for check in (validator.check, validator.check_structure):
+        with pytest.raises(ValueError, match="unknown mode 'bogus'"):
+            check(value, "bogus")
+
+
+def test_mask_mode_must_be_rejected_for_documents_without_mask():
+    with pytest.raises(ValueError, match="CNHValidator has no mask mode"):
+        CNHValidator.check("68576456487", "mask")
+    with pytest.raises(ValueError, match="has no mask mode"):
+        validate_batch(["68576456487"], "cnh", "mask")
+    with pytest.raises(ValueError, match="unknown mode"):
+        get_validator("cpf", "upper")
+    assert get_validator("cnh", "digits") is CNHValidator
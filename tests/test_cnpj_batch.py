@@ -0,0 +1,68 @@
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+
+from .test_cnpj import generate_alphanumeric_cnpj
+
+fake = Faker("pt-BR")
+
+
+def branches(root: str, total: int):
+    return [
+        generate_alphanumeric_cnpj(f"{root}{order:04d}") for order in range(1, total)
+    ]
+
+
+def mask(cnpj: str) -> str:
+    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+
+
+@pytest.fixture
+def batch():
+    values = branches("47895328", 50) + branches("12ABC345", 50)
+    values += [mask(value) for value in branches("A1B2C3D4", 10)]
+    values += [fake.cnpj() for _ in range(10)]
+    values += ["47895328000188", "12.ABC.345/0001-00", "4789532", None, "ABC"]
+    return values
+
+
+@pytest.mark.parametrize("mode", ["any", "mask", "alphanumeric"])
+def test_check_many_must_match_check(batch, mode):
+    assert CNPJValidator.check_many(batch, mode) == [
+        CNPJValidator.check(value, mode) for value in batch
+    ]
+
+
+def test_check_many_must_accept_all_branches():
+    assert CNPJValidator.check_many(branches("47895328", 300)) == [None] * 299
+
+
+def test_check_many_must_reject_wrong_check_digits():
+    assert CNPJValidator.check_many(["47895328000187", "47895328000178"]) == [
+        None,
+        "invalid_data",
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, root",
+    [
+        ("47.895.328/0001-87", "47895328"),
+        ("47895328000187", "47895328"),
+        ("12abc34501de35", "12ABC345"),
+        ("4789532800018", None),
+        (47895328000187, None),
+    ],
+)
+def test_root(value, root):
+    assert CNPJValidator.root(value) == root
+
+
+def test_group_by_root(batch):
+    groups = CNPJValidator.group_by_root(batch)
+    assert groups["47895328"][:3] == [0, 1, 2]
+    assert len(groups["47895328"]) == 50
+    assert len(groups["12ABC345"]) == 50
+    assert len(groups["A1B2C3D4"]) == 9
+    assert "4789532" not in groups
@@ -0,0 +1,61 @@
+import re
+
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.validators import cnpj_engine
+
+from .test_cnpj import VALID_ALPHANUMERIC_CNPJS, generate_alphanumeric_cnpj
+
+fake = Faker("pt-BR")
+
+NUMERIC_CNPJS = [re.sub("[^0-9]", "", fake.cnpj()) for _ in range(10)]
+INVALID_CNPJS = [
+    "12ABC34501DE99",
+    "12ABC34501DEA5",
+    "12ABC345@1DE35",
+    "4789532800018",
+    "478953280001870",
+    "",
+]
+
+
+def test_char_values_table():
+    assert len(cnpj_engine.CHAR_VALUES) == 256
+    assert cnpj_engine.CHAR_VALUES[ord("0")] == 0
+    assert cnpj_engine.CHAR_VALUES[ord("9")] == 9
+    assert cnpj_engine.CHAR_VALUES[ord("A")] == 17
+    assert cnpj_engine.CHAR_VALUES[ord("z")] == 42
+    assert cnpj_engine.CHAR_VALUES[ord("/")] == cnpj_engine.INVALID_CHAR
+
+
+@pytest.mark.parametrize("cnpj", NUMERIC_CNPJS + VALID_ALPHANUMERIC_CNPJS)
+def test_verify_must_accept_valid_cnpjs(cnpj):
+    assert cnpj_engine.verify(cnpj)
+    assert cnpj_engine.verify(cnpj.lower())
+
+
+@pytest.mark.parametrize("cnpj", INVALID_CNPJS)
+def test_verify_must_reject_invalid_cnpjs(cnpj):
+    assert not cnpj_engine.verify(cnpj)
+
+
+def test_verify_many_must_match_verify():
+    cnpjs = NUMERIC_CNPJS + VALID_ALPHANUMERIC_CNPJS + INVALID_CNPJS
+    assert cnpj_engine.verify_many(cnpjs) == [cnpj_engine.verify(c) for c in cnpjs]
+
+
+@pytest.mark.parametrize("cnpj", VALID_ALPHANUMERIC_CNPJS)
+def test_check_digits(cnpj):
+    assert cnpj_engine.check_digits(cnpj[:12]) == cnpj[12:]
+    assert generate_alphanumeric_cnpj(cnpj[:12]) == cnpj
+
+
+@pytest.mark.parametrize("base", ["12ABC34501D", "12ABC345@1DE"])
+def test_check_digits_must_reject_invalid_base(base):
+    with pytest.raises(ValueError):
+        cnpj_engine.check_digits(base)
+
+
+def test_strip_separators():
+    assert cnpj_engine.strip_separators("12.ABC.345/01DE-35") == "12ABC34501DE35"
@@ -0,0 +1,154 @@
+import re
+from typing import Union
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ValidationError
+
+from pydantic_br_validator import (
+    CNPJDigits,
+    CPFDigits,
+    CPFOrCNPJ,
+    CPFOrCNPJDigits,
+    CPFOrCNPJMask,
+    FieldDigitError,
+    FieldInvalidError,
+    FieldMaskError,
+    detect_document,
+)
+from pydantic_br_validator.validators.cpf_or_cnpj_validator import (
+    CPFOrCNPJValidator,
+)
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+
+TOTAL_DOCUMENTS = 10
+fake = Faker("pt-BR")
+
+
+def documents_mask():
+    documents = [fake.cpf() for _ in range(int(TOTAL_DOCUMENTS / 2))]
+    documents += [fake.cnpj() for _ in range(int(TOTAL_DOCUMENTS / 2))]
+    return documents
+
+
+def documents_digits():
+    return [re.sub("[^0-9]", "", document) for document in documents_mask()]
+
+
+@pytest.fixture
+def customer():
+    class Customer(BaseModel):
+        documento: CPFOrCNPJ
+
+    yield Customer
+
+
+@pytest.fixture
+def customer_masks():
+    class Customer(BaseModel):
+        documento: CPFOrCNPJMask
+
+    yield Customer
+
+
+@pytest.fixture
+def customer_digits():
+    class Customer(BaseModel):
+        documento: CPFOrCNPJDigits
+
+    yield Customer
+
+
+@pytest.mark.parametrize("documento", documents_mask() + documents_digits())
+def test_must_accept_cpf_and_cnpj(customer, documento):
+    c1 = customer(documento=documento)
+    assert c1.documento == documento
+
+
+@pytest.mark.parametrize("documento", documents_mask())
+def test_must_accept_with_mask(customer_masks, documento):
+    c1 = customer_masks(documento=documento)
+    assert c1.documento == documento
+
+
+@pytest.mark.parametrize("documento", documents_digits())
+def test_must_accept_only_digits(customer_digits, documento):
+    c1 = customer_digits(documento=documento)
+    assert c1.documento == documento
+
+
+@pytest.mark.parametrize("documento", documents_digits())
+def test_must_fail_when_use_digits_in_mask_class(customer_masks, documento):
+    with pytest.raises(ValidationError) as e:
+        customer_masks(documento=documento)
+    assert FieldMaskError.msg_template in str(e.value)
+
+
+@pytest.mark.parametrize("documento", documents_mask())
+def test_must_fail_when_use_mask_in_digits_class(customer_digits, documento):
+    with pytest.raises(ValidationError) as e:
+        customer_digits(documento=documento)
+    assert FieldDigitError.msg_template in str(e.value)
+
+
+@pytest.mark.parametrize("documento", documents_digits())
+def test_must_fail_when_use_digits_count_below(customer, documento):
+    with pytest.raises(ValidationError) as e:
+        customer(documento=documento[:5])
+    assert FieldInvalidError.msg_template in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "value, kind, error",
+    [
+        ("041.200.390-21", "cpf", None),
+        ("04120039021", "cpf", None),
+        ("04120039022", "cpf", "invalid_data"),
+        ("47.895.328/0001-87", "cnpj", None),
+        ("47895328000187", "cnpj", None),
+        ("12ABC34501DE35", "cnpj", None),
+        ("47895328000188", "cnpj", "invalid_data"),
+        ("4789532800", None, "invalid_data"),
+        (47895328000187, None, "not_str"),
+    ],
+)
+def test_detect_document_must_tag_the_document(value, kind, error):
+    result = detect_document(value)
+    assert result.kind == kind
+    assert result.error == error
+    assert result.valid is (kind is not None and error is None)
+
+
+@pytest.mark.parametrize(
+    "value, mode",
+    [
+        ("041 200 390 21", "any"),
+        ("761516p30998", "any"),
+        ("261\uff1161128764", "digits"),
+    ],
+)
+def test_ambiguous_formats_must_match_the_cpf_cnpj_union(value, mode):
+    assert CPFValidator.check(value, mode) is None
+    result = detect_document(value, mode)
+    assert result == ("cpf", None)
+    assert CPFOrCNPJValidator.check(value, mode) is None
+
+
+@pytest.mark.parametrize(
+    "value", ["ABC04120039021", "041200390A21", "0412003902ZZZZZ1"]
+)
+def test_alphanumeric_mode_must_check_cpf_as_digits(value):
+    assert CPFValidator.check(value, "digits") is not None
+    assert not detect_document(value, "alphanumeric").valid
+    assert CPFOrCNPJValidator.check(value, "alphanumeric") is not None
+
+    class Model(BaseModel):
+        document: CPFOrCNPJDigits
+        union: Union[CPFDigits, CNPJDigits]
+
+    error = pytest.raises(ValidationError, Model, document=value, union=value).value
+    assert [detail["loc"][0] for detail in error.errors()] == [
+        "document",
+        "union",
+        "union",
+    ]
@@ -0,0 +1,120 @@
+import pytest
+
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+
+from . import differential
+from .differential import BACKENDS, Backend, compare, generate, shrink, single
+
+# Casos que já divergiram ou que exercitam caminhos pouco comuns: o ajuste
+# dsc da CNH, CNPJ alfanumérico em minúsculas, dígitos Unicode e modos sem
+# máscara própria.
+EDGE_CASES = {
+    "cpf": [
+        "",
+        "364.912.850-06",
+        "364.912.850-6",
+        "36491285006 ",
+        "3649128500٦",
+        "000.000.000-00",
+        "364a912b850c06",
+    ],
+    "cnpj": [
+        "12abc34501de35",
+        "12.abc.345/01de-35",
+        "12ABC34501DE35",
+        "12ABC34501DEA5",
+        "47.895.328/0001-87",
+        "47 895 328 0001 87",
+        "4789532800018７",
+    ],
+    "cnh": ["49761142867", "00000000191", "15706519597", "4976114286٧", "49761142867x"],
+    "rg": ["12.345.678-9", "12345678X", "12.345.678-X", "1234567x", "--.345.678-9"],
+    "cep": ["59151-650", "59151650", "5915-1650", "59151-65٠", "-59151650"],
+}
+
+
+@pytest.mark.parametrize("kind", BACKENDS)
+def test_backends_must_match_reference_on_generated_inputs(kind):
+    values = list(generate(kind, 4000, seed="ci"))
+    assert compare(kind, values) == []
+
+
+@pytest.mark.parametrize("kind", BACKENDS)
+def test_backends_must_match_reference_on_edge_cases(kind):
+    values = EDGE_CASES[kind] + [None, 11, b"0"]
+    assert compare(kind, values) == []
+
+
+def test_generated_inputs_must_cover_the_dsc_adjustment():
+    values = [
+        value for value in generate("cnh", 4000, seed="ci") if isinstance(value, str)
+    ]
+    adjusted = [
+        value
+        for value in values
+        if value.isascii()
+        and value.isdigit()
+        and len(value) == 11
+        and sum(int(d) * w for d, w in zip(value, range(9, 0, -1))) % 11 == 10
+        and CNHValidator.check(value) is None
+    ]
+    assert adjusted
+
+
+def test_generated_inputs_must_cover_lowercase_alphanumeric_cnpjs():
+    values = generate("cnpj", 4000, seed="ci")
+    assert any(
+        isinstance(value, str)
+        and CNPJValidator.check(value) is None
+        and any(char.islower() for char in value)
+        for value in values
+    )
+
+
+def test_harness_must_report_a_minimal_reproducer():
+    def broken(value, mode="any"):
+        # Aceita qualquer CPF que termine em 7, como um atalho mal feito.
+        if isinstance(value, str) and value.endswith("7"):
+            return None
+        return CPFValidator.check(value, mode)
+
+    values = ["364.912.850-06", "111.222.333-97", "04120039021"]
+    mismatches = compare("cpf", values, [Backend("broken", single(broken))], ["any"])
+    assert len(mismatches) == 1
+    mismatch = mismatches[0]
+    assert (mismatch.backend, mismatch.mode) == ("broken", "any")
+    assert mismatch.value == "111.222.333-97"
+    assert mismatch.minimal == "7"
+    assert (mismatch.expected, mismatch.actual) == ("invalid_data", None)
+    assert "'7'" in str(mismatch)
+
+
+def test_shrink_must_keep_non_strings():
+    assert shrink(5, lambda value: True) == 5
+
+
+def test_run_must_split_work_and_deduplicate(monkeypatch):
+    calls = []
+
+    def fake_chunk(task):
+        calls.append(task)
+        return [differential.Mismatch("cpf", "check", "any", "1", "1", None, "x")]
+
+    monkeypatch.setattr(differential, "_run_chunk", fake_chunk)
+    mismatches = differential.run(25, seed=1, kinds=["cpf", "cep"], chunk_size=10)
+    assert [task[:2] for task in calls] == [
+        ("cpf", 10),
+        ("cpf", 10),
+        ("cpf", 5),
+        ("cep", 10),
+        ("cep", 10),
+        ("cep", 5),
+    ]
+    assert len(mismatches) == 1
+
+
+def test_main_must_report_mismatches(capsys):
+    assert differential.main(["--count", "200", "--kind", "cep", "--jobs", "1"]) == 0
+    assert "0 diferença(s)" in capsys.readouterr().out
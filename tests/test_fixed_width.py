@@ -0,0 +1,131 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.batch import get_validator
+from pydantic_br_validator.fixed_width import (
+    RecordFailure,
+    RecordField,
+    read_fixed_width,
+    scan_records,
+)
+
+from .differential import generate
+
+fake = Faker("pt-BR")
+
+LAYOUT = [
+    RecordField("cpf", 1, 14, "cpf", "mask"),
+    RecordField("cnpj", 15, 18, "cnpj"),
+    RecordField("cep", 33, 8, "cep", "digits", required=False),
+    RecordField("cnh", 41, 11, "cnh", "digits", required=False),
+]
+
+
+def record(cpf="", cnpj="", cep="", cnh="", kind=b"3"):
+    line = f"{cpf:<14}{cnpj:<18}{cep:<8}{cnh:<11}".encode("latin-1")
+    return kind + line + b"\n"
+
+
+def valid_record():
+    return record(fake.cpf(), fake.cnpj(), fake.postcode().replace("-", ""))
+
+
+def fits(value, length):
+    try:
+        return len(value.encode("latin-1")) <= length
+    except (AttributeError, UnicodeEncodeError):
+        return False
+
+
+def cnab(*details):
+    return record(kind=b"0") + b"".join(details) + record(kind=b"9")
+
+
+def test_only_failing_records_must_be_yielded_with_offsets():
+    details = [valid_record() for _ in range(5)]
+    details[1] = record("364.912.850-07", fake.cnpj(), "5915165X")
+    details[3] = record(fake.cpf(), "11.222.333/0001-80", cnh="1234567890X")
+    data = cnab(*details)
+    failures = list(read_fixed_width(data, LAYOUT, record_type=(0, b"3")))
+    assert failures == [
+        RecordFailure(2, 2 * 53, {"cpf": "invalid_data", "cep": "not_digits"}),
+        RecordFailure(4, 4 * 53, {"cnpj": "invalid_data", "cnh": "not_digits"}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "kind, field",
+    [("cpf", LAYOUT[0]), ("cnpj", LAYOUT[1]), ("cep", LAYOUT[2])],
+)
+def test_errors_must_agree_with_check(kind, field):
+    values = [
+        value
+        for value in generate(kind, 600, seed="fixed-width")
+        if fits(value, field.length)
+    ]
+    data = b"".join(
+        record(**{"cpf": fake.cpf(), "cnpj": fake.cnpj(), kind: value})
+        for value in values
+    )
+    failures = {
+        failure.index: failure.errors[kind]
+        for failure in read_fixed_width(data, [field], record_length=53)
+    }
+    validator = get_validator(kind)
+    for index, value in enumerate(values):
+        expected = validator.check(value.strip(" "), field.mode)
+        if not value.strip(" ") and not field.required:
+            expected = None
+        assert failures.get(index) == expected, value
+
+
+def test_files_are_mapped_and_last_record_may_miss_the_newline(tmp_path):
+    data = cnab(valid_record(), record("000.000.000-00", fake.cnpj()))
+    path = tmp_path / "retorno.rem"
+    path.write_bytes(data.rstrip(b"\n"))
+    assert [failure.index for failure in read_fixed_width(path, LAYOUT)] == [0, 2, 3]
+    empty = tmp_path / "vazio.rem"
+    empty.write_bytes(b"")
+    assert list(read_fixed_width(empty, LAYOUT)) == []
+
+
+def test_non_ascii_values_must_be_decoded_with_the_encoding():
+    data = record("364.912.850-06", "12.ABC.345/01DÉ-35")
+    (failure,) = read_fixed_width(data, LAYOUT)
+    assert failure.errors == {"cnpj": "invalid_data"}
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_parallel_ranges_must_match_sequential_scan(tmp_path, executor_class):
+    details = [valid_record() for _ in range(300)]
+    for index in range(0, 300, 7):
+        details[index] = record(fake.cpf().replace(".", ""), fake.cnpj())
+    path = tmp_path / "retorno.rem"
+    path.write_bytes(cnab(*details))
+    expected = list(read_fixed_width(path, LAYOUT, record_type=(0, b"3")))
+    assert len(expected) == 43
+    with executor_class(max_workers=2) as executor:
+        failures = read_fixed_width(
+            path, LAYOUT, record_type=(0, b"3"), executor=executor, chunk_records=40
+        )
+        assert list(failures) == expected
+    assert scan_records(path, LAYOUT, 1, 15, 53) == [
+        failure for failure in expected if failure.index < 15
+    ]
+
+
+@pytest.mark.parametrize(
+    "layout, options, message",
+    [
+        ([RecordField("pis", 0, 11, "pis")], {}, "unknown document kind"),
+        ([RecordField("cpf", 45, 11, "cpf")], {}, "exceeds the record length"),
+        ([RecordField("cpf", -1, 11, "cpf")], {}, "invalid position"),
+        (LAYOUT, {"record_type": (52, b"33")}, "record_type exceeds"),
+        (LAYOUT, {"chunk_records": 0}, "chunk_records must be positive"),
+    ],
+)
+def test_invalid_layouts_must_be_rejected(layout, options, message):
+    with pytest.raises(ValueError, match=message):
+        read_fixed_width(valid_record(), layout, **options)
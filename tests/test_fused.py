@@ -0,0 +1,245 @@
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from pydantic_br_validator import (
+    CEP,
+    CNH,
+    CNPJ,
+    CPF,
+    RG,
+    CEPMask,
+    CNPJDigits,
+    CPFMask,
+    FusedValidation,
+    LazyCPF,
+)
+from pydantic_br_validator.policy import POLICY_CONTEXT_KEY
+
+from .differential import generate
+
+fake = Faker("pt-BR")
+
+VALID_CPF = "364.912.850-06"
+INVALID_CPF = "364.912.850-07"
+
+
+class Customer(BaseModel):
+    name: str
+    cpf: CPF
+    cpf_mask: CPFMask
+    company: CNPJ = Field(alias="cnpj")
+    company_digits: Optional[CNPJDigits] = None
+    age: int = 0
+    zip_code: Optional[CEPMask] = None
+    driver: Optional[CNH] = None
+    rg: Optional[RG(uf="SP")] = None
+    lazy: Optional[LazyCPF] = None
+
+
+class FusedCustomer(FusedValidation, Customer):
+    pass
+
+
+def details(error):
+    return [(d["type"], d["loc"], d["msg"], d["input"]) for d in error.errors()]
+
+
+def outcome(model, data, **kwargs):
+    try:
+        return model.model_validate(data, **kwargs).model_dump()
+    except ValidationError as error:
+        return details(error)
+
+
+def customer(**changes):
+    data = {
+        "name": fake.name(),
+        "cpf": fake.cpf(),
+        "cpf_mask": fake.cpf(),
+        "cnpj": fake.cnpj(),
+        "company_digits": fake.cnpj()
+        .replace(".", "")
+        .replace("/", "")
+        .replace("-", ""),
+        "age": 30,
+        "zip_code": "59151-650",
+        "driver": None,
+        "rg": None,
+    }
+    data.update(changes)
+    return data
+
+
+def test_document_fields_must_be_plain_strings_in_the_core_schema():
+    fields = FusedCustomer.__pydantic_core_schema__["schema"]["schema"]["fields"]
+    assert fields["cpf"]["schema"] == {
+        "type": "str",
+        "metadata": fields["cpf"]["schema"]["metadata"],
+    }
+    assert fields["zip_code"]["schema"]["schema"]["schema"]["type"] == "str"
+    # Campos sob demanda mantêm o próprio validador.
+    assert fields["lazy"]["schema"]["schema"]["schema"]["type"] == "function-after"
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"cpf": INVALID_CPF},
+        {"cpf": INVALID_CPF, "cpf_mask": "36491285006", "cnpj": "0"},
+        {"cpf": 123},
+        {"cpf": INVALID_CPF, "age": "x"},
+        {"cpf_mask": VALID_CPF.replace(".", ""), "age": "x", "name": None},
+        {"zip_code": "59151650", "driver": "1234"},
+        {"rg": "12.345.678-0"},
+        {"company_digits": "12.ABC.345/01DE-35"},
+    ],
+)
+def test_fused_model_must_report_the_same_errors_as_per_field_validation(changes):
+    data = customer(**changes)
+    assert outcome(FusedCustomer, data) == outcome(Customer, data)
+
+
+@pytest.mark.parametrize("kind, field", [("cpf", "cpf"), ("cnpj", "cnpj")])
+def test_fused_model_must_agree_on_differential_inputs(kind, field):
+    for value in generate(kind, 300, seed="fused"):
+        data = customer(**{field: value})
+        assert outcome(FusedCustomer, data) == outcome(Customer, data), value
+
+
+def test_errors_must_keep_field_order_with_other_failures():
+    data = customer(cpf=INVALID_CPF, age="x", zip_code="5915", name=None)
+    error = pytest.raises(ValidationError, FusedCustomer.model_validate, data).value
+    assert [d["loc"] for d in error.errors()] == [
+        ("name",),
+        ("cpf",),
+        ("age",),
+        ("zip_code",),
+    ]
+    assert error.title == "FusedCustomer"
+
+
+def test_defaults_must_not_be_checked_unless_validate_default():
+    class Defaults(FusedValidation, BaseModel):
+        cpf: CPF = INVALID_CPF
+
+    class ValidatedDefaults(FusedValidation, BaseModel):
+        model_config = ConfigDict(validate_default=True)
+        cpf: CPF = INVALID_CPF
+
+    assert Defaults().cpf == INVALID_CPF
+    with pytest.raises(ValidationError, match="invalid data"):
+        ValidatedDefaults()
+
+
+def test_validated_defaults_must_be_checked_when_other_fields_fail():
+    class Defaults(BaseModel):
+        required: int
+        cpf: CPF = Field(default="000", validate_default=True)
+        factory: CPF = Field(default_factory=lambda: INVALID_CPF, validate_default=True)
+        unchecked: CPF = "000"
+
+    class FusedDefaults(FusedValidation, Defaults):
+        pass
+
+    expected = outcome(Defaults, {})
+    assert [loc for _, loc, _, _ in expected] == [("required",), ("cpf",), ("factory",)]
+    assert outcome(FusedDefaults, {}) == expected
+
+
+def test_policy_from_context_and_field_must_apply():
+    class Structural(FusedValidation, BaseModel):
+        cpf: CPF(policy="structural")
+        cep: CEP
+
+    assert Structural(cpf=INVALID_CPF, cep="59151-650").cpf == INVALID_CPF
+    data = customer(cpf=INVALID_CPF)
+    context = {POLICY_CONTEXT_KEY: "structural"}
+    assert FusedCustomer.model_validate(data, context=context).cpf == INVALID_CPF
+
+
+def test_attribute_input_must_report_document_errors_with_other_failures():
+    data = SimpleNamespace(**customer(cpf=INVALID_CPF, age="x"))
+    expected = outcome(Customer, data, from_attributes=True)
+    assert [loc for _, loc, _, _ in expected] == [("cpf",), ("age",)]
+    assert outcome(FusedCustomer, data, from_attributes=True) == expected
+
+    class Attributes(FusedValidation, BaseModel):
+        model_config = ConfigDict(from_attributes=True)
+        cpf: CPF
+        age: int
+
+    error = pytest.raises(ValidationError, Attributes.model_validate, data).value
+    assert [d["loc"] for d in error.errors()] == [("cpf",), ("age",)]
+    # Sem ``from_attributes`` o objeto é recusado como um todo.
+    assert [loc for _, loc, _, _ in outcome(FusedCustomer, data)] == [()]
+
+
+def test_json_nested_and_assignment_validation():
+    class Account(BaseModel):
+        owner: FusedCustomer
+        others: list[FusedCustomer]
+
+    data = customer(cpf=INVALID_CPF)
+    error = pytest.raises(
+        ValidationError, Account.model_validate, {"owner": data, "others": [data]}
+    ).value
+    assert [d["loc"] for d in error.errors()] == [
+        ("owner", "cpf"),
+        ("others", 0, "cpf"),
+    ]
+
+    class Assigned(FusedValidation, BaseModel):
+        model_config = ConfigDict(validate_assignment=True)
+        cpf: CPF
+
+    model = Assigned.model_validate_json(f'{{"cpf": "{VALID_CPF}"}}')
+    with pytest.raises(ValidationError, match="invalid data"):
+        model.cpf = INVALID_CPF
+
+
+def test_populate_by_name_and_custom_errors_of_other_validators():
+    class Custom(FusedValidation, BaseModel):
+        model_config = ConfigDict(populate_by_name=True)
+        company: CNPJ = Field(alias="cnpj")
+        code: str
+
+        @field_validator("code")
+        @classmethod
+        def check_code(cls, value):
+            raise ValueError("bad code")
+
+    error = pytest.raises(
+        ValidationError, Custom, company="11.222.333/0001-80", code="x"
+    ).value
+    assert [(d["loc"], d["msg"]) for d in error.errors()] == [
+        (("company",), "Value error, invalid data"),
+        (("code",), "Value error, bad code"),
+    ]
+
+    # O ``loc`` é a chave usada na entrada, como no pydantic.
+    class Plain(BaseModel):
+        model_config = ConfigDict(populate_by_name=True)
+        company: CNPJ = Field(alias="cnpj")
+        code: int = 0
+
+    class Fused(FusedValidation, Plain):
+        pass
+
+    for data in (
+        {"company": "11.222.333/0001-80"},
+        {"company": "11.222.333/0001-80", "code": "x"},
+        {"cnpj": "11.222.333/0001-80", "code": "x"},
+    ):
+        assert outcome(Fused, data) == outcome(Plain, data), data
+    assert outcome(Fused, {"company": "11.222.333/0001-80"})[0][1] == ("company",)
+
+
+def test_json_schema_must_keep_document_formats():
+    assert FusedCustomer.model_json_schema() == Customer.model_json_schema() | {
+        "title": "FusedCustomer"
+    }
@@ -0,0 +1,120 @@
+import io
+import json
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_br_validator import CEP, CNPJ, CPF, CPFMask, LazyCPF
+from pydantic_br_validator.ingest import IngestResult, ingest_ndjson
+from pydantic_br_validator.policy import POLICY_CONTEXT_KEY
+
+
+class Client(BaseModel):
+    name: str
+    cpf: CPF
+    company: CNPJ
+    cep: CEP
+
+
+class StrictClient(Client):
+    model_config = ConfigDict(strict=True)
+
+    mask: CPFMask
+
+
+RECORDS = [
+    {
+        "name": "Ana",
+        "cpf": "364.912.850-06",
+        "company": "11222333000181",
+        "cep": "01310-100",
+    },
+    {
+        "name": "Bia",
+        "cpf": "364.912.850-07",
+        "company": "11222333000181",
+        "cep": "01310-100",
+    },
+    {
+        "name": "Caio",
+        "cpf": "36491285006",
+        "company": "11.222.333/0001-81",
+        "cep": "01310100",
+    },
+]
+CONTENT = (
+    "\n".join(json.dumps(record) for record in RECORDS) + "\n\n{broken\n"
+).encode()
+
+
+@pytest.fixture
+def ndjson_path(tmp_path):
+    path = tmp_path / "clients.ndjson"
+    path.write_bytes(CONTENT)
+    return path
+
+
+def check_results(results):
+    assert [result.line for result in results] == [1, 2, 3, 5]
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0].value == Client(**RECORDS[0])
+    assert results[1].error.errors()[0]["loc"] == ("cpf",)
+    assert results[3].error.errors()[0]["type"] == "json_invalid"
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_ingest_path(ndjson_path, use_mmap):
+    check_results(list(ingest_ndjson(ndjson_path, Client, use_mmap=use_mmap)))
+    check_results(list(ingest_ndjson(str(ndjson_path), Client, use_mmap=use_mmap)))
+
+
+@pytest.mark.parametrize(
+    "source", [CONTENT, bytearray(CONTENT), memoryview(CONTENT), CONTENT.splitlines()]
+)
+def test_ingest_in_memory_sources(source):
+    check_results(list(ingest_ndjson(source, Client)))
+
+
+def test_ingest_open_file(ndjson_path):
+    with open(ndjson_path, "rb") as file:
+        check_results(list(ingest_ndjson(file, Client)))
+    check_results(list(ingest_ndjson(io.StringIO(CONTENT.decode()), Client)))
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.ndjson"
+    path.write_bytes(b"")
+    assert list(ingest_ndjson(path, Client)) == []
+
+
+def test_strict_json_mode():
+    line = json.dumps({**RECORDS[0], "mask": "364.912.850-06"})
+    assert list(ingest_ndjson([line], StrictClient, strict=True))[0].ok
+    bad = json.dumps({**RECORDS[0], "mask": 36491285006})
+    result = list(ingest_ndjson([bad], StrictClient, strict=True))[0]
+    assert result.error.errors()[0]["type"] == "string_type"
+
+
+def test_context_is_forwarded():
+    line = json.dumps(RECORDS[1])
+    results = ingest_ndjson([line], Client, context={POLICY_CONTEXT_KEY: "structural"})
+    assert next(results).ok
+
+
+def test_lazy_fields_and_plain_types():
+    class Lazy(BaseModel):
+        cpf: LazyCPF
+
+    result = next(ingest_ndjson([b'{"cpf": "364.912.850-07"}'], Lazy))
+    assert result.ok and not result.value.cpf.verified
+    assert next(ingest_ndjson([b'"36491285006"'], CPF)) == IngestResult(
+        1, "36491285006"
+    )
+
+
+def test_ingest_is_lazy():
+    def lines():
+        yield json.dumps(RECORDS[0])
+        raise AssertionError("consumed too far")
+
+    assert next(ingest_ndjson(lines(), Client)).ok
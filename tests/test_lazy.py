@@ -0,0 +1,143 @@
+import copy
+import pickle
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ValidationError
+
+from pydantic_br_validator import (
+    FieldInvalidError,
+    LazyCNH,
+    LazyCNPJ,
+    LazyCPF,
+    LazyCPFDigits,
+    LazyCPFMask,
+    LazyCPFOrCNPJ,
+)
+from pydantic_br_validator.fields.lazy_field import LazyDocument
+
+fake = Faker("pt-BR")
+
+VALID_CPF = "364.912.850-06"
+INVALID_CPF = "364.912.850-07"
+
+
+class Contract(BaseModel):
+    holder: LazyCPF
+    guarantor: LazyCPFMask
+    branch: LazyCNPJ
+    driver: LazyCNH
+    other: LazyCPFOrCNPJ
+
+
+def build(**overrides):
+    data = {
+        "holder": VALID_CPF,
+        "guarantor": fake.cpf(),
+        "branch": fake.cnpj(),
+        "driver": "12345678900",
+        "other": fake.cnpj(),
+    }
+    data.update(overrides)
+    return Contract(**data)
+
+
+def test_construction_defers_checksum():
+    contract = build(holder=INVALID_CPF, driver="12345678901")
+    assert isinstance(contract.holder, LazyDocument)
+    assert not contract.holder.verified
+    assert not contract.driver.verified
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("holder", "364.912.850-0"),
+        ("guarantor", "36491285006"),
+        ("branch", "11.222.333/0001-8"),
+        ("driver", "1234567890"),
+        ("other", "123"),
+    ],
+)
+def test_construction_rejects_bad_structure(field, value):
+    with pytest.raises(ValidationError):
+        build(**{field: value})
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda value: value.replace(".", ""),
+        lambda value: value == INVALID_CPF,
+        lambda value: len(value),
+        lambda value: value[0],
+        lambda value: str(value),
+        lambda value: f"{value}",
+        lambda value: "." in value,
+        lambda value: value + "!",
+        lambda value: hash(value),
+        lambda value: list(value),
+    ],
+)
+def test_first_use_raises_field_invalid_error(use):
+    contract = build(holder=INVALID_CPF)
+    with pytest.raises(FieldInvalidError):
+        use(contract.holder)
+    assert contract.holder.verified
+
+
+def test_valid_value_behaves_as_str():
+    contract = build()
+    assert contract.holder == VALID_CPF
+    assert contract.holder.verified
+    assert contract.holder.replace(".", "").replace("-", "") == "36491285006"
+    assert {contract.holder: 1}[VALID_CPF] == 1
+
+
+def test_verify_is_explicit_and_cached(monkeypatch):
+    contract = build()
+    calls = []
+    check = contract.holder._validator.check
+
+    monkeypatch.setattr(
+        contract.holder._validator,
+        "check",
+        lambda value, mode: calls.append(value) or check(value, mode),
+    )
+    assert contract.holder.verify() is contract.holder
+    contract.holder.verify()
+    assert calls == [VALID_CPF]
+
+
+def test_repr_does_not_verify():
+    contract = build(holder=INVALID_CPF)
+    assert INVALID_CPF in repr(contract)
+    assert not contract.holder.verified
+
+
+def test_serialization_verifies():
+    contract = build()
+    dumped = contract.model_dump()
+    assert dumped["holder"] == VALID_CPF and type(dumped["holder"]) is str
+    assert f'"holder":"{VALID_CPF}"' in contract.model_dump_json()
+
+    with pytest.raises(ValueError, match="invalid data"):
+        build(holder=INVALID_CPF).model_dump()
+
+
+def test_digits_variant_and_json_input():
+    class Person(BaseModel):
+        cpf: LazyCPFDigits
+
+    person = Person.model_validate_json('{"cpf": "36491285006"}')
+    assert person.cpf.verify() == "36491285006"
+    with pytest.raises(ValidationError):
+        Person(cpf=VALID_CPF)
+
+
+def test_copy_and_pickle_keep_pending_state():
+    contract = build(holder=INVALID_CPF)
+    for clone in (copy.deepcopy(contract), pickle.loads(pickle.dumps(contract))):
+        assert not clone.holder.verified
+        with pytest.raises(FieldInvalidError):
+            clone.holder.verify()
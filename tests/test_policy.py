@@ -0,0 +1,183 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ValidationError
+
+from pydantic_br_validator import CEP, CNH, CNPJ, CPF, CPFMask, CPFOrCNPJ
+from pydantic_br_validator.policy import (
+    POLICY_CONTEXT_KEY,
+    ValidationPolicy,
+    context_policy,
+    get_policy,
+)
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_or_cnpj_validator import CPFOrCNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+
+fake = Faker("pt-BR")
+
+VALID_CPF = "364.912.850-06"
+WRONG_CHECKSUM_CPF = "364.912.850-07"
+
+
+@pytest.mark.parametrize(
+    "validator, value, mode, expected",
+    [
+        (CPFValidator, WRONG_CHECKSUM_CPF, "any", None),
+        (CPFValidator, "111.111.111-11", "mask", None),
+        (CPFValidator, "36491285007", "mask", "invalid_mask"),
+        (CPFValidator, "364.912.850-0", "any", "invalid_data"),
+        (CPFValidator, "364.912.850-07", "digits", "not_digits"),
+        (CPFValidator, 36491285007, "any", "not_str"),
+        (CNPJValidator, "11.222.333/0001-82", "mask", None),
+        (CNPJValidator, "12.ABC.345/01DE-99", "any", None),
+        (CNPJValidator, "11.222.333/0001-8", "any", "invalid_data"),
+        (CNPJValidator, "11.222.333/0001-AB", "any", "invalid_data"),
+        (CNPJValidator, "11222333000182", "mask", "invalid_mask"),
+        (CNHValidator, "12345678901", "digits", None),
+        (CNHValidator, "1234567890", "any", "invalid_data"),
+        (CPFOrCNPJValidator, WRONG_CHECKSUM_CPF, "any", None),
+        (CPFOrCNPJValidator, "11222333000182", "digits", None),
+        (CPFOrCNPJValidator, "1234", "any", "invalid_data"),
+    ],
+)
+def test_check_structure(validator, value, mode, expected):
+    assert validator.check_structure(value, mode) == expected
+
+
+@pytest.mark.parametrize("cpf", [fake.cpf() for _ in range(20)])
+def test_structure_accepts_every_valid_document(cpf):
+    assert CPFValidator.check_structure(cpf, "mask") is None
+    cnpj = fake.cnpj()
+    assert CNPJValidator.check_structure(cnpj, "mask") is None
+
+
+def test_structural_field_skips_checksum():
+    class Person(BaseModel):
+        cpf: CPF(policy="structural")
+        cpf_mask: CPFMask(policy="structural")
+
+    person = Person(cpf=WRONG_CHECKSUM_CPF, cpf_mask=WRONG_CHECKSUM_CPF)
+    assert person.cpf == WRONG_CHECKSUM_CPF
+    with pytest.raises(ValidationError, match="invalid mask"):
+        Person(cpf=WRONG_CHECKSUM_CPF, cpf_mask="36491285007")
+
+
+def test_sampled_field_counts_mismatches():
+    policy = ValidationPolicy("sampled", sample_rate=2, reject_mismatches=False)
+
+    class Person(BaseModel):
+        cpf: CPF(policy=policy)
+
+    for _ in range(4):
+        Person(cpf=VALID_CPF)
+        Person(cpf=WRONG_CHECKSUM_CPF)
+    assert policy.stats() == {"checked": 8, "sampled": 4, "mismatches": 0}
+
+    Person(cpf=WRONG_CHECKSUM_CPF)
+    assert policy.stats() == {"checked": 9, "sampled": 5, "mismatches": 1}
+    policy.reset()
+    assert policy.stats() == {"checked": 0, "sampled": 0, "mismatches": 0}
+
+
+def test_sampled_mismatch_is_rejected_by_default():
+    class Company(BaseModel):
+        cnpj: CNPJ(policy="sampled", sample_rate=1)
+
+    Company(cnpj="11.222.333/0001-81")
+    with pytest.raises(ValidationError, match="invalid data"):
+        Company(cnpj="11.222.333/0001-82")
+    assert Company.model_fields["cnpj"].annotation.policy.mismatches == 1
+
+
+def test_context_policy_overrides_field_policy():
+    class Person(BaseModel):
+        cpf: CPF
+        cnh: CNH(policy="full")
+        cep: CEP
+
+    data = {"cpf": WRONG_CHECKSUM_CPF, "cnh": "12345678901", "cep": "01310-100"}
+    with pytest.raises(ValidationError):
+        Person.model_validate(data)
+    person = Person.model_validate(data, context={POLICY_CONTEXT_KEY: "structural"})
+    assert person.cpf == WRONG_CHECKSUM_CPF
+    with pytest.raises(ValidationError):
+        Person.model_validate(
+            {**data, "cep": "0131010"}, context={POLICY_CONTEXT_KEY: "structural"}
+        )
+
+
+def test_context_policy_instance():
+    policy = ValidationPolicy("sampled", sample_rate=1)
+
+    class Client(BaseModel):
+        document: CPFOrCNPJ
+
+    Client.model_validate({"document": VALID_CPF}, context={POLICY_CONTEXT_KEY: policy})
+    assert policy.sampled == 1
+
+
+def test_specialized_field_keeps_schema_and_base_field_is_unchanged():
+    field = CPF(policy="structural")
+    assert issubclass(field, CPF) and field.__name__ == "CPF"
+    assert field.format == "cpf"
+    assert CPF.policy is None
+    assert CPF(VALID_CPF).number == VALID_CPF
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: CPF(policy="partial"),
+        lambda: CPF(policy=ValidationPolicy(), sample_rate=10),
+        lambda: ValidationPolicy("sampled", sample_rate=0),
+    ],
+)
+def test_invalid_policy(call):
+    with pytest.raises(ValueError):
+        call()
+
+
+def test_options_and_number_are_exclusive():
+    with pytest.raises(TypeError):
+        CPF(VALID_CPF, policy="structural")
+    with pytest.raises(TypeError):
+        CPF(uf="SP")
+
+
+def test_named_policies_are_not_shared():
+    assert get_policy("sampled") is not get_policy("sampled")
+    assert get_policy("sampled", 10) is not get_policy("sampled", 10)
+    assert get_policy(None) is None
+    first, second = CPF(policy="sampled"), CPF(policy="sampled")
+    assert first.policy is not second.policy
+
+
+def test_named_context_policy_is_created_once_per_context():
+    class Person(BaseModel):
+        cpf: CPF
+        other: CPF
+
+    context = {POLICY_CONTEXT_KEY: "sampled"}
+    Person.model_validate({"cpf": VALID_CPF, "other": VALID_CPF}, context=context)
+    Person.model_validate({"cpf": VALID_CPF, "other": VALID_CPF}, context=context)
+    policy = context_policy(context)
+    assert policy.stats() == {"checked": 4, "sampled": 1, "mismatches": 0}
+    other = {POLICY_CONTEXT_KEY: "sampled"}
+    Person.model_validate({"cpf": VALID_CPF, "other": VALID_CPF}, context=other)
+    assert context_policy(other) is not policy
+    assert policy.checked == 4
+
+
+def test_policy_counters_must_be_thread_safe():
+    policy = ValidationPolicy("sampled", sample_rate=10)
+
+    def run(_):
+        for _ in range(2_000):
+            policy.check(CPFValidator, VALID_CPF)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(run, range(8)))
+    assert policy.stats() == {"checked": 16_000, "sampled": 1_600, "mismatches": 0}
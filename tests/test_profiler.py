@@ -0,0 +1,173 @@
+import json
+import random
+import tracemalloc
+
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.batch import validate_batch, validate_stream
+from pydantic_br_validator.profiler import (
+    CODES,
+    HyperLogLog,
+    TopK,
+    ValidationProfiler,
+)
+
+fake = Faker("pt-BR")
+
+CPFS = [fake.cpf() for _ in range(50)]
+VALUES = (
+    CPFS
+    + [cpf.replace(".", "").replace("-", "") for cpf in CPFS[:25]]
+    + [
+        "041.200.390-22",
+        "041.200.390-22",
+        "041.200.390-22",
+        "11111111111",
+        "abc",
+        None,
+        42,
+    ]
+)
+
+
+def test_profiler_must_count_each_error_code():
+    profiler = ValidationProfiler(kind="cpf")
+    errors = validate_batch(VALUES, kind="cpf", profiler=profiler)
+    report = profiler.report()
+    assert report["total"] == len(VALUES)
+    assert report["valid"] == errors.count(None) == 75
+    assert report["errors"]["invalid_data"]["count"] == 5
+    assert report["errors"]["not_str"]["count"] == 2
+    assert report["errors"]["invalid_mask"]["count"] == 0
+    assert report["failure_rate"] == pytest.approx(7 / len(VALUES))
+    assert profiler.errors() == errors
+    assert profiler.codes.itemsize == 1
+
+
+def test_profiler_must_split_masked_and_unmasked():
+    profiler = ValidationProfiler()
+    validate_batch(VALUES, kind="cpf", profiler=profiler)
+    report = profiler.report()
+    assert report["masked"]["count"] == 53
+    assert report["unmasked"]["count"] == 27
+    assert report["masked"]["rate"] + report["unmasked"]["rate"] == pytest.approx(1)
+
+
+def test_profiler_must_count_masked_and_unmasked_forms_once():
+    profiler = ValidationProfiler()
+    validate_batch(VALUES, kind="cpf", profiler=profiler)
+    # 50 CPFs (25 repetidos sem máscara), o inválido, 11111111111, "abc",
+    # None e 42; a estimativa tem erro de alguns por cento.
+    assert profiler.report()["distinct"] == pytest.approx(55, rel=0.06)
+
+
+def test_profiler_must_rank_invalid_values():
+    profiler = ValidationProfiler(top_k=10)
+    validate_batch(VALUES, kind="cpf", profiler=profiler)
+    top = profiler.report()["top_invalid"]
+    assert top[0] == {"value": "041.200.390-22", "count": 3, "error": 0}
+    assert {item["value"] for item in top[1:]} == {"11111111111", "abc", "None", "42"}
+
+
+def test_profiler_must_plug_into_validate_stream():
+    profiler = ValidationProfiler(kind="cpf", keep_codes=False)
+    results = list(
+        validate_stream(iter(VALUES), kind="cpf", chunk_size=7, profiler=profiler)
+    )
+    assert [error for _, _, error in results] == validate_batch(VALUES, kind="cpf")
+    assert profiler.total == len(VALUES)
+    assert profiler.codes is None
+    with pytest.raises(ValueError):
+        profiler.errors()
+
+
+def test_profiler_must_output_json_and_text():
+    profiler = ValidationProfiler(kind="cpf")
+    validate_batch(VALUES, kind="cpf", profiler=profiler)
+    assert json.loads(profiler.to_json()) == profiler.report()
+    summary = profiler.summary()
+    assert summary.startswith("Perfil de validação (cpf)")
+    assert "invalid_data: 5" in summary
+    assert "'041.200.390-22': 3" in summary
+
+
+def test_empty_profiler_must_report_zero_rates():
+    report = ValidationProfiler().report()
+    assert report["total"] == 0
+    assert report["failure_rate"] == 0.0
+    assert report["distinct"] == 0
+    assert report["top_invalid"] == []
+
+
+def test_profiler_must_merge_partial_profiles():
+    first, second, whole = (ValidationProfiler() for _ in range(3))
+    validate_batch(VALUES[:40], kind="cpf", profiler=first)
+    validate_batch(VALUES[40:], kind="cpf", profiler=second)
+    validate_batch(VALUES, kind="cpf", profiler=whole)
+    first.merge(second)
+    assert first.report() == whole.report()
+    assert first.errors() == whole.errors()
+    with pytest.raises(ValueError):
+        first.merge(ValidationProfiler(keep_codes=False))
+
+
+def test_profiler_memory_must_not_grow_without_codes():
+    profiler = ValidationProfiler(keep_codes=False)
+    rng = random.Random(44)
+    chunk = [str(rng.randrange(10**11)).zfill(11) for _ in range(1000)]
+    errors = validate_batch(chunk, kind="cpf")
+    profiler.observe(chunk, errors)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(20):
+            chunk = [str(rng.randrange(10**11)).zfill(11) for _ in range(1000)]
+            profiler.observe(chunk, validate_batch(chunk, kind="cpf"))
+            del chunk
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    # Apenas os contadores do top-k trocam de valor; nada cresce por entrada.
+    assert growth < 16_000
+
+
+@pytest.mark.parametrize("cardinality", [10, 1000, 50_000])
+def test_hyperloglog_must_estimate_distinct_count(cardinality):
+    sketch = HyperLogLog(precision=12)
+    for number in range(cardinality):
+        sketch.add(str(number))
+        sketch.add(str(number))
+    assert sketch.count() == pytest.approx(cardinality, rel=0.05)
+
+
+def test_hyperloglog_must_merge_and_validate_precision():
+    first, second = HyperLogLog(10), HyperLogLog(10)
+    for number in range(2000):
+        (first if number % 2 else second).add(str(number))
+    first.merge(second)
+    assert first.count() == pytest.approx(2000, rel=0.1)
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(11))
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+def test_topk_must_keep_heavy_hitters_in_bounded_memory():
+    top = TopK(k=20)
+    rng = random.Random(7)
+    stream = ["a"] * 500 + ["b"] * 300 + [str(rng.random()) for _ in range(2000)]
+    rng.shuffle(stream)
+    for key in stream:
+        top.add(key)
+    assert len(top.counts) == 20
+    ranked = top.most_common(2)
+    assert [key for key, _, _ in ranked] == ["a", "b"]
+    for key, count, error in ranked:
+        assert count - error <= stream.count(key) <= count
+    with pytest.raises(ValueError):
+        TopK(0)
+
+
+def test_codes_must_cover_every_error():
+    assert CODES == (None, "not_str", "invalid_mask", "not_digits", "invalid_data")
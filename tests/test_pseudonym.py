@@ -0,0 +1,139 @@
+import pytest
+from faker import Faker
+
+from pydantic_br_validator import pseudonym
+from pydantic_br_validator.pseudonym import Pseudonymizer
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+
+from .test_cnpj import generate_alphanumeric_cnpj
+
+fake = Faker("pt_BR")
+
+pseudonymizer = Pseudonymizer("chave de teste")
+
+
+@pytest.mark.parametrize("cpf", [fake.cpf() for _ in range(50)])
+def test_cpf_pseudonym_is_valid_and_keeps_mask(cpf):
+    masked = pseudonymizer.cpf(cpf)
+    digits = pseudonymizer.cpf(cpf.replace(".", "").replace("-", ""))
+    assert CPFValidator.check(masked, "mask") is None
+    assert CPFValidator.check(digits, "digits") is None
+    assert masked.replace(".", "").replace("-", "") == digits
+    assert masked != cpf
+
+
+@pytest.mark.parametrize("cnpj", [fake.cnpj() for _ in range(50)])
+def test_cnpj_pseudonym_is_valid_and_keeps_mask(cnpj):
+    masked = pseudonymizer.cnpj(cnpj)
+    digits = pseudonymizer.cnpj(cnpj.replace(".", "").replace("/", "").replace("-", ""))
+    assert CNPJValidator.check(masked, "mask") is None
+    assert CNPJValidator.check(digits, "digits") is None
+    assert masked[11:15] == cnpj[11:15]
+    assert masked != cnpj
+
+
+@pytest.mark.parametrize(
+    "cnpj",
+    [
+        generate_alphanumeric_cnpj(fake.bothify("?#?#?#?#0001").upper())
+        for _ in range(20)
+    ],
+)
+def test_alphanumeric_cnpj_pseudonym(cnpj):
+    result = pseudonymizer.cnpj(cnpj)
+    assert CNPJValidator.check(result, "alphanumeric") is None
+    assert not result[:8].isdigit()
+    assert result[8:12] == cnpj[8:12]
+
+
+def test_pseudonyms_are_deterministic_per_key():
+    cpf = "364.912.850-06"
+    assert Pseudonymizer("chave de teste").cpf(cpf) == pseudonymizer.cpf(cpf)
+    assert Pseudonymizer(b"outra chave").cpf(cpf) != pseudonymizer.cpf(cpf)
+
+
+def test_branches_of_the_same_company_share_a_root():
+    first = pseudonymizer.cnpj("11.222.333/0001-81")
+    second = pseudonymizer.cnpj("11.222.333/0002-62")
+    assert first[:10] == second[:10]
+    assert (first[11:15], second[11:15]) == ("0001", "0002")
+
+
+def test_mapping_is_injective():
+    cpfs = {fake.cpf() for _ in range(5000)}
+    assert len({pseudonymizer.cpf(cpf) for cpf in cpfs}) == len(cpfs)
+
+
+def test_feistel_permutation_is_a_bijection():
+    permutation = pseudonym._FeistelPermutation(b"k", b"t", 10, 3, 4)
+    assert sorted(map(permutation.encrypt, range(1000))) == list(range(1000))
+
+
+def test_forbidden_cpf_bases_are_walked_past(monkeypatch):
+    base = pseudonymizer._cpf.encrypt(364912850)
+    monkeypatch.setattr(pseudonym, "REPEATED_CPF_BASES", {base})
+    walked = pseudonymizer._cpf.encrypt(base)
+    assert pseudonymizer.cpf("364.912.850-06").replace(".", "")[:9] == f"{walked:09d}"
+
+
+def test_custom_format_is_preserved():
+    result = pseudonymizer.cpf(" 364 912 850 06 ")
+    masked = pseudonymizer.cpf("364.912.850-06")
+    assert result == " " + masked.replace(".", " ").replace("-", " ") + " "
+
+
+@pytest.mark.parametrize("value", ["364.912.850-07", "111.111.111-11", 12345678909])
+def test_invalid_cpf_raises(value):
+    with pytest.raises(ValueError):
+        pseudonymizer.cpf(value)
+
+
+def test_pseudonymize_detects_kind():
+    assert pseudonymizer.pseudonymize("364.912.850-06") == pseudonymizer.cpf(
+        "364.912.850-06"
+    )
+    assert pseudonymizer.pseudonymize("11222333000181") == pseudonymizer.cnpj(
+        "11222333000181"
+    )
+    assert pseudonymizer.pseudonymize("041 200 390 21") == pseudonymizer.cpf(
+        "041 200 390 21"
+    )
+    with pytest.raises(ValueError):
+        pseudonymizer.pseudonymize("123")
+
+
+def test_pseudonymize_many():
+    values = ["364.912.850-06", "11.222.333/0001-81", "364.912.850-06", "x"]
+    assert pseudonymizer.pseudonymize_many(values, on_invalid="null") == [
+        pseudonymizer.cpf(values[0]),
+        pseudonymizer.cnpj(values[1]),
+        pseudonymizer.cpf(values[0]),
+        None,
+    ]
+    assert pseudonymizer.pseudonymize_many(values, on_invalid="keep")[3] == "x"
+    with pytest.raises(ValueError):
+        pseudonymizer.pseudonymize_many(values)
+
+
+def test_pseudonymize_stream_is_lazy():
+    def values():
+        yield "364.912.850-06"
+        raise AssertionError("consumed too far")
+
+    stream = pseudonymizer.pseudonymize_stream(values(), kind="cpf")
+    assert next(stream) == pseudonymizer.cpf("364.912.850-06")
+
+
+@pytest.mark.parametrize(
+    "options", [{"kind": "rg"}, {"kind": "cpf", "on_invalid": "skip"}]
+)
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        pseudonymizer.pseudonymize_stream([], **options)
+
+
+@pytest.mark.parametrize("options", [{"key": ""}, {"key": "k", "rounds": 3}])
+def test_invalid_construction(options):
+    with pytest.raises(ValueError):
+        Pseudonymizer(**options)
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from pydantic_br_validator.registry import (
+    CNPJRegistryClient,
+    RateLimiter,
+    RegistrationStatus,
+    RegistryError,
+)
+from pydantic_br_validator.stubs import RegistryStubServer
+
+ACTIVE = "47895328000187"
+CLOSED = "11222333000181"
+UNKNOWN = "60701190000104"
+
+
+def run_with_registry(scenario, server_options=None, **client_options):
+    async def main():
+        statuses = {ACTIVE: "ATIVA", CLOSED: "BAIXADA"}
+        async with RegistryStubServer(statuses, **(server_options or {})) as stub:
+            async with CNPJRegistryClient(stub.base_url, **client_options) as client:
+                return await scenario(client, stub)
+
+    return asyncio.run(main())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lookup_statuses():
+    async def scenario(client, stub):
+        return await client.lookup_many(["47.895.328/0001-87", CLOSED, UNKNOWN])
+
+    active, closed, unknown = run_with_registry(scenario)
+    assert active == RegistrationStatus(ACTIVE, "ATIVA", {"status": "ATIVA"})
+    assert active.active and active.found
+    assert closed.found and not closed.active
+    assert not unknown.found and not unknown.active
+
+
+def test_concurrent_lookups_are_deduplicated_and_batched():
+    async def scenario(client, stub):
+        results = await client.lookup_many([ACTIVE, CLOSED, ACTIVE, UNKNOWN, ACTIVE])
+        return results, stub.batches
+
+    results, batches = run_with_registry(scenario)
+    assert [r.cnpj for r in results] == [ACTIVE, CLOSED, ACTIVE, UNKNOWN, ACTIVE]
+    assert batches == [[ACTIVE, CLOSED, UNKNOWN]]
+
+
+def test_batch_size_splits_requests():
+    async def scenario(client, stub):
+        await client.lookup_many([ACTIVE, CLOSED, UNKNOWN])
+        return stub.batches
+
+    assert run_with_registry(scenario, batch_size=2) == [[ACTIVE, CLOSED], [UNKNOWN]]
+
+
+def test_cache_expires_after_ttl():
+    clock = FakeClock()
+
+    async def scenario(client, stub):
+        await client.lookup(ACTIVE)
+        await client.lookup(ACTIVE)
+        requests_before_expiry = client.requests
+        clock.now = 61
+        await client.lookup(ACTIVE)
+        return requests_before_expiry, client.requests
+
+    assert run_with_registry(scenario, ttl=60, clock=clock) == (1, 2)
+
+
+def test_connections_are_reused():
+    async def scenario(client, stub):
+        for cnpj in (ACTIVE, CLOSED, UNKNOWN):
+            await client.lookup(cnpj)
+        return client.requests, client.pool.connections_opened
+
+    assert run_with_registry(scenario) == (3, 1)
+
+
+def test_invalid_cnpj_is_rejected_before_lookup():
+    async def scenario(client, stub):
+        with pytest.raises(ValueError):
+            await client.lookup("47.895.328/0001-88")
+        return stub.requests
+
+    assert run_with_registry(scenario) == []
+
+
+def test_http_error_raises_registry_error():
+    async def scenario(client, stub):
+        with pytest.raises(RegistryError):
+            await client.lookup(ACTIVE)
+        stub.fail_with = None
+        return await client.lookup(ACTIVE)
+
+    result = run_with_registry(scenario, server_options={"fail_with": 503})
+    assert result.active
+
+
+class MalformedRegistry(RegistryStubServer):
+    async def handle(self, request):
+        await super().handle(request)
+        return 200, {"results": ["not", "a", "dict"]}
+
+
+def test_malformed_response_raises_registry_error():
+    async def main():
+        async with MalformedRegistry() as stub:
+            async with CNPJRegistryClient(stub.base_url) as client:
+                lookups = asyncio.gather(
+                    client.lookup(ACTIVE), client.lookup(CLOSED), return_exceptions=True
+                )
+                return await asyncio.wait_for(lookups, 5), client._inflight
+
+    errors, inflight = asyncio.run(main())
+    assert all(isinstance(error, RegistryError) for error in errors)
+    assert "malformed results" in str(errors[0])
+    assert inflight == {}
+
+
+def test_rate_limiter_spaces_acquisitions():
+    async def scenario():
+        limiter = RateLimiter(rate=50)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(scenario()) >= 0.05
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -13,6 +13,8 @@ from pydantic_br_validator import (
     RGDigits,
     RGMask,
 )
+from pydantic_br_validator.batch import classify_rgs
+from pydantic_br_validator.validators.rg_validator import RG_RULES, UFS, RGValidator
 
 TOTAL_RG = 10
 fake = Faker("pt-BR")
@@ -157,3 +159,102 @@ def test_must_fail_when_use_digits_count_below_rgs(person, rg):
     with pytest.raises(ValidationError) as e:
         person(rg=rg[:5])
     assert FieldInvalidError.msg_template in str(e.value)
+
+
+def sp_check_digit(base: str) -> str:
+    """Dígito verificador do RG de SP: 11 - (soma com pesos 2 a 9) % 11."""
+    digit = 11 - sum(int(d) * w for d, w in zip(base, range(2, 10))) % 11
+    return {10: "X", 11: "0"}.get(digit, str(digit))
+
+
+def rg_sp():
+    return [fake.rg() for _ in range(TOTAL_RG)]
+
+
+@pytest.fixture
+def person_sp():
+    class Person(BaseModel):
+        rg: RG(uf="SP")
+        rg_mask: RGMask(uf="sp")
+        rg_digits: RGDigits(uf="SP")
+
+    yield Person
+
+
+@pytest.mark.parametrize("rg", rg_sp())
+def test_state_rule_must_accept_valid_rgs(person_sp, rg):
+    digits = rg if rg.isdigit() else "123456782"
+    p1 = person_sp(rg=rg, rg_mask=format_rg_mask(digits), rg_digits=digits)
+    assert (p1.rg, p1.rg_digits) == (rg, digits)
+
+
+@pytest.mark.parametrize("rg", rg_sp())
+def test_state_rule_must_reject_wrong_check_digit(person_sp, rg):
+    for digit in "0123456789X":
+        if digit != rg[-1]:
+            with pytest.raises(ValidationError) as e:
+                person_sp(
+                    rg=rg[:-1] + digit, rg_mask="12.345.678-2", rg_digits="123456782"
+                )
+            assert FieldInvalidError.msg_template in str(e.value)
+
+
+def test_state_rule_must_match_reference():
+    validator = RGValidator.for_state("SP")
+    for number in range(0, 100_000_000, 999_983):
+        base = f"{number:08d}"
+        expected = base + sp_check_digit(base)
+        assert validator.check(expected) is None
+        assert validator.check(expected.lower()) is None
+        wrong = "X" if expected[-1] != "X" else "0"
+        assert validator.check(base + wrong) == "invalid_data"
+        assert validator.check_structure(base + wrong) is None
+
+
+@pytest.mark.parametrize(
+    "value, mode, error",
+    [
+        ("12.345.678-2", "mask", None),
+        ("123456782", "mask", "invalid_mask"),
+        ("12.345.678-2", "digits", "not_digits"),
+        ("12345678", "any", "invalid_data"),
+        (12345678, "any", "not_str"),
+    ],
+)
+def test_state_rule_must_keep_structural_errors(value, mode, error):
+    assert RGValidator.for_state("SP").check(value, mode) == error
+
+
+def test_states_without_rule_must_check_only_the_structure():
+    assert RG_RULES["MG"] is None
+    validator = RGValidator.for_state("MG")
+    assert validator.check("12.345.678-9") is None
+    assert validator.check("12345678") is None
+    assert RGValidator.for_state("mg") is validator
+    assert set(RG_RULES) == set(UFS) and len(UFS) == 27
+
+
+def test_unknown_state_must_fail():
+    with pytest.raises(ValueError, match="unknown UF"):
+        RGValidator.for_state("XX")
+    with pytest.raises(ValueError, match="unknown UF"):
+        RG(uf="XX")
+
+
+def test_classify_rgs_must_dispatch_on_each_state():
+    values = ["123456782", "123456789", "123456789", "12.345.678-2", 5]
+    ufs = ["SP", "SP", "MG", "sp", None]
+    assert classify_rgs(values, ufs) == [
+        None,
+        "invalid_data",
+        None,
+        None,
+        "not_str",
+    ]
+    assert classify_rgs(values[:2], "SP") == [None, "invalid_data"]
+    assert classify_rgs(iter(values[:2]), iter(ufs[:2]), mode="mask") == [
+        "invalid_mask",
+        "invalid_mask",
+    ]
+    with pytest.raises(ValueError, match="same length"):
+        classify_rgs(values, ufs[:2])
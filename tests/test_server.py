@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+from pydantic_br_validator._http import encode_request, read_response
+from pydantic_br_validator.server import ValidationServer
+
+
+def run_with_server(scenario, **options):
+    async def main():
+        server = ValidationServer(port=0, **options)
+        host, port = await server.start()
+        try:
+            return await scenario(host, port, server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+async def request(host, port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(encode_request(method, path, host, payload))
+        status, body, _ = await read_response(reader)
+        return status, body
+    finally:
+        writer.close()
+
+
+def test_single_validation():
+    async def scenario(host, port, server):
+        return await request(host, port, "GET", "/validate/cpf?value=041.200.390-21")
+
+    assert run_with_server(scenario) == (
+        200,
+        {"value": "041.200.390-21", "valid": True, "error": None},
+    )
+
+
+def test_batch_validation():
+    async def scenario(host, port, server):
+        payload = {
+            "values": ["47.895.328/0001-87", "47895328000187", 1],
+            "mode": "mask",
+        }
+        return await request(host, port, "POST", "/validate/cnpj", payload)
+
+    status, body = run_with_server(scenario)
+    assert status == 200
+    assert body["results"] == [
+        {"valid": True, "error": None},
+        {"valid": False, "error": "invalid_mask"},
+        {"valid": False, "error": "not_str"},
+    ]
+
+
+def test_typeahead_must_carry_state_between_requests():
+    async def scenario(host, port, server):
+        responses = []
+        state = None
+        for chunk in ("364.912.8", "50-", "06"):
+            payload = {"input": chunk, "mode": "mask", "state": state}
+            status, body = await request(host, port, "POST", "/typeahead/cpf", payload)
+            assert status == 200
+            responses.append(body)
+            state = body["state"]
+        return responses
+
+    responses = run_with_server(scenario)
+    assert [(body["status"], body["expected"]) for body in responses] == [
+        ("incomplete", None),
+        ("incomplete", "06"),
+        ("complete_valid", "06"),
+    ]
+
+
+def test_keep_alive_connection():
+    async def scenario(host, port, server):
+        reader, writer = await asyncio.open_connection(host, port)
+        responses = []
+        for value in ("59151-650", "5915165"):
+            writer.write(encode_request("GET", f"/validate/cep?value={value}", host))
+            responses.append(await read_response(reader))
+        writer.close()
+        return responses, server.stats.connections
+
+    responses, connections = run_with_server(scenario)
+    assert [body["valid"] for _, body, _ in responses] == [True, False]
+    assert all(keep_alive for _, _, keep_alive in responses)
+    assert connections == 1
+
+
+def test_concurrent_single_requests_must_be_coalesced():
+    async def scenario(host, port, server):
+        results = await asyncio.gather(
+            *(
+                request(host, port, "GET", "/validate/cnh?value=49761142867")
+                for _ in range(20)
+            )
+        )
+        _, stats = await request(host, port, "GET", "/stats")
+        return results, stats
+
+    results, stats = run_with_server(scenario, max_delay=0.05)
+    assert all(body["valid"] for _, body in results)
+    assert stats["coalesced_documents"] == 20
+    assert stats["coalesced_batches"] < 20
+    assert stats["requests"] == 20
+    assert stats["latency_ms"]["p50"] is not None
+
+
+@pytest.mark.parametrize(
+    "method, path, payload, status",
+    [
+        ("GET", "/validate/pis?value=1", None, 404),
+        ("GET", "/other", None, 404),
+        ("GET", "/validate/cpf", None, 400),
+        ("GET", "/validate/cpf?value=1&mode=upper", None, 400),
+        ("GET", "/validate/cnh?value=1&mode=mask", None, 400),
+        ("POST", "/validate/cnh", {"values": ["1"], "mode": "mask"}, 400),
+        ("POST", "/validate/cpf", {"value": "1"}, 400),
+        ("DELETE", "/validate/cpf", None, 405),
+        ("POST", "/typeahead/cnh", {"input": "1"}, 404),
+        ("GET", "/typeahead/cpf", None, 405),
+        ("POST", "/typeahead/cpf", {"input": 1}, 400),
+        ("POST", "/typeahead/cpf", {"input": "1", "mode": "upper"}, 400),
+        ("POST", "/typeahead/cpf", {"input": "1", "state": "[]"}, 400),
+        (
+            "POST",
+            "/typeahead/cpf",
+            {"input": "1", "state": '["cep","any",0,0,0,0,-1,true,null]'},
+            400,
+        ),
+    ],
+)
+def test_invalid_requests(method, path, payload, status):
+    async def scenario(host, port, server):
+        return await request(host, port, method, path, payload)
+
+    assert run_with_server(scenario)[0] == status
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"POST /validate/cpf HTTP/1.1\r\nContent-Length: -1\r\n\r\n",
+        b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n",
+        b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * 70000 + b"\r\n\r\n",
+    ],
+    ids=["negative_length", "long_request_line", "long_header"],
+)
+def test_malformed_requests_must_be_answered_with_400(data):
+    async def scenario(host, port, server):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(data)
+            status, _, keep_alive = await read_response(reader)
+            return status, keep_alive
+        finally:
+            writer.close()
+
+    assert run_with_server(scenario) == (400, False)
+
+
+def test_unexpected_errors_must_be_answered_with_500():
+    async def scenario(host, port, server):
+        async def dispatch(request):
+            raise RuntimeError("boom")
+
+        server._dispatch = dispatch
+        return await request(host, port, "GET", "/health"), server.stats.errors
+
+    assert run_with_server(scenario) == ((500, {"error": "Internal Server Error"}), 1)
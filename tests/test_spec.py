@@ -0,0 +1,237 @@
+import random
+
+import pytest
+from faker import Faker
+from pydantic import BaseModel, ValidationError
+
+from pydantic_br_validator import (
+    PIS,
+    RENAVAM,
+    FieldDigitError,
+    FieldInvalidError,
+    FieldMaskError,
+    PISDigits,
+    PISMask,
+)
+from pydantic_br_validator.fields.base_field import BaseDigits
+from pydantic_br_validator.fields.spec_field import spec_fields
+from pydantic_br_validator.validators.base_validator import FieldMaskValidator
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+from pydantic_br_validator.validators.spec_validator import (
+    CheckDigit,
+    DocumentSpec,
+    PISValidator,
+    RENAVAMValidator,
+    compile_spec,
+    mod11_complement,
+    mod11_times_ten,
+    remainder_table,
+)
+
+fake = Faker("pt-BR")
+WEIGHTS = (3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def pis_check_digit(base):
+    remainder = sum(int(d) * w for d, w in zip(base, WEIGHTS)) % 11
+    return str(0 if remainder < 2 else 11 - remainder)
+
+
+def renavam_check_digit(base):
+    total = sum(int(d) * w for d, w in zip(base, WEIGHTS))
+    return str(total * 10 % 11 % 10)
+
+
+def make_pis(rng):
+    base = "".join(rng.choice("0123456789") for _ in range(10))
+    number = base + pis_check_digit(base)
+    return f"{number[:3]}.{number[3:8]}.{number[8:10]}-{number[10]}"
+
+
+def make_renavam(rng):
+    base = "".join(rng.choice("0123456789") for _ in range(10))
+    return base + renavam_check_digit(base)
+
+
+rng = random.Random(40)
+pis_mock = [make_pis(rng) for _ in range(10)]
+renavam_mock = [make_renavam(rng) for _ in range(10)]
+
+CPF_SPEC = DocumentSpec(
+    name="cpf",
+    length=11,
+    mask="000.000.000-00",
+    reject_repeated=True,
+    check_digits=(
+        CheckDigit(9, (10, 9, 8, 7, 6, 5, 4, 3, 2), remainder_table(mod11_times_ten)),
+        CheckDigit(
+            10, (11, 10, 9, 8, 7, 6, 5, 4, 3, 2), remainder_table(mod11_times_ten)
+        ),
+    ),
+)
+
+
+@pytest.fixture
+def person():
+    class Person(BaseModel):
+        pis: PIS
+        pis_mask: PISMask
+        pis_digits: PISDigits
+        renavam: RENAVAM
+
+    yield Person
+
+
+@pytest.mark.parametrize("pis, renavam", list(zip(pis_mock, renavam_mock)))
+def test_must_accept_valid_documents(person, pis, renavam):
+    digits = pis.replace(".", "").replace("-", "")
+    p1 = person(pis=pis, pis_mask=pis, pis_digits=digits, renavam=renavam)
+    assert (p1.pis, p1.pis_digits, p1.renavam) == (pis, digits, renavam)
+    assert (
+        person(pis=digits, pis_mask=pis, pis_digits=digits, renavam=renavam).pis
+        == digits
+    )
+
+
+@pytest.mark.parametrize(
+    "field, value, message",
+    [
+        ("pis", "120.56789.01-1", FieldInvalidError.msg_template),
+        ("pis", "11111111111", FieldInvalidError.msg_template),
+        ("pis_mask", "12056789010", FieldMaskError.msg_template),
+        ("pis_mask", "120.567.8901-0", FieldMaskError.msg_template),
+        ("pis_digits", "120.56789.01-0", FieldDigitError.msg_template),
+        ("renavam", "63929292929", FieldInvalidError.msg_template),
+        ("renavam", "6392929292", FieldInvalidError.msg_template),
+    ],
+)
+def test_must_fail_when_use_invalid_documents(person, field, value, message):
+    data = {
+        "pis": "120.56789.01-0",
+        "pis_mask": "120.56789.01-0",
+        "pis_digits": "12056789010",
+        "renavam": "63929292926",
+        field: value,
+    }
+    with pytest.raises(ValidationError) as e:
+        person(**data)
+    assert message in str(e.value)
+
+
+@pytest.mark.parametrize("number", pis_mock)
+def test_pis_must_match_reference_for_every_check_digit(number):
+    for digit in "0123456789":
+        value = number[:-1] + digit
+        expected = None if digit == number[-1] else "invalid_data"
+        assert PISValidator.check(value) == expected
+        assert PISValidator.check_structure(value) is None
+
+
+@pytest.mark.parametrize("number", renavam_mock)
+def test_renavam_must_match_reference_for_every_check_digit(number):
+    for digit in "0123456789":
+        value = number[:-1] + digit
+        expected = None if digit == number[-1] else "invalid_data"
+        assert RENAVAMValidator.check(value, "digits") == expected
+
+
+def test_maskless_spec_must_reject_mask_mode_like_cnh():
+    assert not issubclass(RENAVAMValidator, FieldMaskValidator)
+    for validator in (RENAVAMValidator, CNHValidator):
+        with pytest.raises(ValueError, match="has no mask mode"):
+            validator.check("63929292926", "mask")
+        with pytest.raises(ValueError, match="has no mask mode"):
+            validator.check_mode("mask")
+
+
+def test_fields_must_be_generated_from_compiled_specs():
+    fields = spec_fields(PISValidator, "PIS/PASEP/NIT", "PIS")
+    assert [(field.__name__, field.format) for field in fields] == [
+        ("PIS", "pis"),
+        ("PISMask", "pis mask"),
+        ("PISDigits", "pis digits"),
+    ]
+    for field, expected in zip(fields, (PIS, PISMask, PISDigits)):
+        assert field.__bases__ == expected.__bases__
+        assert field.__doc__ == expected.__doc__
+        assert field.Validator is expected.Validator is PISValidator
+    (renavam,) = spec_fields(RENAVAMValidator, "RENAVAM")
+    assert (renavam.__name__, renavam.format) == ("RENAVAM", RENAVAM.format)
+    assert renavam.__bases__ == RENAVAM.__bases__ == (BaseDigits,)
+    assert RENAVAM.Validator is RENAVAMValidator
+
+
+def test_compiled_cpf_spec_must_agree_with_cpf_validator():
+    check = compile_spec(CPF_SPEC).check
+    values = [fake.cpf() for _ in range(200)]
+    values += [value[:-1] + str((int(value[-1]) + 1) % 10) for value in values]
+    values += [value.replace(".", "").replace("-", "") for value in values]
+    values += ["000.000.000-00", "99999999999", "041.200.390", "041-200.390.21", "", 1]
+    for value in values:
+        for mode in ("any", "mask", "digits"):
+            assert check(value, mode) == CPFValidator.check(value, mode), (value, mode)
+
+
+def test_compiled_spec_must_expose_generated_source():
+    assert "values[9] * 2" in PISValidator.check.source
+    assert "REMAINDERS_0" not in PISValidator.check_structure.source
+
+
+def test_compiled_spec_must_support_letter_alphabets():
+    spec = DocumentSpec(
+        name="code",
+        length=4,
+        alphabet="0123456789ABCDEF",
+        check_digits=(CheckDigit(3, (3, 2, 1), tuple(range(16)), modulus=16),),
+    )
+    check = compile_spec(spec).check
+    assert check("AB15") is None  # 10 * 3 + 11 * 2 + 1 * 1 = 53, 53 % 16 = 5
+    assert check("ab15") is None
+    assert check("AB1E") == "invalid_data"
+    assert check("AG15") == "invalid_data"
+    with pytest.raises(ValueError, match="has no mask mode"):
+        check("AB15", "mask")
+
+
+@pytest.mark.parametrize(
+    "changes, message",
+    [
+        ({"mask": "000.000"}, "slots"),
+        ({"alphabet": "0123456789é"}, "ASCII"),
+        ({"check_digits": (CheckDigit(11, WEIGHTS, (0,) * 11),)}, "out of range"),
+        ({"check_digits": (CheckDigit(2, WEIGHTS, (0,) * 11),)}, "itself"),
+        ({"check_digits": (CheckDigit(10, WEIGHTS, (0,) * 10),)}, "residue"),
+    ],
+)
+def test_compile_spec_must_reject_inconsistent_specs(changes, message):
+    spec = DocumentSpec(
+        name="doc",
+        length=11,
+        check_digits=(CheckDigit(10, WEIGHTS, remainder_table(mod11_complement)),),
+    )
+    with pytest.raises(ValueError, match=message):
+        compile_spec(spec._replace(**changes))
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"length": "11"},
+        {"length": 0},
+        {"check_digits": (CheckDigit("10", WEIGHTS, (0,) * 11),)},
+        {"check_digits": (CheckDigit(10, "3298765432", (0,) * 11),)},
+        {"check_digits": (CheckDigit(10, (*WEIGHTS[:-1], "2 or 1"), (0,) * 11),)},
+        {"check_digits": (CheckDigit(10, WEIGHTS, (0,) * 11, modulus=11.0),)},
+        {"check_digits": (CheckDigit(10, WEIGHTS, (), modulus=0),)},
+        {"check_digits": (CheckDigit(10, WEIGHTS, (True,) * 11),)},
+    ],
+)
+def test_compile_spec_must_reject_non_int_numbers(changes):
+    spec = DocumentSpec(
+        name="doc",
+        length=11,
+        check_digits=(CheckDigit(10, WEIGHTS, remainder_table(mod11_complement)),),
+    )
+    with pytest.raises(TypeError, match="must be"):
+        compile_spec(spec._replace(**changes))
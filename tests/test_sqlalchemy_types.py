@@ -0,0 +1,172 @@
+import pytest
+from faker import Faker
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    select,
+)
+from sqlalchemy.exc import StatementError  # noqa: E402
+
+from pydantic_br_validator import FieldInvalidError  # noqa: E402
+from pydantic_br_validator.sqlalchemy_types import (  # noqa: E402
+    ALPHANUMERIC_CNPJ_OFFSET,
+    CNPJType,
+    CPFType,
+    decode_cnpj,
+    decode_cpf,
+    encode_cnpj,
+    encode_cpf,
+    insert_many,
+)
+from pydantic_br_validator.validators import cnpj_engine  # noqa: E402
+
+fake = Faker("pt-BR")
+
+ALPHANUMERIC_CNPJS = ["12ABC34501DE35", "12.abc.345/01de-35", "0000000000A041"]
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    metadata = MetaData()
+    table = Table(
+        "clientes",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("cpf", CPFType()),
+        Column("cpf_mask", CPFType(masked=True)),
+        Column("cnpj", CNPJType()),
+        Column("cnpj_mask", CNPJType(masked=True)),
+    )
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.table = table
+        yield connection
+
+
+@pytest.mark.parametrize("cpf", [fake.cpf() for _ in range(5)] + ["041.200.390-21"])
+def test_cpf_must_round_trip_through_an_integer(cpf):
+    digits = cpf.replace(".", "").replace("-", "")
+    number = encode_cpf(cpf)
+    assert number == int(digits)
+    assert decode_cpf(number) == digits
+    assert decode_cpf(number, masked=True) == cpf
+
+
+@pytest.mark.parametrize("cnpj", [fake.cnpj() for _ in range(5)])
+def test_numeric_cnpj_must_round_trip_through_an_integer(cnpj):
+    digits = cnpj.replace(".", "").replace("/", "").replace("-", "")
+    number = encode_cnpj(cnpj)
+    assert number == int(digits) < ALPHANUMERIC_CNPJ_OFFSET
+    assert decode_cnpj(number) == digits
+    assert decode_cnpj(number, masked=True) == cnpj
+
+
+@pytest.mark.parametrize("cnpj", ALPHANUMERIC_CNPJS)
+def test_alphanumeric_cnpj_must_round_trip_through_an_integer(cnpj):
+    normalized = cnpj.replace(".", "").replace("/", "").replace("-", "").upper()
+    number = encode_cnpj(cnpj)
+    assert ALPHANUMERIC_CNPJ_OFFSET <= number < 2**63
+    assert decode_cnpj(number) == normalized
+
+
+def test_largest_alphanumeric_cnpj_must_fit_in_a_bigint():
+    base = "ZZZZZZZZZZZZ"
+    number = encode_cnpj(base + cnpj_engine.check_digits(base))
+    assert number == ALPHANUMERIC_CNPJ_OFFSET + 36**12 - 1 < 2**63
+    assert decode_cnpj(number).startswith(base)
+
+
+@pytest.mark.parametrize(
+    "encode, value",
+    [
+        (encode_cpf, "111.111.111-11"),
+        (encode_cpf, "041.200.390-22"),
+        (encode_cnpj, "12ABC34501DE36"),
+        (encode_cnpj, "4789532800018٧"),
+    ],
+)
+def test_encode_must_raise_field_error_on_invalid_document(encode, value):
+    with pytest.raises(FieldInvalidError):
+        encode(value)
+
+
+def test_columns_must_store_integers_and_load_strings(connection):
+    table = connection.table
+    cpf, cnpj = "041.200.390-21", "12.abc.345/01de-35"
+    connection.execute(
+        table.insert().values(cpf=cpf, cpf_mask=cpf, cnpj=cnpj, cnpj_mask=cnpj)
+    )
+    row = connection.execute(select(table)).one()
+    assert row.cpf == "04120039021"
+    assert row.cpf_mask == cpf
+    assert row.cnpj == "12ABC34501DE35"
+    assert row.cnpj_mask == "12.ABC.345/01DE-35"
+    raw = connection.exec_driver_sql("SELECT cpf, cnpj FROM clientes").one()
+    assert raw == (4120039021, encode_cnpj(cnpj))
+
+
+def test_columns_must_keep_null(connection):
+    table = connection.table
+    connection.execute(table.insert().values(cpf=None))
+    assert connection.execute(select(table.c.cpf, table.c.cnpj)).one() == (None, None)
+
+
+def test_columns_must_compare_masked_and_unmasked_values(connection):
+    table = connection.table
+    connection.execute(table.insert().values(cpf="04120039021"))
+    query = select(table.c.id).where(table.c.cpf == "041.200.390-21")
+    assert connection.execute(query).scalar_one() == 1
+
+
+def test_columns_must_reject_invalid_documents(connection):
+    table = connection.table
+    with pytest.raises(StatementError) as e:
+        connection.execute(table.insert().values(cnpj="12ABC34501DE36"))
+    assert isinstance(e.value.orig, FieldInvalidError)
+
+
+def test_encode_many_must_validate_the_whole_batch():
+    cnpjs = [fake.cnpj() for _ in range(5)] + [None]
+    assert CNPJType().encode_many(cnpjs) == [
+        None if cnpj is None else encode_cnpj(cnpj) for cnpj in cnpjs
+    ]
+    with pytest.raises(FieldInvalidError):
+        CNPJType().encode_many(cnpjs + ["00.000.000/0000-01"])
+
+
+def test_insert_many_must_encode_each_column_once(connection):
+    table = connection.table
+    rows = [
+        {"id": index, "cpf": fake.cpf(), "cnpj": cnpj}
+        for index, cnpj in enumerate([fake.cnpj(), *ALPHANUMERIC_CNPJS], start=10)
+    ]
+    result = insert_many(connection, table, rows)
+    assert result.rowcount == len(rows)
+    loaded = connection.execute(
+        select(table.c.id, table.c.cpf_mask, table.c.cpf, table.c.cnpj).order_by(
+            table.c.id
+        )
+    ).all()
+    assert [row.id for row in loaded] == [row["id"] for row in rows]
+    assert [row.cpf for row in loaded] == [
+        row["cpf"].replace(".", "").replace("-", "") for row in rows
+    ]
+    assert [row.cnpj for row in loaded] == [
+        decode_cnpj(encode_cnpj(row["cnpj"])) for row in rows
+    ]
+    assert all(row.cpf_mask is None for row in loaded)
+
+
+def test_insert_many_must_reject_invalid_rows_before_executing(connection):
+    table = connection.table
+    rows = [{"cpf": "041.200.390-21"}, {"cpf": "041.200.390-22"}]
+    with pytest.raises(FieldInvalidError):
+        insert_many(connection, table, rows)
+    assert connection.execute(select(table)).all() == []
@@ -0,0 +1,69 @@
+import itertools
+import re
+
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.batch import validate_stream
+from pydantic_br_validator.cache import ValidationStore
+
+fake = Faker("pt-BR")
+
+CNPJS = [fake.cnpj() for _ in range(20)]
+
+
+def test_must_yield_records_in_order():
+    values = CNPJS + ["47895328000188", 47895328000187]
+    records = list(validate_stream(values, "cnpj", chunk_size=7))
+    assert [value for value, _, _ in records] == values
+    assert all(ok for _, ok, _ in records[:20])
+    assert records[20] == ("47895328000188", False, "invalid_data")
+    assert records[21] == (47895328000187, False, "not_str")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_must_respect_mode(chunk_size):
+    values = [re.sub("[^0-9]", "", value) for value in CNPJS]
+    records = validate_stream(values, "cnpj", "mask", chunk_size=chunk_size)
+    assert {error for _, _, error in records} == {"invalid_mask"}
+
+
+def test_must_be_lazy():
+    consumed = []
+
+    def source():
+        for value in itertools.cycle(CNPJS):
+            consumed.append(value)
+            yield value
+
+    stream = validate_stream(source(), "cnpj", chunk_size=10)
+    first = list(itertools.islice(stream, 15))
+    assert len(first) == 15
+    assert len(consumed) == 20
+
+
+def test_fail_fast_must_stop_after_first_invalid():
+    consumed = []
+
+    def source():
+        for value in CNPJS[:5] + ["invalido"] + CNPJS[5:]:
+            consumed.append(value)
+            yield value
+
+    records = list(validate_stream(source(), "cnpj", chunk_size=2, fail_fast=True))
+    assert records[-1] == ("invalido", False, "invalid_data")
+    assert len(records) == 6
+    assert len(consumed) == 6
+
+
+def test_must_use_store(tmp_path):
+    with ValidationStore(str(tmp_path / "results.sqlite")) as store:
+        list(validate_stream(CNPJS, "cnpj", store=store))
+        assert len(store) == len(set(CNPJS))
+
+
+def test_must_fail_on_invalid_arguments():
+    with pytest.raises(ValueError):
+        validate_stream(CNPJS, "pis")
+    with pytest.raises(ValueError):
+        validate_stream(CNPJS, "cnpj", chunk_size=0)
@@ -0,0 +1,61 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.batch import validate_batch, validate_batch_parallel
+from pydantic_br_validator.cache import ValidationStore
+from pydantic_br_validator.validators.cep_validator import CEPValidator
+from pydantic_br_validator.validators.cnh_validator import CNHValidator
+from pydantic_br_validator.validators.cnpj_validator import CNPJValidator
+from pydantic_br_validator.validators.cpf_validator import CPFValidator
+from pydantic_br_validator.validators.rg_validator import RGValidator
+
+fake = Faker("pt-BR")
+
+CPFS = [fake.cpf() for _ in range(200)] + ["04120039022", "111.111.111-11", None]
+CNH_MOCK = ["49761142867", "15706519597", "22255370700", "93017746007"]
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 10), (4, 1), (4, 7), (8, 1000)])
+def test_parallel_must_match_sequential(workers, chunk_size):
+    assert validate_batch_parallel(
+        CPFS, "cpf", workers=workers, chunk_size=chunk_size
+    ) == validate_batch(CPFS, "cpf")
+
+
+def test_parallel_must_share_store(tmp_path):
+    with ValidationStore(str(tmp_path / "results.sqlite")) as store:
+        errors = validate_batch_parallel(
+            CPFS, "cpf", workers=4, chunk_size=16, store=store
+        )
+        assert errors == validate_batch(CPFS, "cpf")
+        assert len(store) == len(set(CPFS) - {None})
+
+
+@pytest.mark.parametrize(
+    "validator, value",
+    [
+        (CNHValidator, CNH_MOCK[0]),
+        (CPFValidator, "041.200.390-21"),
+        (CNPJValidator, "47.895.328/0001-87"),
+        (RGValidator, "12.345.678-9"),
+        (CEPValidator, "59151-650"),
+    ],
+)
+def test_validators_must_not_keep_state(validator, value):
+    doc = validator(value)
+    before = dict(vars(doc))
+    doc.validate()
+    if hasattr(doc, "validate_mask"):
+        doc.validate_mask()
+    assert vars(doc) == before
+
+
+def test_shared_validator_instances_must_be_reentrant():
+    digits = [re.sub("[^0-9]", "", cnh) for cnh in CNH_MOCK]
+    instances = [CNHValidator(cnh) for cnh in digits]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda doc: doc.validate(), instances * 500))
+    assert all(results)
@@ -0,0 +1,128 @@
+import pytest
+from faker import Faker
+
+from pydantic_br_validator.batch import get_validator
+from pydantic_br_validator.typeahead import (
+    COMPLETE_INVALID,
+    COMPLETE_VALID,
+    INCOMPLETE,
+    INVALID_SO_FAR,
+    TYPEAHEAD,
+    TypeaheadState,
+    feed,
+    start,
+)
+
+from .differential import generate
+
+fake = Faker("pt-BR")
+
+MODES = ["any", "mask", "digits", "alphanumeric"]
+
+
+def prefixes(kind, value, mode):
+    state = start(kind, mode)
+    for end, char in enumerate(value, start=1):
+        state = feed(state, char)
+        yield value[:end], state
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("kind", ["cpf", "cnpj", "cep"])
+def test_typeahead_must_agree_with_check_on_every_prefix(kind, mode):
+    validator = get_validator(kind)
+    values = generate(kind, 1500, seed="typeahead")
+    for value in filter(lambda value: isinstance(value, str), values):
+        dead = False
+        for prefix, state in prefixes(kind, value, mode):
+            error = validator.check(prefix, mode)
+            if error is None:
+                assert state.status == COMPLETE_VALID, prefix
+            if state.complete:
+                assert state.error == error, prefix
+            # Um prefixo sem saída nunca volta a ser válido.
+            dead = dead or state.status == INVALID_SO_FAR
+            assert not (dead and error is None), prefix
+
+
+@pytest.mark.parametrize(
+    "kind, mode, typed, status, expected",
+    [
+        ("cpf", "mask", "", INCOMPLETE, None),
+        ("cpf", "mask", "364.912.85", INCOMPLETE, None),
+        ("cpf", "mask", "364.912.850-", INCOMPLETE, "06"),
+        ("cpf", "mask", "364.912.850-06", COMPLETE_VALID, "06"),
+        ("cpf", "mask", "364.912.850-07", COMPLETE_INVALID, "06"),
+        ("cpf", "mask", "364.912.850-1", INVALID_SO_FAR, "06"),
+        ("cpf", "mask", "364-", INVALID_SO_FAR, None),
+        ("cpf", "mask", "364.912.850-061", INVALID_SO_FAR, "06"),
+        ("cpf", "any", "36491285006", COMPLETE_VALID, "06"),
+        ("cpf", "any", "111.111.111-11", COMPLETE_INVALID, "11"),
+        ("cpf", "digits", "364.", INVALID_SO_FAR, None),
+        ("cnpj", "any", "12abc34501de", INCOMPLETE, "35"),
+        ("cnpj", "any", "12.ABC.345/01DE-35", COMPLETE_VALID, "35"),
+        ("cnpj", "alphanumeric", "12ABC34501DE3", INCOMPLETE, "35"),
+        ("cnpj", "any", "12ABC34501DEA", INVALID_SO_FAR, "35"),
+        ("cnpj", "digits", "12A", INVALID_SO_FAR, None),
+        ("cnpj", "mask", "47.895.328/0001-87", COMPLETE_VALID, "87"),
+        ("cep", "mask", "59151-65", INCOMPLETE, None),
+        ("cep", "mask", "59151-650", COMPLETE_VALID, None),
+        ("cep", "any", "591516501", INVALID_SO_FAR, None),
+    ],
+)
+def test_typeahead_status_and_expected_digits(kind, mode, typed, status, expected):
+    state = feed(start(kind, mode), typed)
+    assert (state.status, state.expected) == (status, expected)
+
+
+@pytest.mark.parametrize("cpf", [fake.cpf() for _ in range(5)])
+def test_typeahead_must_report_expected_digits_of_faker_documents(cpf):
+    state = feed(start("cpf", "mask"), cpf[:12])
+    assert state.expected == cpf[12:]
+
+
+def test_feeding_in_chunks_must_match_feeding_by_character():
+    cnpj = fake.cnpj()
+    by_character = start("cnpj", "mask")
+    for char in cnpj:
+        by_character = feed(by_character, char)
+    assert feed(feed(start("cnpj", "mask"), cnpj[:7]), cnpj[7:]) == by_character
+
+
+def test_state_must_round_trip_through_json():
+    state = feed(start("cnpj"), "12ABC34501")
+    restored = TypeaheadState.loads(state.dumps())
+    assert restored == state
+    assert feed(restored, "DE35").status == COMPLETE_VALID
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "",
+        "{}",
+        '["cpf"]',
+        '["pis","any",0,0,0,0,-1,true,null]',
+        '[["cpf"],"any",0,0,0,0,-1,true,null]',
+        '["cpf","upper",0,0,0,0,-1,true,null]',
+        '["cpf","any",0,0,0,0,-1,true,"boom"]',
+        '["cpf","any","0",0,0,0,-1,true,null]',
+        '["cpf","any",0,0,0,0,-5,true,null]',
+        '["cpf","any",0,0,0,0,-1,1,null]',
+    ],
+)
+def test_loads_must_reject_malformed_states(data):
+    with pytest.raises(ValueError, match="invalid typeahead state"):
+        TypeaheadState.loads(data)
+
+
+def test_start_must_reject_unknown_kind_and_mode():
+    with pytest.raises(ValueError, match="unknown document kind"):
+        start("pis")
+    with pytest.raises(ValueError, match="unknown mode"):
+        start("cpf", "upper")
+
+
+@pytest.mark.parametrize("kind", TYPEAHEAD)
+def test_every_document_kind_must_implement_the_rules(kind):
+    assert not TYPEAHEAD[kind].__abstractmethods__